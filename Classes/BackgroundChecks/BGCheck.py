@@ -60,9 +60,9 @@ class BGCheck:
 
 ################################################################################
     @classmethod
-    def new(cls, mgr: BGCheckManager, user: User) -> BGCheck:
+    async def new(cls, mgr: BGCheckManager, user: User) -> BGCheck:
 
-        new_data = mgr.bot.db.insert.bg_check(user.id)
+        new_data = await mgr.bot.db.insert.bg_check(user.id)
         return cls(mgr, **new_data)
 
 ################################################################################
@@ -279,7 +279,7 @@ class BGCheck:
             await interaction.respond(embed=error, ephemeral=True)
             return
 
-        venue = BGCheckVenue.new(self, name, data_center, world, jobs)
+        venue = await BGCheckVenue.new(self, name, data_center, world, jobs)
         self._venues.append(venue)
 
 ################################################################################
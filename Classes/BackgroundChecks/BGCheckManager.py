@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from discord import Interaction, User
 
+from Classes.Common import IndexedCollection
 from .BGCheck import BGCheck
 
 if TYPE_CHECKING:
@@ -24,17 +25,23 @@ class BGCheckManager:
     def __init__(self, state: StaffPartyBot) -> None:
 
         self._state: StaffPartyBot = state
-        self._bg_checks: List[BGCheck] = []
+        self._bg_checks: IndexedCollection[BGCheck] = IndexedCollection(
+            indexes={"user_id": lambda bg: bg.user_id}
+        )
 
 ################################################################################
     async def load_all(self, payload: Dict[str, Any]) -> None:
 
-        self._bg_checks = [BGCheck(self, **data) for data in payload["bg_checks"]]
+        bg_checks = []
+        async for chunk in payload["bg_checks"]:
+            bg_checks.extend(BGCheck(self, **data) for data in chunk)
+
+        self._bg_checks.replace(bg_checks)
 
 ################################################################################
     def __getitem__(self, user_id: int) -> Optional[BGCheck]:
 
-        return next((bg for bg in self._bg_checks if bg.user_id == int(user_id)), None)
+        return self._bg_checks.lookup("user_id", int(user_id))
 
 ################################################################################
     @property
@@ -47,7 +54,7 @@ class BGCheckManager:
 
         bg_check = self[interaction.user.id]
         if bg_check is None:
-            bg_check = BGCheck.new(self, interaction.user)
+            bg_check = await BGCheck.new(self, interaction.user)
             self._bg_checks.append(bg_check)
 
         await bg_check.menu(interaction)
@@ -57,7 +64,7 @@ class BGCheckManager:
 
         bg_check = self[user.id]
         if bg_check is None:
-            bg_check = BGCheck.new(self, user)
+            bg_check = await BGCheck.new(self, user)
             self._bg_checks.append(bg_check)
 
         await bg_check.staff_experience(interaction)
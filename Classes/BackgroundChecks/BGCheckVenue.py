@@ -29,7 +29,7 @@ class BGCheckVenue:
 
 ################################################################################
     @classmethod
-    def new(
+    async def new(
         cls: Type[V],
         parent: BGCheck,
         name: str,
@@ -38,7 +38,7 @@ class BGCheckVenue:
         jobs: List[str]
     ) -> V:
 
-        new_data = parent.bot.db.insert.bg_check_venue(
+        new_data = await parent.bot.db.insert.bg_check_venue(
             parent.id, name, data_center.value, world.value, jobs
         )
         return cls(**new_data)
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from discord import Attachment, File, Message
+
+from logger import log
+################################################################################
+
+__all__ = ("AttachmentCache", )
+
+################################################################################
+class AttachmentCache:
+    """
+    Keeps the bytes of static reference attachments (eg. the etiquette
+    images) in memory and on disk, keyed by attachment id, so they can be
+    re-sent as `discord.File`s without downloading them again. Both tiers are
+    LRU-bounded by total size. A new upload gets a new attachment id, so an
+    edited source message is picked up the next time it's resolved; call
+    `on_message_edit()` to drop its old entries once that happens.
+    """
+
+    __slots__ = (
+        "_directory",
+        "_max_memory",
+        "_max_disk",
+        "_memory",
+        "_memory_bytes",
+        "_disk",
+        "_disk_bytes",
+        "_messages",
+        "_downloads",
+        "_memory_hits",
+        "_disk_hits",
+    )
+
+    DIRECTORY = Path(os.getenv("ATTACHMENT_CACHE_DIR", ".cache/attachments"))
+    MAX_MEMORY_BYTES = 32 * 1024 * 1024
+    MAX_DISK_BYTES = 128 * 1024 * 1024
+
+################################################################################
+    def __init__(
+        self,
+        directory: Path = DIRECTORY,
+        max_memory: int = MAX_MEMORY_BYTES,
+        max_disk: int = MAX_DISK_BYTES
+    ) -> None:
+
+        self._directory: Path = directory
+        self._max_memory: int = max_memory
+        self._max_disk: int = max_disk
+
+        self._memory: OrderedDict[int, bytes] = OrderedDict()
+        self._memory_bytes: int = 0
+        self._disk: OrderedDict[int, Path] = OrderedDict()
+        self._disk_bytes: int = 0
+        # Source message id -> the attachment ids cached from it
+        self._messages: Dict[int, Set[int]] = {}
+
+        self._downloads: int = 0
+        self._memory_hits: int = 0
+        self._disk_hits: int = 0
+
+        self._scan_directory()
+
+################################################################################
+    @property
+    def metrics(self) -> Dict[str, Any]:
+
+        return {
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "disk_entries": len(self._disk),
+            "disk_bytes": self._disk_bytes,
+            "memory_hits": self._memory_hits,
+            "disk_hits": self._disk_hits,
+            "downloads": self._downloads,
+        }
+
+################################################################################
+    async def files(self, message: Message) -> List[File]:
+
+        return [await self.file(a, message.id) for a in message.attachments]
+
+################################################################################
+    async def file(self, attachment: Attachment, message_id: Optional[int] = None) -> File:
+
+        if message_id is not None:
+            self._messages.setdefault(message_id, set()).add(attachment.id)
+
+        data = await self.read(attachment)
+        return File(
+            io.BytesIO(data),
+            filename=attachment.filename,
+            description=attachment.description
+        )
+
+################################################################################
+    async def read(self, attachment: Attachment) -> bytes:
+
+        data = self._memory.get(attachment.id)
+        if data is not None:
+            self._memory.move_to_end(attachment.id)
+            self._memory_hits += 1
+            return data
+
+        data = await self._read_disk(attachment)
+        if data is not None:
+            self._disk_hits += 1
+        else:
+            data = await attachment.read()
+            self._downloads += 1
+            await self._write_disk(attachment, data)
+
+        self._remember(attachment.id, data)
+        return data
+
+################################################################################
+    def on_message_edit(self, message_id: int) -> bool:
+        """
+        Drops everything cached from the given message. Returns whether the
+        message was one the cache was tracking.
+        """
+
+        attachment_ids = self._messages.pop(message_id, None)
+        if attachment_ids is None:
+            return False
+
+        for attachment_id in attachment_ids:
+            self.invalidate(attachment_id)
+
+        return True
+
+################################################################################
+    def invalidate(self, attachment_id: int) -> None:
+
+        data = self._memory.pop(attachment_id, None)
+        if data is not None:
+            self._memory_bytes -= len(data)
+
+        path = self._disk.pop(attachment_id, None)
+        if path is not None:
+            self._disk_bytes -= self._unlink(path)
+
+################################################################################
+    def _remember(self, attachment_id: int, data: bytes) -> None:
+
+        # Anything bigger than the whole budget is served but not kept.
+        if len(data) > self._max_memory:
+            return
+
+        self._memory[attachment_id] = data
+        self._memory_bytes += len(data)
+
+        while self._memory_bytes > self._max_memory:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+################################################################################
+    def _path(self, attachment: Attachment) -> Path:
+
+        return self._directory / f"{attachment.id}-{Path(attachment.filename).name}"
+
+################################################################################
+    async def _read_disk(self, attachment: Attachment) -> Optional[bytes]:
+
+        path = self._disk.get(attachment.id)
+        if path is None:
+            return None
+
+        try:
+            data = await asyncio.to_thread(path.read_bytes)
+        except OSError:
+            data = None
+
+        # A truncated or unreadable file is dropped and re-downloaded.
+        if data is None or len(data) != attachment.size:
+            self.invalidate(attachment.id)
+            return None
+
+        self._disk.move_to_end(attachment.id)
+        return data
+
+################################################################################
+    async def _write_disk(self, attachment: Attachment, data: bytes) -> None:
+
+        if len(data) > self._max_disk:
+            return
+
+        path = self._path(attachment)
+        try:
+            await asyncio.to_thread(self._write_file, path, data)
+        except OSError as ex:
+            log.warning(f"Failed to cache attachment {attachment.id} on disk: {ex}", None)
+            return
+
+        self._disk[attachment.id] = path
+        self._disk_bytes += len(data)
+
+        while self._disk_bytes > self._max_disk:
+            _, evicted = self._disk.popitem(last=False)
+            self._disk_bytes -= self._unlink(evicted)
+
+################################################################################
+    @staticmethod
+    def _write_file(path: Path, data: bytes) -> None:
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Written aside and renamed so a crash never leaves a partial file.
+        temp = path.with_suffix(path.suffix + ".tmp")
+        temp.write_bytes(data)
+        temp.replace(path)
+
+################################################################################
+    @staticmethod
+    def _unlink(path: Path) -> int:
+
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except OSError:
+            return 0
+
+        return size
+
+################################################################################
+    def _scan_directory(self) -> None:
+
+        if not self._directory.is_dir():
+            return
+
+        entries = []
+        for path in self._directory.iterdir():
+            attachment_id, sep, _ = path.name.partition("-")
+            if not sep or not attachment_id.isdigit() or path.suffix == ".tmp":
+                continue
+            stat = path.stat()
+            entries.append((stat.st_mtime, int(attachment_id), path, stat.st_size))
+
+        # Oldest first, so they're the first evicted.
+        for _, attachment_id, path, size in sorted(entries):
+            self._disk[attachment_id] = path
+            self._disk_bytes += size
+
+################################################################################
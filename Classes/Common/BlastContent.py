@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import Awaitable, Callable, NamedTuple, Optional
+
+from discord import Embed, Message
+from discord.ui import View
+################################################################################
+
+__all__ = ("BlastContent", "ContentBuilder")
+
+################################################################################
+class BlastContent(NamedTuple):
+    """What a blast sends, rebuilt from its owner whenever a blast (re)starts."""
+
+    embed: Embed
+    # Called per recipient; views can't be shared between messages.
+    view: Optional[Callable[[], View]] = None
+    # Checked before each send; once False the rest of the blast is skipped.
+    active: Optional[Callable[[], bool]] = None
+    on_sent: Optional[Callable[[int, Message], None]] = None
+
+# Builds the content for a blast from its reference id, or None if the
+# object it was about is gone.
+ContentBuilder = Callable[[int], Awaitable[Optional[BlastContent]]]
+
+################################################################################
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set
+
+from Enums import DataCenter, XIVRegion
+from .WeekBitmap import WeekBitmap
+################################################################################
+
+__all__ = ("EligibilityIndex", "EligibilityRecord")
+
+################################################################################
+class EligibilityRecord:
+    """The parts of a profile the job eligibility checks look at."""
+
+    __slots__ = (
+        "user_id",
+        "posted",
+        "nsfw",
+        "regions",
+        "tags",
+        "positions",
+        "genres",
+        "muted_venue_ids",
+        "windows",
+    )
+
+################################################################################
+    def __init__(
+        self,
+        user_id: int,
+        *,
+        posted: bool,
+        nsfw: bool,
+        regions: Iterable[XIVRegion] = (),
+        tags: Iterable[str] = (),
+        positions: Iterable[Hashable] = (),
+        genres: Iterable[Hashable] = (),
+        muted_venue_ids: Iterable[int] = (),
+        availability: Iterable[Any] = ()
+    ) -> None:
+
+        self.user_id: int = user_id
+        self.posted: bool = posted
+        self.nsfw: bool = nsfw
+        self.regions: Set[XIVRegion] = set(regions)
+        self.tags: Set[str] = set(tags)
+        self.positions: Set[Hashable] = set(positions)
+        self.genres: Set[Hashable] = set(genres)
+        self.muted_venue_ids: Set[int] = set(muted_venue_ids)
+
+        # One week bitmap per availability window.
+        self.windows: List[WeekBitmap] = [a.bitmap for a in availability]
+
+################################################################################
+class EligibilityIndex:
+    """
+    Inverted index over profiles for the job-alert eligibility checks.
+
+    Each attribute a check filters on is bucketed into sets of user ids, so
+    picking candidates is a handful of set intersections instead of awaiting
+    every profile. Owners call `mark_dirty()` whenever a profile changes and
+    `remove()` when it goes away; dirty profiles are re-indexed on the next
+    query.
+    """
+
+    __slots__ = (
+        "_describe",
+        "_any_region_if_empty",
+        "_records",
+        "_dirty",
+        "_posted",
+        "_nsfw",
+        "_no_regions",
+        "_by_region",
+        "_by_tag",
+        "_by_position",
+        "_by_genre",
+        "_by_muted_venue",
+        "_windows",
+    )
+
+################################################################################
+    def __init__(self, describe: Any, any_region_if_empty: bool) -> None:
+        """
+        `describe` turns a profile into an `EligibilityRecord`. With
+        `any_region_if_empty`, a profile without regions matches any data center.
+        """
+
+        self._describe = describe
+        self._any_region_if_empty: bool = any_region_if_empty
+
+        self._records: Dict[int, EligibilityRecord] = {}
+        self._dirty: Dict[int, Any] = {}
+
+        self._posted: Set[int] = set()
+        self._nsfw: Set[int] = set()
+        self._no_regions: Set[int] = set()
+        self._by_region: Dict[XIVRegion, Set[int]] = {}
+        self._by_tag: Dict[str, Set[int]] = {}
+        self._by_position: Dict[Hashable, Set[int]] = {}
+        self._by_genre: Dict[Hashable, Set[int]] = {}
+        self._by_muted_venue: Dict[int, Set[int]] = {}
+        self._windows: Dict[int, List[WeekBitmap]] = {}
+
+################################################################################
+    def __len__(self) -> int:
+
+        self._flush()
+        return len(self._records)
+
+################################################################################
+    def rebuild(self, profiles: Iterable[Any]) -> None:
+
+        for user_id in list(self._records):
+            self._unindex(user_id)
+        self._dirty.clear()
+
+        for profile in profiles:
+            self._index(self._describe(profile))
+
+################################################################################
+    def mark_dirty(self, profile: Any) -> None:
+
+        self._dirty[profile.user_id] = profile
+
+################################################################################
+    def remove(self, user_id: int) -> None:
+
+        self._dirty.pop(user_id, None)
+        self._unindex(user_id)
+
+################################################################################
+    def _flush(self) -> None:
+
+        if not self._dirty:
+            return
+
+        dirty, self._dirty = self._dirty, {}
+        for user_id, profile in dirty.items():
+            self._unindex(user_id)
+            self._index(self._describe(profile))
+
+################################################################################
+    @staticmethod
+    def _add(buckets: Dict[Hashable, Set[int]], keys: Iterable[Hashable], user_id: int) -> None:
+
+        for key in keys:
+            buckets.setdefault(key, set()).add(user_id)
+
+################################################################################
+    @staticmethod
+    def _discard(buckets: Dict[Hashable, Set[int]], keys: Iterable[Hashable], user_id: int) -> None:
+
+        for key in keys:
+            bucket = buckets.get(key)
+            if bucket is not None:
+                bucket.discard(user_id)
+                if not bucket:
+                    del buckets[key]
+
+################################################################################
+    def _index(self, record: EligibilityRecord) -> None:
+
+        uid = record.user_id
+        self._records[uid] = record
+
+        if record.posted:
+            self._posted.add(uid)
+        if record.nsfw:
+            self._nsfw.add(uid)
+        if not record.regions:
+            self._no_regions.add(uid)
+
+        self._add(self._by_region, record.regions, uid)
+        self._add(self._by_tag, record.tags, uid)
+        self._add(self._by_position, record.positions, uid)
+        self._add(self._by_genre, record.genres, uid)
+        self._add(self._by_muted_venue, record.muted_venue_ids, uid)
+
+        if record.windows:
+            self._windows[uid] = record.windows
+
+################################################################################
+    def _unindex(self, user_id: int) -> None:
+
+        record = self._records.pop(user_id, None)
+        if record is None:
+            return
+
+        self._posted.discard(user_id)
+        self._nsfw.discard(user_id)
+        self._no_regions.discard(user_id)
+
+        self._discard(self._by_region, record.regions, user_id)
+        self._discard(self._by_tag, record.tags, user_id)
+        self._discard(self._by_position, record.positions, user_id)
+        self._discard(self._by_genre, record.genres, user_id)
+        self._discard(self._by_muted_venue, record.muted_venue_ids, user_id)
+        self._windows.pop(user_id, None)
+
+################################################################################
+    @staticmethod
+    def _union(buckets: Dict[Hashable, Set[int]], keys: Iterable[Hashable]) -> Set[int]:
+
+        ret = set()
+        for key in keys:
+            ret |= buckets.get(key, set())
+
+        return ret
+
+################################################################################
+    def query(
+        self,
+        *,
+        data_center: Optional[DataCenter] = None,
+        check_data_center: bool = True,
+        nsfw_venue: bool = False,
+        venue_id: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
+        positions: Optional[Iterable[Hashable]] = None,
+        genres: Optional[Iterable[Hashable]] = None,
+        window: Optional[WeekBitmap] = None,
+        posted_only: bool = True,
+        exclude: Iterable[int] = ()
+    ) -> Set[int]:
+        """
+        Returns the ids of every indexed user passing all the given filters.
+        Tag, position and genre filters match on any overlap. The availability
+        filter needs one availability window that contains `window`.
+        """
+
+        self._flush()
+
+        ret = set(self._posted) if posted_only else set(self._records)
+
+        if check_data_center:
+            matching = [r for r in XIVRegion if data_center is not None and r.contains(data_center)]
+            allowed = self._union(self._by_region, matching)
+            if self._any_region_if_empty:
+                allowed |= self._no_regions
+            ret &= allowed
+
+        if nsfw_venue:
+            ret &= self._nsfw
+
+        if tags is not None:
+            ret &= self._union(self._by_tag, tags)
+
+        if positions is not None:
+            ret &= self._union(self._by_position, positions)
+
+        if genres is not None:
+            ret &= self._union(self._by_genre, genres)
+
+        if venue_id is not None:
+            ret -= self._by_muted_venue.get(venue_id, set())
+
+        ret.difference_update(exclude)
+
+        if window is not None and ret:
+            ret = {
+                uid for uid in ret
+                if any(w.contains(window) for w in self._windows.get(uid, ()))
+            }
+
+        return ret
+
+################################################################################
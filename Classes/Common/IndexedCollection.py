@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+from operator import attrgetter
+from typing import Any, Callable, Dict, Generic, Hashable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+################################################################################
+
+__all__ = ("IndexedCollection", )
+
+T = TypeVar("T")
+KeyFunc = Callable[[Any], Optional[Hashable]]
+MultiKeyFunc = Callable[[Any], Iterable[Hashable]]
+
+################################################################################
+class IndexedCollection(Generic[T]):
+    """
+    Insertion-ordered collection with a dict primary key, optional unique
+    secondary indexes and optional non-unique ones (`multi_indexes`, whose
+    key functions return every key an item belongs under). Iterates like the
+    list it replaces.
+
+    Secondary keys that can change after insertion (eg. a venue's name) must
+    be refreshed with `reindex()` when they do. Keys that evaluate to None are
+    not indexed.
+    """
+
+    __slots__ = (
+        "_items",
+        "_key",
+        "_index_funcs",
+        "_indexes",
+        "_index_keys",
+        "_multi_funcs",
+        "_multi_indexes",
+        "_multi_keys",
+    )
+
+################################################################################
+    def __init__(
+        self,
+        items: Optional[Iterable[T]] = None,
+        *,
+        key: KeyFunc = attrgetter("id"),
+        indexes: Optional[Dict[str, KeyFunc]] = None,
+        multi_indexes: Optional[Dict[str, MultiKeyFunc]] = None
+    ) -> None:
+
+        self._items: Dict[Hashable, T] = {}
+        self._key: KeyFunc = key
+
+        self._index_funcs: Dict[str, KeyFunc] = dict(indexes or {})
+        self._indexes: Dict[str, Dict[Hashable, T]] = {name: {} for name in self._index_funcs}
+        # Primary key -> the secondary key each object was last indexed under
+        self._index_keys: Dict[str, Dict[Hashable, Hashable]] = {name: {} for name in self._index_funcs}
+
+        self._multi_funcs: Dict[str, MultiKeyFunc] = dict(multi_indexes or {})
+        # Secondary key -> primary key -> object, kept in insertion order
+        self._multi_indexes: Dict[str, Dict[Hashable, Dict[Hashable, T]]] = {name: {} for name in self._multi_funcs}
+        self._multi_keys: Dict[str, Dict[Hashable, Tuple[Hashable, ...]]] = {name: {} for name in self._multi_funcs}
+
+        if items is not None:
+            self.extend(items)
+
+################################################################################
+    def __len__(self) -> int:
+
+        return len(self._items)
+
+################################################################################
+    def __iter__(self) -> Iterator[T]:
+
+        # Iterate over a snapshot so callers may remove items while looping,
+        # exactly as they could with the plain lists this replaces.
+        return iter(list(self._items.values()))
+
+################################################################################
+    def __contains__(self, item: T) -> bool:
+
+        return self._key(item) in self._items
+
+################################################################################
+    def __repr__(self) -> str:
+
+        return (
+            f"<IndexedCollection items={len(self._items)} "
+            f"indexes={list(self._indexes) + list(self._multi_indexes)}>"
+        )
+
+################################################################################
+    def get(self, key: Hashable) -> Optional[T]:
+
+        return self._items.get(key)
+
+################################################################################
+    def lookup(self, index: str, value: Hashable) -> Optional[T]:
+
+        return self._indexes[index].get(value)
+
+################################################################################
+    def lookup_all(self, index: str, value: Hashable) -> List[T]:
+
+        return list(self._multi_indexes[index].get(value, {}).values())
+
+################################################################################
+    def to_list(self) -> List[T]:
+
+        return list(self._items.values())
+
+################################################################################
+    def append(self, item: T) -> None:
+
+        pk = self._key(item)
+        if pk in self._items:
+            self._unindex(pk)
+
+        self._items[pk] = item
+        self._index(pk, item)
+
+################################################################################
+    def extend(self, items: Iterable[T]) -> None:
+
+        for item in items:
+            self.append(item)
+
+################################################################################
+    def replace(self, items: Iterable[T]) -> None:
+
+        self.clear()
+        self.extend(items)
+
+################################################################################
+    def remove(self, item: T) -> None:
+
+        pk = self._key(item)
+        if pk not in self._items:
+            raise ValueError(f"{item!r} is not in the collection.")
+
+        self._unindex(pk)
+        del self._items[pk]
+
+################################################################################
+    def discard(self, item: T) -> None:
+
+        if item in self:
+            self.remove(item)
+
+################################################################################
+    def clear(self) -> None:
+
+        self._items.clear()
+        for name in self._index_funcs:
+            self._indexes[name].clear()
+            self._index_keys[name].clear()
+        for name in self._multi_funcs:
+            self._multi_indexes[name].clear()
+            self._multi_keys[name].clear()
+
+################################################################################
+    def reindex(self, item: T) -> None:
+
+        pk = self._key(item)
+        if self._items.get(pk) is not item:
+            return
+
+        self._unindex(pk)
+        self._index(pk, item)
+
+################################################################################
+    def verify(self) -> List[str]:
+        """
+        Recomputes every secondary key and returns a description of each
+        entry that no longer matches its item, eg. because a key changed
+        without a `reindex()`. An empty list means the indexes are sound.
+        """
+
+        problems = []
+
+        for name, func in self._index_funcs.items():
+            index, keys = self._indexes[name], self._index_keys[name]
+            for pk, item in self._items.items():
+                value = func(item)
+                if keys.get(pk) != value:
+                    problems.append(f"{name}: {pk!r} is indexed under {keys.get(pk)!r}, expected {value!r}")
+                elif value is not None and value not in index:
+                    problems.append(f"{name}: no entry for {value!r} ({pk!r})")
+            for value, item in index.items():
+                if self._items.get(self._key(item)) is not item or func(item) != value:
+                    problems.append(f"{name}: stale entry {value!r} -> {self._key(item)!r}")
+
+        for name, func in self._multi_funcs.items():
+            expected: Dict[Hashable, set] = {}
+            for pk, item in self._items.items():
+                for value in func(item):
+                    if value is not None:
+                        expected.setdefault(value, set()).add(pk)
+
+            actual = {value: set(bucket) for value, bucket in self._multi_indexes[name].items()}
+            for value in expected.keys() | actual.keys():
+                missing = expected.get(value, set()) - actual.get(value, set())
+                stale = actual.get(value, set()) - expected.get(value, set())
+                if missing:
+                    problems.append(f"{name}: {value!r} is missing {sorted(missing, key=repr)}")
+                if stale:
+                    problems.append(f"{name}: {value!r} has stale {sorted(stale, key=repr)}")
+
+        return problems
+
+################################################################################
+    def _index(self, pk: Hashable, item: T) -> None:
+
+        for name, func in self._index_funcs.items():
+            value = func(item)
+            if value is None:
+                continue
+
+            # First one in wins, matching the old `next(...)` linear scans.
+            self._indexes[name].setdefault(value, item)
+            self._index_keys[name][pk] = value
+
+        for name, func in self._multi_funcs.items():
+            values = tuple(dict.fromkeys(v for v in func(item) if v is not None))
+            for value in values:
+                self._multi_indexes[name].setdefault(value, {})[pk] = item
+            self._multi_keys[name][pk] = values
+
+################################################################################
+    def _unindex(self, pk: Hashable) -> None:
+
+        item = self._items[pk]
+        for name in self._index_funcs:
+            value = self._index_keys[name].pop(pk, None)
+            if value is not None and self._indexes[name].get(value) is item:
+                del self._indexes[name][value]
+
+        for name in self._multi_funcs:
+            for value in self._multi_keys[name].pop(pk, ()):
+                bucket = self._multi_indexes[name].get(value)
+                if bucket is not None:
+                    bucket.pop(pk, None)
+                    if not bucket:
+                        del self._multi_indexes[name][value]
+
+################################################################################
@@ -11,6 +11,7 @@ if TYPE_CHECKING:
 ################################################################################
 
 __all__ = (
+    "LazyLoadableType",
     "LazyRole",
     "LazyUser",
     "LazyChannel",
@@ -69,8 +70,14 @@ class LazyLoadable(Generic[T]):
         bot = getattr(self._parent, "bot", None)
         assert bot is not None
 
-        if self._item is None and self._item_id is not None:
-            self._item = await self._fetch_item(bot)
+        if self._item_id is None:
+            return None
+
+        # Resolved objects (and misses) are shared between every instance
+        # pointing at the same thing, and expire so they don't go stale.
+        self._item = await bot.resolver_cache.resolve(
+            self._item_type, self._item_id, lambda: self._fetch_item(bot)
+        )
         return self._item
 
 ################################################################################
@@ -102,6 +109,10 @@ class LazyLoadable(Generic[T]):
             self._item_id = item.id
 
         self._item = item
+        if item is not None:
+            bot = getattr(self._parent, "bot", None)
+            if bot is not None:
+                bot.resolver_cache.store(self._item_type, self._item_id, item)
 
         if getattr(self._parent, "update", None) is not None:
             self._parent.update()
@@ -134,4 +145,8 @@ class LazyMessage(LazyLoadable):
     def url(self) -> Optional[str]:
         return self._item_id
 
+    @property
+    def message_id(self) -> Optional[int]:
+        return int(self._item_id.rstrip("/").split("/")[-1]) if self._item_id else None
+
 ################################################################################
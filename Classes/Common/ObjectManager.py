@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, List, Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Iterable, Optional
 
 from discord import Embed, Interaction, User
 
+from .IndexedCollection import IndexedCollection
+
 if TYPE_CHECKING:
     from Classes import GuildData, StaffPartyBot, ManagedObject
     from UI.Common import FroggeView
@@ -21,12 +23,19 @@ class ObjectManager(ABC):
     )
 
     MAX_ITEMS = 80
+    # Secondary indexes for `_managed`, keyed by index name.
+    INDEXES: Dict[str, Callable[[Any], Optional[Hashable]]] = {}
+    # Non-unique indexes for `_managed`; each function returns all of an item's keys.
+    MULTI_INDEXES: Dict[str, Callable[[Any], Iterable[Hashable]]] = {}
 
 ################################################################################
     def __init__(self, state: StaffPartyBot) -> None:
 
         self._state: StaffPartyBot = state
-        self._managed: List[ManagedObject] = []
+        self._managed: IndexedCollection[ManagedObject] = IndexedCollection(
+            indexes=self.INDEXES,
+            multi_indexes=self.MULTI_INDEXES
+        )
 
 ################################################################################
     @abstractmethod
@@ -42,7 +51,7 @@ class ObjectManager(ABC):
 ################################################################################
     def __getitem__(self, item_id: int) -> Optional[ManagedObject]:
 
-        return next((i for i in self._managed if i.id == int(item_id)), None)
+        return self._managed.get(int(item_id))
 
 ################################################################################
     @property
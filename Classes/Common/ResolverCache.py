@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+
+from .LazyLoadable import LazyLoadableType
+################################################################################
+
+__all__ = ("ResolverCache", )
+
+CacheKey = Tuple[LazyLoadableType, int]
+
+# Stored in place of an object that couldn't be resolved.
+_MISSING = object()
+
+################################################################################
+class ResolverCache:
+    """
+    Shared cache of the Discord objects `LazyLoadable`s resolve to. Entries
+    expire after a per-type TTL and the least recently used are evicted once
+    `max_size` is reached. Lookups that came back empty are cached too, for
+    a shorter time, so a deleted message or channel isn't re-fetched on every
+    access. Gateway events call `invalidate()` when an object changes.
+    """
+
+    __slots__ = (
+        "_entries",
+        "_max_size",
+        "_hits",
+        "_misses",
+        "_negative_hits",
+        "_evictions",
+    )
+
+    # Seconds an entry stays valid for, by type. Members change the most
+    # (roles, nicknames) and aren't always covered by an event.
+    TTLS: Dict[LazyLoadableType, float] = {
+        LazyLoadableType.Role: 3600,
+        LazyLoadableType.User: 300,
+        LazyLoadableType.Channel: 3600,
+        LazyLoadableType.Message: 900,
+    }
+    NEGATIVE_TTL = 120
+    MAX_SIZE = 5000
+
+################################################################################
+    def __init__(self, max_size: int = MAX_SIZE) -> None:
+
+        self._entries: OrderedDict[CacheKey, Tuple[float, Any]] = OrderedDict()
+        self._max_size: int = max_size
+
+        self._hits: int = 0
+        self._misses: int = 0
+        self._negative_hits: int = 0
+        self._evictions: int = 0
+
+################################################################################
+    @staticmethod
+    def key(_type: LazyLoadableType, item_id: Union[int, str]) -> CacheKey:
+
+        # Messages are referenced by jump URL; the message id at the end is
+        # what delete and edit events carry.
+        if _type == LazyLoadableType.Message:
+            return _type, int(str(item_id).rstrip("/").split("/")[-1])
+
+        return _type, int(item_id)
+
+################################################################################
+    def __len__(self) -> int:
+
+        return len(self._entries)
+
+################################################################################
+    @property
+    def metrics(self) -> Dict[str, Any]:
+
+        lookups = self._hits + self._negative_hits + self._misses
+        return {
+            "size": len(self._entries),
+            "hits": self._hits,
+            "negative_hits": self._negative_hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "hit_rate": round((self._hits + self._negative_hits) / lookups, 3) if lookups else 0.0,
+        }
+
+################################################################################
+    def lookup(self, _type: LazyLoadableType, item_id: Union[int, str]) -> Tuple[bool, Optional[Any]]:
+        """
+        Returns `(found, item)`. `found` with a `None` item means the object
+        is known not to exist.
+        """
+
+        key = self.key(_type, item_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return False, None
+
+        expires, item = entry
+        if expires <= time.monotonic():
+            del self._entries[key]
+            self._misses += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        if item is _MISSING:
+            self._negative_hits += 1
+            return True, None
+
+        self._hits += 1
+        return True, item
+
+################################################################################
+    async def resolve(
+        self,
+        _type: LazyLoadableType,
+        item_id: Union[int, str],
+        fetch: Callable[[], Awaitable[Optional[Any]]]
+    ) -> Optional[Any]:
+        """Returns the cached object, or awaits `fetch()` and caches whatever it returns."""
+
+        found, item = self.lookup(_type, item_id)
+        if not found:
+            item = await fetch()
+            self.store(_type, item_id, item)
+
+        return item
+
+################################################################################
+    def store(self, _type: LazyLoadableType, item_id: Union[int, str], item: Optional[Any]) -> None:
+
+        ttl = self.TTLS[_type] if item is not None else self.NEGATIVE_TTL
+        key = self.key(_type, item_id)
+
+        self._entries[key] = (time.monotonic() + ttl, item if item is not None else _MISSING)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+################################################################################
+    def invalidate(self, _type: LazyLoadableType, item_id: Union[int, str]) -> None:
+
+        self._entries.pop(self.key(_type, item_id), None)
+
+################################################################################
+    def clear(self) -> None:
+
+        self._entries.clear()
+
+################################################################################
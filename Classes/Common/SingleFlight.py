@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+################################################################################
+
+__all__ = ("SingleFlight", )
+
+T = TypeVar("T")
+
+################################################################################
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key: the first caller starts the
+    work and everyone who asks for that key before it finishes awaits the
+    same result (or exception). Nothing is kept once the call completes.
+    """
+
+    __slots__ = (
+        "_inflight",
+        "_shared",
+    )
+
+################################################################################
+    def __init__(self) -> None:
+
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._shared: int = 0
+
+################################################################################
+    @property
+    def inflight(self) -> int:
+
+        return len(self._inflight)
+
+################################################################################
+    @property
+    def shared(self) -> int:
+        """How many calls were answered by a request that was already running."""
+
+        return self._shared
+
+################################################################################
+    async def run(self, key: Hashable, func: Callable[..., Awaitable[T]], *args: Any) -> T:
+
+        future = self._inflight.get(key)
+        if future is not None:
+            self._shared += 1
+        else:
+            future = asyncio.ensure_future(func(*args))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # One waiter giving up mustn't cancel the request for everyone else.
+        return await asyncio.shield(future)
+
+################################################################################
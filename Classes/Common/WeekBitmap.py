@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from datetime import time
+from typing import Iterable, Optional, Union
+
+from Enums import Weekday
+################################################################################
+
+__all__ = ("WeekBitmap", )
+
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+
+################################################################################
+class WeekBitmap:
+    """
+    A set of minutes in the (UTC) week stored as one integer, bit n being
+    minute n counted from Monday 00:00. Windows that run past midnight carry
+    into the next day, and past Sunday midnight into Monday, so overlap and
+    containment checks are single bitwise operations.
+    """
+
+    __slots__ = (
+        "_bits",
+    )
+
+################################################################################
+    def __init__(self, bits: int = 0) -> None:
+
+        self._bits: int = bits
+
+################################################################################
+    @classmethod
+    def from_window(cls, day: Optional[Union[Weekday, int]], start: time, end: time) -> WeekBitmap:
+        """
+        `start`-`end` on `day`, with an end at or before the start running
+        into the next day. A missing day gives an empty bitmap.
+        """
+
+        if day is None or start is None or end is None:
+            return cls()
+
+        day = day.value if isinstance(day, Weekday) else day
+
+        s = start.hour * 60 + start.minute
+        e = end.hour * 60 + end.minute
+        if e <= s:
+            e += MINUTES_PER_DAY
+
+        offset = day * MINUTES_PER_DAY
+        return cls.from_minutes(offset + s, offset + e)
+
+################################################################################
+    @classmethod
+    def from_minutes(cls, start: int, end: int) -> WeekBitmap:
+        """Week minutes `start` (inclusive) to `end` (exclusive), wrapping at the end of the week."""
+
+        bits = ((1 << (end - start)) - 1) << start
+        # Anything past Sunday midnight belongs to the start of the week.
+        bits = (bits | (bits >> MINUTES_PER_WEEK)) & ((1 << MINUTES_PER_WEEK) - 1)
+
+        return cls(bits)
+
+################################################################################
+    @classmethod
+    def union(cls, bitmaps: Iterable[WeekBitmap]) -> WeekBitmap:
+
+        bits = 0
+        for b in bitmaps:
+            bits |= b._bits
+
+        return cls(bits)
+
+################################################################################
+    @property
+    def bits(self) -> int:
+
+        return self._bits
+
+################################################################################
+    @property
+    def minutes(self) -> int:
+
+        return self._bits.bit_count()
+
+################################################################################
+    def __bool__(self) -> bool:
+
+        return self._bits != 0
+
+################################################################################
+    def __eq__(self, other: object) -> bool:
+
+        return isinstance(other, WeekBitmap) and self._bits == other._bits
+
+################################################################################
+    def __hash__(self) -> int:
+
+        return hash(self._bits)
+
+################################################################################
+    def __or__(self, other: WeekBitmap) -> WeekBitmap:
+
+        return WeekBitmap(self._bits | other._bits)
+
+################################################################################
+    def __and__(self, other: WeekBitmap) -> WeekBitmap:
+
+        return WeekBitmap(self._bits & other._bits)
+
+################################################################################
+    def overlaps(self, other: WeekBitmap) -> bool:
+
+        return (self._bits & other._bits) != 0
+
+################################################################################
+    def contains(self, other: WeekBitmap) -> bool:
+
+        return (other._bits & ~self._bits) == 0
+
+################################################################################
+    def overlap_minutes(self, other: WeekBitmap) -> int:
+
+        return (self._bits & other._bits).bit_count()
+
+################################################################################
+    def overlaps_at_least(self, other: WeekBitmap, minutes: int) -> bool:
+
+        return self.overlap_minutes(other) >= minutes
+
+################################################################################
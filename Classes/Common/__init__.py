@@ -1,6 +1,12 @@
 from .Identifiable import Identifiable
-from .RevisitTimer import RevisitTimer
+from .IndexedCollection import IndexedCollection
+from .WeekBitmap import WeekBitmap
+from .EligibilityIndex import EligibilityIndex, EligibilityRecord
 from .LazyLoadable import *
+from .ResolverCache import ResolverCache
+from .AttachmentCache import AttachmentCache
+from .SingleFlight import SingleFlight
+from .BlastContent import BlastContent, ContentBuilder
 from .ObjectManager import ObjectManager
 from .FroggeObject import FroggeObject
 from .ManagedObject import ManagedObject
@@ -0,0 +1,151 @@
+"""
+Compares picking job-alert recipients with a linear scan over every profile
+(the old `notify_eligible_applicants` behaviour, minus the awaits) against a
+query on `EligibilityIndex`, over a set of synthetic staff profiles.
+
+    python -m Classes.Common._benchmark_eligibility [--profiles 10000] [--jobs 200]
+
+Both approaches must agree on every job; the run aborts if they don't.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from datetime import time as dt_time
+from types import SimpleNamespace
+from typing import Any, List, Set
+
+from Enums import DataCenter, Weekday, XIVRegion
+from .EligibilityIndex import EligibilityIndex, EligibilityRecord
+from .WeekBitmap import WeekBitmap
+################################################################################
+
+TAGS = [f"tag{i}" for i in range(20)]
+
+################################################################################
+def _random_time(rng: random.Random) -> dt_time:
+
+    return dt_time(rng.randrange(24), rng.choice((0, 15, 30, 45)))
+
+################################################################################
+def _profile(rng: random.Random, user_id: int) -> Any:
+
+    availability = []
+    for day in rng.sample(list(Weekday), rng.randint(0, 5)):
+        start, end = _random_time(rng), _random_time(rng)
+        availability.append(SimpleNamespace(
+            day=day,
+            start_time=start,
+            end_time=end,
+            bitmap=WeekBitmap.from_window(day, start, end)
+        ))
+    return SimpleNamespace(
+        user_id=user_id,
+        posted=rng.random() < 0.8,
+        nsfw=rng.random() < 0.5,
+        regions=rng.sample(list(XIVRegion), rng.randint(0, 2)),
+        tags=rng.sample(TAGS, rng.randint(1, 5)),
+        muted_venue_ids=rng.sample(range(100), rng.randint(0, 3)),
+        availability=availability,
+    )
+
+################################################################################
+def _record(p: Any) -> EligibilityRecord:
+
+    return EligibilityRecord(
+        p.user_id,
+        posted=p.posted,
+        nsfw=p.nsfw,
+        regions=p.regions,
+        tags=p.tags,
+        muted_venue_ids=p.muted_venue_ids,
+        availability=p.availability
+    )
+
+################################################################################
+def _job(rng: random.Random) -> Any:
+
+    return SimpleNamespace(
+        venue_id=rng.randrange(100),
+        data_center=rng.choice(list(DataCenter)),
+        nsfw=rng.random() < 0.3,
+        tags=rng.sample(TAGS, rng.randint(1, 4)),
+        window=WeekBitmap.from_window(rng.randrange(7), _random_time(rng), _random_time(rng)),
+    )
+
+################################################################################
+def _scan(profiles: List[Any], job: Any) -> Set[int]:
+
+    ret = set()
+    for p in profiles:
+        if job.venue_id in p.muted_venue_ids or not p.posted:
+            continue
+        if job.nsfw and not p.nsfw:
+            continue
+        if not any(t in job.tags for t in p.tags):
+            continue
+        if p.regions and not any(r.contains(job.data_center) for r in p.regions):
+            continue
+        if any(a.bitmap.contains(job.window) for a in p.availability):
+            ret.add(p.user_id)
+
+    return ret
+
+################################################################################
+def main() -> None:
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--profiles", type=int, default=10_000)
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    profiles = [_profile(rng, i) for i in range(args.profiles)]
+    jobs = [_job(rng) for _ in range(args.jobs)]
+
+    start = time.perf_counter()
+    index = EligibilityIndex(_record, any_region_if_empty=True)
+    index.rebuild(profiles)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = [_scan(profiles, job) for job in jobs]
+    scan = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = [
+        index.query(
+            data_center=job.data_center,
+            nsfw_venue=job.nsfw,
+            venue_id=job.venue_id,
+            tags=job.tags,
+            window=job.window
+        )
+        for job in jobs
+    ]
+    query = time.perf_counter() - start
+
+    if actual != expected:
+        raise SystemExit("Index results differ from the linear scan!")
+
+    # Re-index 1% of profiles as if they'd been edited, then query once.
+    start = time.perf_counter()
+    for p in rng.sample(profiles, max(1, args.profiles // 100)):
+        index.mark_dirty(p)
+    index.query(data_center=jobs[0].data_center)
+    reindex = time.perf_counter() - start
+
+    matches = sum(len(e) for e in expected) / len(jobs)
+    print(f"{args.profiles} profiles, {args.jobs} jobs, {matches:.1f} matches/job")
+    print(f"  index build:     {build * 1000:8.1f} ms")
+    print(f"  linear scan:     {scan / len(jobs) * 1000:8.3f} ms/job")
+    print(f"  index query:     {query / len(jobs) * 1000:8.3f} ms/job")
+    print(f"  1% re-index:     {reindex * 1000:8.1f} ms")
+
+################################################################################
+if __name__ == "__main__":
+    main()
+
+################################################################################
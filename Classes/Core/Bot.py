@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 import os
-from typing import TYPE_CHECKING, Optional, Union, List
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union, List
 
 import cloudinary
-import cloudinary.uploader
-from discord import Bot, Attachment, Guild, NotFound, Member, User, Message, Interaction
+from discord import Bot, Guild, NotFound, Member, User, Message, Interaction, Role, TextChannel
 from discord.abc import GuildChannel
 from dotenv import load_dotenv
 
 from Classes.BackgroundChecks.BGCheckManager import BGCheckManager
+from Classes.Common.AttachmentCache import AttachmentCache
+from Classes.Common.LazyLoadable import LazyLoadableType
+from Classes.Common.ResolverCache import ResolverCache
+from Classes.Common.SingleFlight import SingleFlight
 from Classes.DJProfiles.DJManager import DJManager
 from Classes.Jobs.JobPostingManager import JobPostingManager
 from Classes.Profiles.ProfileManager import ProfileManager
@@ -18,10 +22,19 @@ from Classes.Venues.VenueManager import VenueManager
 from Classes.Welcome.WelcomeManager import WelcomeManager
 from Classes.XIVVenues.XIVVenuesClient import XIVVenuesClient
 from Database.Database import Database
+from logger import log
 from .ChannelManager import ChannelManager
+from .DepartureQueue import DepartureQueue
+from .DMFanout import DMFanout
 from .GuildManager import GuildManager
+from .ImageIngestor import ImageIngestor
+from .MemberAssets import MemberAssets
+from .MemberBatcher import MemberBatcher
+from .PostFingerprints import PostFingerprints
 from .RoleManager import RoleManager
 from .SPBLogger import SPBLogger
+from .StartupScheduler import StartupScheduler
+from .TaskScheduler import TaskScheduler
 
 if TYPE_CHECKING:
     from Classes import GuildData
@@ -34,10 +47,14 @@ class StaffPartyBot(Bot):
 
     __slots__ = (
         "_img_dump",
+        "_images",
         "_guild_mgr",
         "_db",
         "_xiv_client",
         "_logger",
+        "_fanout",
+        "_scheduler",
+        "_fingerprints",
         "_channel_mgr",
         "_role_mgr",
         "_venue_mgr",
@@ -48,7 +65,14 @@ class StaffPartyBot(Bot):
         "_dj_mgr",
         "_services_mgr",
         "_member_cache",
+        "_resolver_cache",
+        "_attachments",
+        "_lookups",
+        "_member_batcher",
+        "_departures",
         "_loaded",
+        "_startup",
+        "_finalize_task",
     )
 
     load_dotenv()
@@ -78,12 +102,21 @@ class StaffPartyBot(Bot):
         super().__init__(*args, **kwargs)
 
         self._img_dump: TextChannel = None  # type: ignore
+        self._images: ImageIngestor = ImageIngestor(self)
         self._member_cache: List[Member] = []
+        self._resolver_cache: ResolverCache = ResolverCache()
+        self._attachments: AttachmentCache = AttachmentCache()
+        self._lookups: SingleFlight = SingleFlight()
+        self._member_batcher: MemberBatcher = MemberBatcher(self)
+        self._departures: DepartureQueue = DepartureQueue(self)
 
         self._guild_mgr: GuildManager = GuildManager(self)
         self._db: Database = Database(self)
         self._xiv_client: XIVVenuesClient = XIVVenuesClient(self)
         self._logger: SPBLogger = SPBLogger(self)
+        self._fanout: DMFanout = DMFanout(self)
+        self._scheduler: TaskScheduler = TaskScheduler(self)
+        self._fingerprints: PostFingerprints = PostFingerprints(self)
 
         self._channel_mgr: ChannelManager = ChannelManager(self)
         self._role_mgr: RoleManager = RoleManager(self)
@@ -97,6 +130,8 @@ class StaffPartyBot(Bot):
         self._services_mgr: ServicesManager = ServicesManager(self)
 
         self._loaded: bool = False
+        self._startup: StartupScheduler = StartupScheduler(self)
+        self._finalize_task: Optional[asyncio.Task] = None
 
 ################################################################################
     def __getitem__(self, guild_id: int) -> GuildData:
@@ -119,44 +154,94 @@ class StaffPartyBot(Bot):
             secure=True
         )
 
-        payload = self.db.load_all()
+        self._startup.begin("Database")
+        payload = await self.db.load_all()
         if not payload:
             raise Exception("No data found in the database.")
+        self._startup.end("Database")
 
         print("Initializing logger...")
         await self._logger.load_all()
 
+        self._startup.begin("In-Memory Load")
         print("Loading channel & role managers...")
         self._channel_mgr.load_all(payload["channel_manager"])
         self._role_mgr.load_all(payload["role_manager"])
+        self._role_mgr.index_service_roles(self.SPB_GUILD)
+
+        # Each manager streams its own rows, so they can all load at once.
+        print("Loading venues, background checks, profiles, jobs, DJ profiles, services, DM blasts, welcomes & scheduled tasks...")
+        await asyncio.gather(
+            self._venue_mgr.load_all(payload["venue_manager"]),
+            self._bg_check_mgr.load_all(payload["bg_check_manager"]),
+            self._profile_mgr.load_all(payload["profile_manager"]),
+            self._jobs_mgr.load_all(payload["jobs_manager"]),
+            self._dj_mgr.load_all(payload["dj_manager"]),
+            self._services_mgr.load_all(payload["service_manager"]),
+            self._fanout.load_all(payload["fanout"]),
+            self._welcome_mgr.load_all(payload["welcome_manager"]),
+            self._scheduler.load_all(payload["scheduler"]),
+            self._fingerprints.load_all(payload["post_fingerprints"]),
+        )
+        self._startup.end("In-Memory Load")
 
-        print("Loading venues...")
-        await self._venue_mgr.load_all(payload["venue_manager"])
-        print("Loading background checks...")
-        await self._bg_check_mgr.load_all(payload["bg_check_manager"])
-        print("Loading profiles...")
-        await self._profile_mgr.load_all(payload["profile_manager"])
-        print("Loading jobs...")
-        await self._jobs_mgr.load_all(payload["jobs_manager"])
-        print("Loading DJ Profiles...")
-        await self._dj_mgr.load_all(payload["dj_manager"])
-        print("Loading services...")
-        await self._services_mgr.load_all(payload["service_manager"])
-
-        print("Finalizing load...")
-        await self._finalize_load()
-
+        # Everything commands need is in memory now; the Discord-side post
+        # repairs only touch existing messages, so they can run in the background.
         self._loaded = True
-        print("Done!")
+        print("Done! Finalizing load in the background...")
+        self._finalize_task = self.loop.create_task(self._finalize_load())
+        self._finalize_task.add_done_callback(self._log_finalize_failure)
 
 ################################################################################
     async def _finalize_load(self) -> None:
 
-        for attr in self.__slots__:
-            if attr.endswith("_mgr"):
-                mgr = getattr(self, attr)
-                if getattr(mgr, "finalize_load", None):
-                    await mgr.finalize_load()
+        try:
+            self._startup.begin("Finalize Load")
+            for attr in self.__slots__:
+                if attr.endswith("_mgr"):
+                    mgr = getattr(self, attr)
+                    if getattr(mgr, "finalize_load", None):
+                        try:
+                            await mgr.finalize_load(self._startup)
+                        except Exception as ex:
+                            log.error(f"{type(mgr).__name__}.finalize_load failed: {ex!r}", None)
+
+            await self._startup.run()
+            self._startup.end("Finalize Load")
+
+            edits = self._fingerprints.metrics
+            log.info(f"Post refresh: {edits['sent']} edits sent, {edits['skipped']} unchanged and skipped.", None)
+        finally:
+            # Pick up any DM blasts and scheduled tasks (welcome checks
+            # included) that were interrupted by the last shutdown, even if
+            # the post repairs failed.
+            self._fanout.resume()
+            self._scheduler.start()
+
+################################################################################
+    @staticmethod
+    def _log_finalize_failure(task: asyncio.Task) -> None:
+
+        if not task.cancelled() and task.exception() is not None:
+            log.error(f"Finalizing the load failed: {task.exception()!r}", None)
+
+################################################################################
+    @property
+    def startup(self) -> StartupScheduler:
+
+        return self._startup
+
+################################################################################
+    async def close(self) -> None:
+
+        await self._xiv_client.close()
+        await self._departures.close()
+        await self._images.close()
+        await self._logger.close()
+        await self._fanout.close()
+        await self._scheduler.close()
+        await self.db.close()
+        await super().close()
 
 ################################################################################
     @property
@@ -164,6 +249,36 @@ class StaffPartyBot(Bot):
 
         return self._db
 
+################################################################################
+    @property
+    def fanout(self) -> DMFanout:
+
+        return self._fanout
+
+################################################################################
+    @property
+    def resolver_cache(self) -> ResolverCache:
+
+        return self._resolver_cache
+
+################################################################################
+    @property
+    def attachment_cache(self) -> AttachmentCache:
+
+        return self._attachments
+
+################################################################################
+    @property
+    def post_fingerprints(self) -> PostFingerprints:
+
+        return self._fingerprints
+
+################################################################################
+    @property
+    def scheduler(self) -> TaskScheduler:
+
+        return self._scheduler
+
 ################################################################################
     @property
     def SPB_GUILD(self) -> Guild:
@@ -247,19 +362,16 @@ class StaffPartyBot(Bot):
         return False
 
 ################################################################################
-    async def dump_image(self, image: Attachment) -> str:
-
-        file = await image.to_file()
-        post = await self._img_dump.send(file=file)
+    @property
+    def image_dump(self) -> TextChannel:
 
-        return post.attachments[0].url
+        return self._img_dump
 
 ################################################################################
-    @staticmethod
-    async def dump_image_cloudinary(image: Attachment) -> str:
+    @property
+    def image_ingestor(self) -> ImageIngestor:
 
-        ret = cloudinary.uploader.upload(await image.read())
-        return ret["secure_url"]
+        return self._images
 
 ################################################################################
     async def add_guild(self, guild: Guild) -> None:
@@ -270,9 +382,9 @@ class StaffPartyBot(Bot):
 
         await self._guild_mgr.init_guild(guild, True)
 
-        exists = self.db.fetch_guild(guild.id)
+        exists = await self.db.fetch_guild(guild.id)
         if not exists:
-            self.db.insert.guild(self.get_guild(guild.id))
+            await self.db.insert.guild(self.get_guild(guild.id))
 
 ################################################################################
     async def get_or_fetch_channel(self, channel_id: int) -> Optional[GuildChannel]:
@@ -281,28 +393,42 @@ class StaffPartyBot(Bot):
         if ret is not None:
             return ret
 
+        # Concurrent lookups of the same object share one API request.
+        return await self._lookups.run(("channel", channel_id), self._request_channel, channel_id)
+
+################################################################################
+    async def _request_channel(self, channel_id: int) -> Optional[GuildChannel]:
+
+        # Anything but a missing channel (eg. a rate limit or outage) is
+        # raised rather than reported, and so cached, as not found.
         try:
             return await self.fetch_channel(channel_id)
-        except:
+        except NotFound:
             return None
 
 ################################################################################
-    async def get_or_fetch_role(self, role_id: int) -> Optional[GuildChannel]:
+    async def get_or_fetch_role(self, role_id: int) -> Optional[Role]:
 
         for guild in self.guilds:
             role = guild.get_role(role_id)
             if role is not None:
-                return role  # type: ignore
+                return role
 
-        for guild in self.guilds:
-            try:
-                role = await guild._fetch_role(role_id)
-                if role is not None:
-                    return role  # type: ignore
-            except NotFound:
-                continue
+        return await self._lookups.run(("role", role_id), self._request_role, role_id)
+
+################################################################################
+    async def _request_role(self, role_id: int) -> Optional[Role]:
+
+        # The roles we track all live in the SPB guild, so that's the only
+        # one worth asking the API about.
+        guild = self.SPB_GUILD
+        if guild is None:
+            return None
 
-        return None
+        try:
+            return await guild._fetch_role(role_id)
+        except NotFound:
+            return None
 
 ################################################################################
     async def get_or_fetch_member_or_user(self, user_id: int) -> Optional[Union[Member, User]]:
@@ -311,6 +437,18 @@ class StaffPartyBot(Bot):
             if member := guild.get_member(user_id):
                 return member
 
+        return await self._lookups.run(("user", user_id), self._request_member_or_user, user_id)
+
+################################################################################
+    async def _request_member_or_user(self, user_id: int) -> Optional[Union[Member, User]]:
+
+        # Until the member list is fully chunked, a cache miss doesn't mean
+        # they aren't a member, so ask the gateway for them in batches first.
+        guild = self.SPB_GUILD
+        if guild is not None and not guild.chunked:
+            if member := await self._member_batcher.get(user_id):
+                return member
+
         try:
             return await self.fetch_user(user_id)
         except NotFound:
@@ -324,10 +462,15 @@ class StaffPartyBot(Bot):
         if message := self.get_message(int(url_parts[-1])):
             return message
 
+        return await self._lookups.run(("message", int(url_parts[-1])), self._request_message, url_parts)
+
+################################################################################
+    async def _request_message(self, url_parts: List[str]) -> Optional[Message]:
+
         if channel := await self.get_or_fetch_channel(int(url_parts[-2])):
             try:
                 return await channel.fetch_message(int(url_parts[-1]))  # type: ignore
-            except:
+            except NotFound:
                 return None
 
 ################################################################################
@@ -335,12 +478,24 @@ class StaffPartyBot(Bot):
 
         await interaction.response.defer()
 
-        etiquette_msg = await self.get_or_fetch_message(self.VENUE_ETIQUETTE)
-        de_escalation_msg = await self.get_or_fetch_message(self.DE_ESCALATION)
+        # The messages come from the resolver cache too, so a repeat call
+        # makes no API requests until one of them is edited.
+        etiquette_msg, de_escalation_msg = await asyncio.gather(
+            self._resolver_cache.resolve(
+                LazyLoadableType.Message, self.VENUE_ETIQUETTE,
+                lambda: self.get_or_fetch_message(self.VENUE_ETIQUETTE)
+            ),
+            self._resolver_cache.resolve(
+                LazyLoadableType.Message, self.DE_ESCALATION,
+                lambda: self.get_or_fetch_message(self.DE_ESCALATION)
+            ),
+        )
 
+        # Served from the attachment cache; only downloaded the first time
+        # or after the source message is edited.
         files = [
-            await etiquette_msg.attachments[0].to_file(),
-            await de_escalation_msg.attachments[0].to_file()
+            await self._attachments.file(etiquette_msg.attachments[0], etiquette_msg.id),
+            await self._attachments.file(de_escalation_msg.attachments[0], de_escalation_msg.id)
         ]
 
         await interaction.respond(files=files, delete_after=300)
@@ -348,32 +503,60 @@ class StaffPartyBot(Bot):
 ################################################################################
     async def on_member_leave(self, member: Member) -> None:
 
-        profile_deleted = await self.profile_manager.on_member_leave(member)
-        dj_profile_deleted = await self.dj_profile_manager.on_member_leave(member)
-        jobs_deleted, jobs_canceled = await self.jobs_manager.on_member_leave(member)
-        venue_deleted = await self.venue_manager.on_member_leave(member)
-
-        await self.log.on_member_leave(
-            member=member,
-            venue_deleted=venue_deleted,
-            profile_deleted=profile_deleted,
-            dj_profile_deleted=dj_profile_deleted,
-            jobs_deleted=jobs_deleted,
-            jobs_canceled=jobs_canceled
+        self._role_mgr.on_member_remove(member)
+        # Cleanup and logging happen once the departure's batch is processed.
+        self._departures.add(member)
+
+################################################################################
+    def member_assets(self, user_id: int) -> MemberAssets:
+
+        return MemberAssets(self, user_id)
+
+################################################################################
+    async def member_departed(self, member: Member) -> Dict[str, Any]:
+        """
+        Cleans up everything the departed member owned and returns the
+        keyword arguments for the leave log entry.
+        """
+
+        report = {
+            "member": member,
+            "venue_deleted": False,
+            "profile_deleted": False,
+            "dj_profile_deleted": False,
+            "jobs_deleted": 0,
+            "jobs_canceled": 0,
+        }
+
+        assets = self.member_assets(member.id)
+        if not assets.has_leave_work:
+            return report
+
+        (
+            report["profile_deleted"],
+            report["dj_profile_deleted"],
+            (report["jobs_deleted"], report["jobs_canceled"]),
+            report["venue_deleted"],
+        ) = await asyncio.gather(
+            self.profile_manager.on_member_leave(member),
+            self.dj_profile_manager.on_member_leave(member),
+            self.jobs_manager.on_member_leave(member),
+            self.venue_manager.on_member_leave(member),
         )
 
+        return report
+
 ################################################################################
     async def on_member_join(self, member: Member) -> None:
 
+        self._role_mgr.on_member_join(member)
+
         if member in self._member_cache:
             return
 
         self._member_cache.append(member)
         await self.log.on_member_join(member)
-        try:
-            await self._welcome_mgr.welcome.start(member)
-        except RuntimeError:
-            pass
+        await self._welcome_mgr.schedule(member)
 
 ################################################################################
     def clear_member_cache(self) -> None:
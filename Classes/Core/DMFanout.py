@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional
+
+from discord import Forbidden, HTTPException, Message, NotFound
+
+from Classes.Common.BlastContent import BlastContent, ContentBuilder
+from logger import log
+
+if TYPE_CHECKING:
+    from Classes import StaffPartyBot
+################################################################################
+
+__all__ = ("DMFanout", "DMBlast", "BlastContent")
+
+################################################################################
+class DMBlast:
+
+    __slots__ = (
+        "_id",
+        "_kind",
+        "_ref_id",
+        "_pending",
+        "_sent",
+        "_failed",
+        "_skipped",
+        "_started",
+        "_finished",
+    )
+
+################################################################################
+    def __init__(self, **kwargs) -> None:
+
+        self._id: int = kwargs["id"]
+        self._kind: str = kwargs["kind"]
+        self._ref_id: int = kwargs["ref_id"]
+        self._pending: Deque[int] = deque(kwargs.get("pending_ids", []))
+
+        self._sent: int = kwargs.get("sent", 0)
+        self._failed: int = kwargs.get("failed", 0)
+        self._skipped: int = kwargs.get("skipped", 0)
+
+        self._started: float = time.monotonic()
+        self._finished: Optional[float] = None
+
+################################################################################
+    @property
+    def id(self) -> int:
+
+        return self._id
+
+################################################################################
+    @property
+    def kind(self) -> str:
+
+        return self._kind
+
+################################################################################
+    @property
+    def ref_id(self) -> int:
+
+        return self._ref_id
+
+################################################################################
+    @property
+    def done(self) -> bool:
+
+        return not self._pending
+
+################################################################################
+    @property
+    def stats(self) -> Dict[str, Any]:
+
+        end = self._finished or time.monotonic()
+        return {
+            "id": self._id,
+            "kind": self._kind,
+            "ref_id": self._ref_id,
+            "sent": self._sent,
+            "failed": self._failed,
+            "skipped": self._skipped,
+            "pending": len(self._pending),
+            "elapsed": round(end - self._started, 2),
+        }
+
+################################################################################
+    def to_dict(self) -> Dict[str, Any]:
+
+        return {
+            "pending_ids": list(self._pending),
+            "sent": self._sent,
+            "failed": self._failed,
+            "skipped": self._skipped,
+        }
+
+################################################################################
+class DMFanout:
+    """
+    Sends a DM to many users in the background. Each blast is stored with
+    its outstanding recipients and their progress, so sending picks up where
+    it left off after a restart. Owners register a content builder per blast
+    kind so the message can be rebuilt from the blast's reference id.
+
+    Sends run `CONCURRENCY` at a time across all blasts, with new DM channels
+    opened no more often than every `OPEN_INTERVAL` seconds. Rate-limited and
+    server-side failures are retried with backoff; closed DMs are not.
+    """
+
+    __slots__ = (
+        "_state",
+        "_builders",
+        "_blasts",
+        "_tasks",
+        "_semaphore",
+        "_open_lock",
+        "_last_open",
+        "_history",
+    )
+
+    CONCURRENCY = 4
+    OPEN_INTERVAL = 0.5
+    MAX_ATTEMPTS = 3
+    RETRY_BASE = 2.0
+    HISTORY = 20
+
+################################################################################
+    def __init__(self, state: StaffPartyBot) -> None:
+
+        self._state: StaffPartyBot = state
+
+        self._builders: Dict[str, ContentBuilder] = {}
+        self._blasts: Dict[int, DMBlast] = {}
+        self._tasks: Dict[int, asyncio.Task] = {}
+
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(self.CONCURRENCY)
+        self._open_lock: asyncio.Lock = asyncio.Lock()
+        self._last_open: float = 0.0
+
+        self._history: Deque[Dict[str, Any]] = deque(maxlen=self.HISTORY)
+
+################################################################################
+    async def load_all(self, payload: Dict[str, Any]) -> None:
+
+        async for chunk in payload["blasts"]:
+            for data in chunk:
+                blast = DMBlast(**data)
+                self._blasts[blast.id] = blast
+
+################################################################################
+    @property
+    def bot(self) -> StaffPartyBot:
+
+        return self._state
+
+################################################################################
+    @property
+    def metrics(self) -> Dict[str, Any]:
+
+        return {
+            "active": [b.stats for b in self._blasts.values()],
+            "recent": list(self._history),
+        }
+
+################################################################################
+    def register(self, kind: str, builder: ContentBuilder) -> None:
+
+        self._builders[kind] = builder
+
+################################################################################
+    async def start(self, kind: str, ref_id: int, user_ids: List[int]) -> Optional[DMBlast]:
+        """
+        Records the blast and starts sending it in the background; returns
+        as soon as it's stored.
+        """
+
+        assert kind in self._builders, f"No DM blast builder registered for '{kind}'."
+
+        # Preserve order but never DM the same user twice.
+        user_ids = list(dict.fromkeys(user_ids))
+        if not user_ids:
+            return None
+
+        data = await self.bot.db.insert.dm_blast(kind, ref_id, user_ids)
+        blast = DMBlast(**data)
+        self._blasts[blast.id] = blast
+        self._spawn(blast)
+
+        return blast
+
+################################################################################
+    def resume(self) -> None:
+        """Restarts every blast that was still sending at shutdown."""
+
+        for blast in list(self._blasts.values()):
+            if blast.id not in self._tasks:
+                self._spawn(blast)
+
+################################################################################
+    def _spawn(self, blast: DMBlast) -> None:
+
+        task = asyncio.create_task(self._run(blast))
+        self._tasks[blast.id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(blast.id, None))
+
+################################################################################
+    async def close(self) -> None:
+        """Stops sending. Progress is already stored, so blasts resume on the next start."""
+
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+################################################################################
+    async def _run(self, blast: DMBlast) -> None:
+
+        builder = self._builders.get(blast.kind)
+        try:
+            content = await builder(blast.ref_id) if builder is not None else None
+        except Exception as ex:
+            log.error(f"Failed to build DM blast {blast.kind}:{blast.ref_id}: {ex}", None)
+            content = None
+
+        if content is None:
+            blast._skipped += len(blast._pending)
+            blast._pending.clear()
+        else:
+            workers = [
+                asyncio.create_task(self._worker(blast, content))
+                for _ in range(min(self.CONCURRENCY, len(blast._pending)))
+            ]
+            try:
+                await asyncio.gather(*workers)
+            finally:
+                for worker in workers:
+                    worker.cancel()
+
+        blast._finished = time.monotonic()
+        self._blasts.pop(blast.id, None)
+        self._history.append(blast.stats)
+        self.bot.db.delete.dm_blast(blast.id)
+
+        stats = blast.stats
+        log.info(
+            f"DM blast {blast.kind}:{blast.ref_id} finished in {stats['elapsed']}s - "
+            f"{stats['sent']} sent, {stats['failed']} failed, {stats['skipped']} skipped.",
+            None
+        )
+
+################################################################################
+    async def _worker(self, blast: DMBlast, content: BlastContent) -> None:
+
+        while blast._pending:
+            user_id = blast._pending.popleft()
+            message = None
+
+            try:
+                if content.active is not None and not content.active():
+                    blast._skipped += 1 + len(blast._pending)
+                    blast._pending.clear()
+                    self.bot.db.update.dm_blast(blast)
+                    return
+
+                async with self._semaphore:
+                    message = await self._deliver(user_id, content)
+                if message is not None and content.on_sent is not None:
+                    content.on_sent(user_id, message)
+            except asyncio.CancelledError:
+                # Shutting down mid-send; leave them for the resumed blast.
+                if message is None:
+                    blast._pending.appendleft(user_id)
+                else:
+                    blast._sent += 1
+                self.bot.db.update.dm_blast(blast)
+                raise
+            except Exception as ex:
+                # One bad recipient mustn't stop the rest of the blast.
+                log.warning(f"DM blast {blast.kind}:{blast.ref_id} failed for user {user_id}: {ex}", None)
+
+            if message is None:
+                blast._failed += 1
+            else:
+                blast._sent += 1
+            self.bot.db.update.dm_blast(blast)
+
+################################################################################
+    async def _deliver(self, user_id: int, content: BlastContent) -> Optional[Message]:
+
+        user = await self.bot.get_or_fetch_member_or_user(user_id)
+        if user is None:
+            return None
+
+        for attempt in range(self.MAX_ATTEMPTS):
+            try:
+                channel = user.dm_channel or await self._open_dm(user)
+                view = content.view() if content.view is not None else None
+                if view is not None:
+                    return await channel.send(embed=content.embed, view=view)
+                return await channel.send(embed=content.embed)
+            except (Forbidden, NotFound):
+                # DMs closed or the account is gone; retrying won't help.
+                return None
+            except HTTPException as ex:
+                if ex.status != 429 and ex.status < 500:
+                    return None
+                await asyncio.sleep(self.RETRY_BASE ** attempt)
+
+        log.warning(f"Giving up on DM to {user_id} after {self.MAX_ATTEMPTS} attempts.", None)
+        return None
+
+################################################################################
+    async def _open_dm(self, user: Any) -> Any:
+
+        # Opening DM channels has a much tighter rate limit than sending in them.
+        async with self._open_lock:
+            wait = self._last_open + self.OPEN_INTERVAL - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_open = time.monotonic()
+
+            return await user.create_dm()
+
+################################################################################
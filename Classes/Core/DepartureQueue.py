@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+
+from discord import Member
+
+from logger import log
+
+if TYPE_CHECKING:
+    from Classes import StaffPartyBot
+################################################################################
+
+__all__ = ("DepartureQueue", )
+
+################################################################################
+class DepartureQueue:
+    """
+    Collects members leaving the SPB guild and cleans up after them in
+    batches. Departures within `BATCH_WINDOW` seconds of each other are
+    handled together, at most `MAX_CONCURRENCY` members at a time, and a
+    batch of `RAID_THRESHOLD` or more is logged as a single summary instead
+    of one embed per member.
+    """
+
+    __slots__ = (
+        "_state",
+        "_pending",
+        "_timer",
+        "_batches",
+    )
+
+    BATCH_WINDOW = 1.0
+    MAX_CONCURRENCY = 10
+    RAID_THRESHOLD = 10
+
+################################################################################
+    def __init__(self, state: StaffPartyBot) -> None:
+
+        self._state: StaffPartyBot = state
+
+        self._pending: Dict[int, Member] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._batches: Set[asyncio.Task] = set()
+
+################################################################################
+    @property
+    def bot(self) -> StaffPartyBot:
+
+        return self._state
+
+################################################################################
+    def add(self, member: Member) -> None:
+
+        self._pending[member.id] = member
+        if self._timer is None:
+            loop = asyncio.get_running_loop()
+            self._timer = loop.call_later(self.BATCH_WINDOW, self._flush)
+
+################################################################################
+    async def close(self) -> None:
+
+        self._flush()
+        if self._batches:
+            await asyncio.gather(*self._batches, return_exceptions=True)
+
+################################################################################
+    def _flush(self) -> None:
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = list(self._pending.values()), {}
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._process(batch))
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+
+################################################################################
+    async def _process(self, members: List[Member]) -> None:
+
+        limit = asyncio.Semaphore(self.MAX_CONCURRENCY)
+
+        async def _handle(member: Member) -> Dict[str, Any]:
+            async with limit:
+                return await self.bot.member_departed(member)
+
+        results = await asyncio.gather(*(_handle(m) for m in members), return_exceptions=True)
+
+        reports: List[Dict[str, Any]] = []
+        for member, result in zip(members, results):
+            if isinstance(result, BaseException):
+                log.error(f"Cleanup after member {member.id} left failed: {result}", None)
+                continue
+            reports.append(result)
+
+        if len(members) >= self.RAID_THRESHOLD:
+            await self.bot.log.on_mass_member_leave(reports)
+            return
+
+        for report in reports:
+            await self.bot.log.on_member_leave(**report)
+
+################################################################################
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from discord import Guild
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING
 
+from Classes.Common import IndexedCollection
 from .GuildData import GuildData
 
 if TYPE_CHECKING:
@@ -23,14 +24,12 @@ class GuildManager:
     def __init__(self, bot: StaffPartyBot):
 
         self._state: StaffPartyBot = bot
-        self._fguilds: List[GuildData] = []
+        self._fguilds: IndexedCollection[GuildData] = IndexedCollection(key=lambda g: g.guild_id)
 
 ################################################################################
     def __getitem__(self, guild_id: int) -> GuildData:
 
-        for frogge in self._fguilds:
-            if frogge.guild_id == guild_id:
-                return frogge
+        return self._fguilds.get(guild_id)
 
 ################################################################################
     def __iter__(self):
@@ -40,11 +39,11 @@ class GuildManager:
 ################################################################################
     def __contains__(self, guild: Guild) -> bool:
 
-        return guild in [fguild.parent for fguild in self._fguilds]
+        return self._fguilds.get(guild.id) is not None
 
 ################################################################################
     @property
-    def fguilds(self) -> List[GuildData]:
+    def fguilds(self) -> IndexedCollection[GuildData]:
 
         return self._fguilds
 
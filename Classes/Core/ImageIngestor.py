@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Hashable, List, NamedTuple, Optional, Set, Tuple
+
+import cloudinary.uploader
+from discord import Attachment, File
+
+from logger import log
+from Utilities import Utilities as U
+
+if TYPE_CHECKING:
+    from Classes import StaffPartyBot
+################################################################################
+
+__all__ = ("ImageIngestor", "ImageUpload", "UploadedImage")
+
+# (upload target, content hash)
+UploadKey = Tuple[U.DumpMethod, str]
+
+################################################################################
+class UploadedImage(NamedTuple):
+
+    url: str
+
+################################################################################
+class _UploadJob(NamedTuple):
+
+    key: UploadKey
+    filename: str
+    data: bytes
+    future: asyncio.Future
+
+################################################################################
+class ImageUpload:
+    """
+    Handle for an image handed to the `ImageIngestor`. Its result arrives
+    once a worker has uploaded it, or straight away for a duplicate.
+    """
+
+    __slots__ = (
+        "_future",
+    )
+
+    # Keeps `then()` callbacks alive after their handle is dropped.
+    _pending: Set[asyncio.Task] = set()
+    # Slot -> the upload most recently bound to it by `then()`
+    _latest: Dict[Hashable, ImageUpload] = {}
+
+################################################################################
+    def __init__(self, future: asyncio.Future) -> None:
+
+        self._future: asyncio.Future = future
+
+################################################################################
+    @property
+    def done(self) -> bool:
+
+        return self._future.done()
+
+################################################################################
+    async def result(self) -> Optional[UploadedImage]:
+        """Waits for the upload. Returns None if it failed."""
+
+        try:
+            return await asyncio.shield(self._future)
+        except Exception:
+            return None
+
+################################################################################
+    async def url(self) -> Optional[str]:
+
+        image = await self.result()
+        return image.url if image is not None else None
+
+################################################################################
+    def then(self, callback: Callable[[str], Awaitable[None]], slot: Optional[Hashable] = None) -> None:
+        """
+        Runs `callback` with the image URL once the upload succeeds, without
+        making the caller wait for it. Failed uploads are already logged and
+        skip the callback.
+
+        Uploads finish in any order, so one that sets a field should name it
+        as its `slot`; the callback is then skipped if a later upload has
+        been bound to the same slot in the meantime.
+        """
+
+        if slot is not None:
+            self._latest[slot] = self
+
+        async def _run() -> None:
+            url = await self.url()
+            if slot is not None:
+                if self._latest.get(slot) is not self:
+                    return
+                del self._latest[slot]
+            if url is None:
+                return
+            try:
+                await callback(url)
+            except Exception as ex:
+                log.error(f"Failed to apply uploaded image {url}: {ex}", None)
+
+        self._spawn(_run())
+
+################################################################################
+    def on_failure(self, callback: Callable[[], Awaitable[None]]) -> None:
+
+        async def _run() -> None:
+            if await self.result() is not None:
+                return
+            try:
+                await callback()
+            except Exception as ex:
+                log.warning(f"Failed to report a failed image upload: {ex}", None)
+
+        self._spawn(_run())
+
+################################################################################
+    def _spawn(self, coro: Awaitable[None]) -> None:
+
+        task = asyncio.ensure_future(coro)
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+################################################################################
+class ImageIngestor:
+    """
+    Uploads user-provided images off the interaction path. `submit()` checks
+    the size limit, downloads the attachment and returns an `ImageUpload`
+    straight away, while a small pool of workers does the slow re-upload to
+    the image dump channel or Cloudinary. Identical images (by content hash)
+    are uploaded once and reuse the first upload's URL, including ones
+    submitted while that upload is still in flight.
+    """
+
+    __slots__ = (
+        "_state",
+        "_queue",
+        "_workers",
+        "_uploaded",
+        "_inflight",
+        "_uploads",
+        "_duplicates",
+        "_failures",
+    )
+
+    WORKERS = 3
+    MAX_BYTES = 10 * 1024 * 1024  # Cloudinary's free plan image limit
+    MAX_REMEMBERED = 1024
+    UPLOAD_TIMEOUT = 60.0
+
+################################################################################
+    def __init__(self, state: StaffPartyBot) -> None:
+
+        self._state: StaffPartyBot = state
+
+        self._queue: asyncio.Queue[_UploadJob] = asyncio.Queue()
+        self._workers: List[asyncio.Task] = []
+        self._uploaded: OrderedDict[UploadKey, UploadedImage] = OrderedDict()
+        self._inflight: Dict[UploadKey, asyncio.Future] = {}
+
+        self._uploads: int = 0
+        self._duplicates: int = 0
+        self._failures: int = 0
+
+################################################################################
+    @property
+    def bot(self) -> StaffPartyBot:
+
+        return self._state
+
+################################################################################
+    @property
+    def metrics(self) -> Dict[str, Any]:
+
+        return {
+            "queued": self._queue.qsize(),
+            "uploads": self._uploads,
+            "duplicates": self._duplicates,
+            "failures": self._failures,
+        }
+
+################################################################################
+    def start(self) -> None:
+
+        self._workers = [w for w in self._workers if not w.done()]
+        while len(self._workers) < self.WORKERS:
+            self._workers.append(asyncio.create_task(self._work()))
+
+################################################################################
+    async def close(self) -> None:
+
+        # Give uploads already accepted a chance to land before stopping.
+        if self._workers:
+            try:
+                await asyncio.wait_for(self._queue.join(), self.UPLOAD_TIMEOUT)
+            except asyncio.TimeoutError:
+                log.warning(f"Stopping with {self._queue.qsize()} image uploads still queued.", None)
+
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+
+################################################################################
+    def too_large(self, attachment: Attachment) -> bool:
+
+        return attachment.size > self.MAX_BYTES
+
+################################################################################
+    async def submit(self, attachment: Attachment, method: U.DumpMethod = U.DumpMethod.Discord) -> ImageUpload:
+        """
+        Downloads the attachment and queues it for upload. Raises ValueError
+        if it's over `MAX_BYTES`.
+        """
+
+        if self.too_large(attachment):
+            raise ValueError(f"Image is {attachment.size} bytes; the limit is {self.MAX_BYTES}.")
+
+        data = await attachment.read()
+        if len(data) > self.MAX_BYTES:
+            raise ValueError(f"Image is {len(data)} bytes; the limit is {self.MAX_BYTES}.")
+
+        key: UploadKey = (method, hashlib.sha256(data).hexdigest())
+        loop = asyncio.get_running_loop()
+
+        image = self._uploaded.get(key)
+        if image is not None:
+            self._uploaded.move_to_end(key)
+            self._duplicates += 1
+            future = loop.create_future()
+            future.set_result(image)
+            return ImageUpload(future)
+
+        future = self._inflight.get(key)
+        if future is not None:
+            self._duplicates += 1
+            return ImageUpload(future)
+
+        future = loop.create_future()
+        self._inflight[key] = future
+        self._queue.put_nowait(_UploadJob(key, attachment.filename, data, future))
+        self.start()
+
+        return ImageUpload(future)
+
+################################################################################
+    async def _work(self) -> None:
+
+        while True:
+            job = await self._queue.get()
+            try:
+                image = await asyncio.wait_for(self._upload(job), self.UPLOAD_TIMEOUT)
+            except Exception as ex:
+                self._failures += 1
+                log.error(f"Failed to upload image '{job.filename}': {ex}", None)
+                job.future.set_exception(ex)
+            else:
+                self._uploads += 1
+                self._remember(job.key, image)
+                job.future.set_result(image)
+            finally:
+                self._inflight.pop(job.key, None)
+                self._queue.task_done()
+
+################################################################################
+    async def _upload(self, job: _UploadJob) -> UploadedImage:
+
+        method, _ = job.key
+        if method == U.DumpMethod.Cloudinary:
+            return await self._upload_cloudinary(job.data)
+
+        return await self._upload_discord(job.filename, job.data)
+
+################################################################################
+    async def _upload_discord(self, filename: str, data: bytes) -> UploadedImage:
+
+        post = await self.bot.image_dump.send(file=File(io.BytesIO(data), filename=filename))
+        return UploadedImage(post.attachments[0].url)
+
+################################################################################
+    @staticmethod
+    async def _upload_cloudinary(data: bytes) -> UploadedImage:
+
+        # The SDK is blocking; keep it off the event loop.
+        ret = await asyncio.to_thread(cloudinary.uploader.upload, data)
+        return UploadedImage(ret["secure_url"])
+
+################################################################################
+    def _remember(self, key: UploadKey, image: UploadedImage) -> None:
+
+        self._uploaded[key] = image
+        self._uploaded.move_to_end(key)
+
+        while len(self._uploaded) > self.MAX_REMEMBERED:
+            self._uploaded.popitem(last=False)
+
+################################################################################
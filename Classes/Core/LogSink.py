@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from discord import Embed, Message
+from discord.abc import Messageable
+
+from logger import log
+
+if TYPE_CHECKING:
+    from Classes import StaffPartyBot
+################################################################################
+
+__all__ = ("LogSink", "LogPriority")
+
+################################################################################
+class LogPriority(IntEnum):
+
+    Immediate = 0  # Sent right away; anything with a view or a reply to use.
+    High = 1       # Batched, but flushed on the next worker wake-up.
+    Low = 2        # Batched and flushed every FLUSH_INTERVAL; dropped first.
+
+################################################################################
+class LogSink:
+    """
+    Queues log embeds and sends them in batches of up to `BATCH_SIZE` embeds
+    per message, spaced at least `SEND_INTERVAL` apart, so log traffic doesn't
+    eat into the rate-limit buckets user-facing messages need during bursts.
+    """
+
+    __slots__ = (
+        "_state",
+        "_queue",
+        "_counter",
+        "_wakeup",
+        "_worker",
+        "_closing",
+        "_last_send",
+        "_dropped",
+        "_failed",
+        "_sent_messages",
+        "_sent_embeds",
+        "_immediate",
+    )
+
+    BATCH_SIZE = 10         # Discord's per-message embed limit
+    MAX_BATCH_CHARS = 6000  # Discord's per-message embed text limit
+    FLUSH_INTERVAL = 5.0
+    SEND_INTERVAL = 1.0
+    MAX_QUEUE = 500
+
+################################################################################
+    def __init__(self, state: StaffPartyBot) -> None:
+
+        self._state: StaffPartyBot = state
+
+        self._queue: List[Tuple[int, int, Messageable, Embed]] = []
+        self._counter = itertools.count()
+        self._wakeup: asyncio.Event = asyncio.Event()
+        self._worker: Optional[asyncio.Task] = None
+        self._closing: bool = False
+        self._last_send: float = 0.0
+
+        self._dropped: int = 0
+        self._failed: int = 0
+        self._sent_messages: int = 0
+        self._sent_embeds: int = 0
+        self._immediate: int = 0
+
+################################################################################
+    @property
+    def queue_depth(self) -> int:
+
+        return len(self._queue)
+
+################################################################################
+    @property
+    def metrics(self) -> Dict[str, int]:
+
+        return {
+            "queue_depth": len(self._queue),
+            "dropped": self._dropped,
+            "failed": self._failed,
+            "sent_messages": self._sent_messages,
+            "sent_embeds": self._sent_embeds,
+            "immediate": self._immediate,
+        }
+
+################################################################################
+    def start(self) -> None:
+
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+################################################################################
+    async def close(self) -> None:
+        """Sends whatever is still queued, then stops the worker."""
+
+        self._closing = True
+        self._wakeup.set()
+
+        if self._worker is not None and not self._worker.done():
+            await self._worker
+        else:
+            await self.flush()
+
+################################################################################
+    async def send(
+        self,
+        destination: Messageable,
+        embed: Embed,
+        priority: LogPriority = LogPriority.Low,
+        **kwargs: Any
+    ) -> Optional[Message]:
+        """
+        Sends immediately (and returns the message) for `Immediate` priority
+        or when extra send arguments like a view are given; otherwise queues.
+        """
+
+        if priority == LogPriority.Immediate or kwargs:
+            self._last_send = time.monotonic()
+            msg = await destination.send(embed=embed, **kwargs)
+
+            self._immediate += 1
+            self._sent_messages += 1
+            self._sent_embeds += 1
+
+            return msg
+
+        if len(self._queue) >= self.MAX_QUEUE and not self._make_room(priority):
+            self._dropped += 1
+            return None
+
+        heapq.heappush(self._queue, (priority, next(self._counter), destination, embed))
+        if priority == LogPriority.High:
+            self._wakeup.set()
+
+        return None
+
+################################################################################
+    def _make_room(self, priority: LogPriority) -> bool:
+
+        # Evict the newest entry of the lowest priority, if it ranks below us.
+        worst = max(self._queue, key=lambda item: (item[0], item[1]))
+        if worst[0] <= priority:
+            return False
+
+        self._queue.remove(worst)
+        heapq.heapify(self._queue)
+        self._dropped += 1
+
+        return True
+
+################################################################################
+    async def _run(self) -> None:
+
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+
+            self._wakeup.clear()
+            await self.flush()
+
+        # Anything queued while the last flush was running.
+        await self.flush()
+
+################################################################################
+    async def flush(self) -> None:
+
+        if not self._queue:
+            return
+
+        # Drain in priority order, grouped per destination in that same order.
+        pending: Dict[Messageable, List[Embed]] = {}
+        while self._queue:
+            _, _, destination, embed = heapq.heappop(self._queue)
+            pending.setdefault(destination, []).append(embed)
+
+        for destination, embeds in pending.items():
+            for batch in self._batches(embeds):
+                await self._throttle()
+                await self._send_batch(destination, batch)
+
+################################################################################
+    def _batches(self, embeds: List[Embed]) -> List[List[Embed]]:
+
+        ret = []
+        batch, chars = [], 0
+
+        for embed in embeds:
+            size = len(embed)
+            if batch and (len(batch) >= self.BATCH_SIZE or chars + size > self.MAX_BATCH_CHARS):
+                ret.append(batch)
+                batch, chars = [], 0
+            batch.append(embed)
+            chars += size
+
+        if batch:
+            ret.append(batch)
+
+        return ret
+
+################################################################################
+    async def _throttle(self) -> None:
+
+        wait = self._last_send + self.SEND_INTERVAL - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+################################################################################
+    async def _send_batch(self, destination: Messageable, embeds: List[Embed]) -> None:
+
+        self._last_send = time.monotonic()
+
+        try:
+            await destination.send(embeds=embeds)
+        except Exception as ex:
+            self._failed += 1
+            log.warning(f"Failed to send {len(embeds)} log embed(s) to {destination}: {ex!r}", None)
+            return
+
+        self._sent_messages += 1
+        self._sent_embeds += len(embeds)
+
+################################################################################
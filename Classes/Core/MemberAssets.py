@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Optional, Union
+
+if TYPE_CHECKING:
+    from Classes import (
+        BGCheck,
+        DJProfile,
+        PermanentJobPosting,
+        Profile,
+        ServiceRequest,
+        StaffPartyBot,
+        TemporaryJobPosting,
+        Venue,
+    )
+################################################################################
+
+__all__ = ("MemberAssets", )
+
+JobPosting = Union["TemporaryJobPosting", "PermanentJobPosting"]
+
+################################################################################
+class MemberAssets:
+    """
+    Everything the bot holds that belongs to, or is assigned to, one user,
+    gathered from the managers' per-user indexes without scanning any of
+    their collections.
+    """
+
+    __slots__ = (
+        "user_id",
+        "profile",
+        "dj_profile",
+        "venues",
+        "jobs_posted",
+        "jobs_accepted",
+        "service_requests",
+        "services_accepted",
+        "bg_check",
+    )
+
+################################################################################
+    def __init__(self, bot: StaffPartyBot, user_id: int) -> None:
+
+        self.user_id: int = user_id
+
+        self.profile: Optional[Profile] = bot.profile_manager[user_id]
+        self.dj_profile: Optional[DJProfile] = bot.dj_profile_manager[user_id]
+        self.venues: List[Venue] = bot.venue_manager.get_venues_by_user(user_id)
+        self.jobs_posted: List[JobPosting] = bot.jobs_manager.jobs_posted_by(user_id)
+        self.jobs_accepted: List[JobPosting] = bot.jobs_manager.jobs_accepted_by(user_id)
+        self.service_requests: List[ServiceRequest] = bot.services_manager.requests_by_user(user_id)
+        self.services_accepted: List[ServiceRequest] = bot.services_manager.requests_accepted_by(user_id)
+        self.bg_check: Optional[BGCheck] = bot.bg_check_manager[user_id]
+
+################################################################################
+    def __repr__(self) -> str:
+
+        return (
+            f"<MemberAssets user_id={self.user_id} profile={self.profile is not None} "
+            f"dj_profile={self.dj_profile is not None} venues={len(self.venues)} "
+            f"jobs_posted={len(self.jobs_posted)} jobs_accepted={len(self.jobs_accepted)} "
+            f"service_requests={len(self.service_requests)} "
+            f"services_accepted={len(self.services_accepted)} bg_check={self.bg_check is not None}>"
+        )
+
+################################################################################
+    @property
+    def has_leave_work(self) -> bool:
+        """Whether anything here is acted on when the member leaves."""
+
+        return bool(
+            self.profile is not None
+            or self.dj_profile is not None
+            or self.venues
+            or self.jobs_posted
+            or self.jobs_accepted
+        )
+
+################################################################################
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Dict, List, Optional, Set
+
+from discord import Member
+
+from logger import log
+
+if TYPE_CHECKING:
+    from Classes import StaffPartyBot
+################################################################################
+
+__all__ = ("MemberBatcher", )
+
+################################################################################
+class MemberBatcher:
+    """
+    Looks up SPB guild members by id in batches. Ids requested within
+    `BATCH_WINDOW` seconds of each other (up to `BATCH_SIZE`) go out as one
+    gateway member request instead of one REST call each.
+    """
+
+    __slots__ = (
+        "_state",
+        "_pending",
+        "_timer",
+        "_queries",
+    )
+
+    BATCH_SIZE = 100  # Gateway limit per request
+    BATCH_WINDOW = 0.05
+
+################################################################################
+    def __init__(self, state: StaffPartyBot) -> None:
+
+        self._state: StaffPartyBot = state
+
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._queries: Set[asyncio.Task] = set()
+
+################################################################################
+    @property
+    def bot(self) -> StaffPartyBot:
+
+        return self._state
+
+################################################################################
+    async def get(self, user_id: int) -> Optional[Member]:
+
+        future = self._pending.get(user_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[user_id] = future
+
+            if len(self._pending) >= self.BATCH_SIZE:
+                self._flush()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.BATCH_WINDOW, self._flush)
+
+        return await asyncio.shield(future)
+
+################################################################################
+    def _flush(self) -> None:
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._query(batch))
+        self._queries.add(task)
+        task.add_done_callback(self._queries.discard)
+
+################################################################################
+    async def _query(self, batch: Dict[int, asyncio.Future]) -> None:
+
+        members: List[Member] = []
+        guild = self.bot.SPB_GUILD
+        if guild is not None:
+            try:
+                members = await guild.query_members(user_ids=list(batch), limit=len(batch), cache=True)
+            except Exception as ex:
+                log.warning(f"Member batch lookup of {len(batch)} ids failed: {ex}", None)
+
+        found = {m.id: m for m in members}
+        for user_id, future in batch.items():
+            if not future.done():
+                future.set_result(found.get(user_id))
+
+################################################################################
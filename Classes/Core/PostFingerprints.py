@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from discord import Embed, ForumTag, Message, Thread
+from discord.ui import View
+from discord.utils import MISSING
+
+from logger import log
+
+if TYPE_CHECKING:
+    from Classes import StaffPartyBot
+################################################################################
+
+__all__ = ("PostFingerprints", "PostFingerprint")
+
+################################################################################
+class PostFingerprint:
+
+    __slots__ = (
+        "_id",
+        "_message_id",
+        "_hashes",
+    )
+
+################################################################################
+    def __init__(self, **kwargs) -> None:
+
+        self._id: Optional[int] = kwargs.get("id")
+        self._message_id: int = kwargs["message_id"]
+        self._hashes: Dict[str, Optional[str]] = {
+            part: kwargs.get(f"{part}_hash") for part in PostFingerprints.PARTS
+        }
+
+################################################################################
+    @property
+    def id(self) -> Optional[int]:
+
+        return self._id
+
+################################################################################
+    @property
+    def message_id(self) -> int:
+
+        return self._message_id
+
+################################################################################
+    def to_dict(self) -> Dict[str, Any]:
+
+        return {f"{part}_hash": digest for part, digest in self._hashes.items()}
+
+################################################################################
+class PostFingerprints:
+    """
+    Remembers a hash of what was last published to each post (its embeds,
+    its view's component layout and its thread's tags) so edits that
+    wouldn't change anything are never sent. Hashes are stored, so posts
+    refreshed at startup are only edited if their content actually moved.
+    """
+
+    __slots__ = (
+        "_state",
+        "_prints",
+        "_sent",
+        "_skipped",
+    )
+
+    PARTS = ("embeds", "view", "tags")
+
+################################################################################
+    def __init__(self, state: StaffPartyBot) -> None:
+
+        self._state: StaffPartyBot = state
+
+        self._prints: Dict[int, PostFingerprint] = {}
+        self._sent: int = 0
+        self._skipped: int = 0
+
+################################################################################
+    async def load_all(self, payload: Dict[str, Any]) -> None:
+
+        async for chunk in payload["fingerprints"]:
+            for data in chunk:
+                fp = PostFingerprint(**data)
+                self._prints[fp.message_id] = fp
+
+################################################################################
+    @property
+    def bot(self) -> StaffPartyBot:
+
+        return self._state
+
+################################################################################
+    @property
+    def metrics(self) -> Dict[str, int]:
+
+        return {
+            "sent": self._sent,
+            "skipped": self._skipped,
+        }
+
+################################################################################
+    @staticmethod
+    def digest(part: str, value: Any) -> str:
+
+        match part:
+            case "embeds":
+                # Timestamps would make every render unique.
+                data = [
+                    {k: v for k, v in e.to_dict().items() if k != "timestamp"}
+                    for e in value
+                ]
+            case "view":
+                data = value.to_components() if value is not None else None
+            case "tags":
+                data = sorted(t.id for t in value)
+            case _:
+                raise ValueError(f"Unknown post part: {part}")
+
+        encoded = json.dumps(data, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+################################################################################
+    def changed(self, message_id: int, **parts: Any) -> Dict[str, Any]:
+        """
+        Returns the given parts whose content differs from what was last
+        published to the message. Parts passed as `MISSING` are ignored.
+        """
+
+        fp = self._prints.get(message_id)
+        ret = {
+            part: value for part, value in parts.items()
+            if value is not MISSING
+            and (fp is None or fp._hashes.get(part) != self.digest(part, value))
+        }
+        if not ret:
+            self._skipped += 1
+
+        return ret
+
+################################################################################
+    async def record(self, message_id: int, parts: Dict[str, Any]) -> None:
+
+        self._sent += 1
+        hashes = {part: self.digest(part, value) for part, value in parts.items()}
+
+        fp = self._prints.get(message_id)
+        if fp is not None:
+            fp._hashes.update(hashes)
+            if fp.id is not None:
+                self.bot.db.update.post_fingerprint(fp)
+            return
+
+        fp = PostFingerprint(message_id=message_id)
+        fp._hashes.update(hashes)
+        self._prints[message_id] = fp
+
+        try:
+            data = await self.bot.db.insert.post_fingerprint(message_id, fp.to_dict())
+        except Exception as ex:
+            log.warning(f"Failed to store fingerprint for message {message_id}: {ex}", None)
+            self._prints.pop(message_id, None)
+            return
+
+        fp._id = data["id"]
+        # Catch anything recorded while the insert was in flight.
+        if fp.to_dict() != {k: data[k] for k in fp.to_dict()}:
+            self.bot.db.update.post_fingerprint(fp)
+
+################################################################################
+    def forget(self, message_id: Optional[int]) -> None:
+        """Drops the fingerprint of a post that's been deleted."""
+
+        if message_id is None:
+            return
+
+        fp = self._prints.pop(message_id, None)
+        if fp is not None and fp.id is not None:
+            self.bot.db.delete.post_fingerprint(fp.id)
+
+################################################################################
+    async def edit(
+        self,
+        message: Message,
+        *,
+        embeds: List[Embed] = MISSING,
+        view: Optional[View] = MISSING
+    ) -> bool:
+        """
+        Edits only the parts of `message` that changed. Returns whether an
+        edit was sent; API errors are left to the caller.
+        """
+
+        changes = self.changed(message.id, embeds=embeds, view=view)
+        if not changes:
+            return False
+
+        await message.edit(**changes)
+        await self.record(message.id, changes)
+
+        return True
+
+################################################################################
+    async def edit_tags(self, thread: Thread, message_id: int, tags: List[ForumTag]) -> bool:
+
+        changes = self.changed(message_id, tags=tags)
+        if not changes:
+            return False
+
+        await thread.edit(applied_tags=tags)
+        await self.record(message_id, changes)
+
+        return True
+
+################################################################################
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set
 
-from discord import Role, Embed, EmbedField, Interaction, SelectOption, Member, User, ComponentType
+from discord import Role, Embed, EmbedField, Guild, Interaction, SelectOption, Member, User, ComponentType
 
 from Classes.Common import LazyRole
-from Enums import RoleType
+from Enums import RoleType, Service
 from UI.Common import FroggeMultiMenuSelect, FroggeSelectView
 from UI.Core import RoleManagerMenuView
 from Utilities import Utilities as U
+from .ServiceRoleIndex import ServiceRoleIndex
 
 if TYPE_CHECKING:
     from Classes import StaffPartyBot
@@ -24,6 +25,7 @@ class RoleManager:
         "_staff_main",
         "_staff_unvalidated",
         "_venue_management",
+        "_service_roles",
     )
 
 ################################################################################
@@ -35,6 +37,8 @@ class RoleManager:
         self._staff_unvalidated: LazyRole = LazyRole(self, None)
         self._venue_management: LazyRole = LazyRole(self, None)
 
+        self._service_roles: ServiceRoleIndex = ServiceRoleIndex()
+
 ################################################################################
     def load_all(self, payload: Dict[str, Any]) -> None:
 
@@ -66,6 +70,51 @@ class RoleManager:
 
         return await self._venue_management.get()
 
+################################################################################
+    def index_service_roles(self, guild: Guild) -> None:
+
+        self._service_roles.rebuild(guild)
+
+################################################################################
+    def service_role(self, service: Service) -> Optional[Role]:
+
+        return self._service_roles.role(service)
+
+################################################################################
+    def service_member_ids(self, service: Service) -> Set[int]:
+
+        return self._service_roles.member_ids(service)
+
+################################################################################
+    def on_member_join(self, member: Member) -> None:
+
+        self._service_roles.on_member_join(member)
+
+################################################################################
+    def on_member_remove(self, member: Member) -> None:
+
+        self._service_roles.on_member_remove(member)
+
+################################################################################
+    def on_member_update(self, before: Member, after: Member) -> None:
+
+        self._service_roles.on_member_update(before, after)
+
+################################################################################
+    def on_role_create(self, role: Role) -> None:
+
+        self._service_roles.on_role_create(role)
+
+################################################################################
+    def on_role_update(self, before: Role, after: Role) -> None:
+
+        self._service_roles.on_role_update(before, after)
+
+################################################################################
+    def on_role_delete(self, role: Role) -> None:
+
+        self._service_roles.on_role_delete(role)
+
 ################################################################################
     def update(self) -> None:
 
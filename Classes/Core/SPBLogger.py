@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import random
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from discord import Embed, Message, TextChannel, User, EmbedField, Member
 
 from UI.BackgroundChecks import BGCheckApprovalView
 from Utilities import Utilities as U
+from .LogSink import LogPriority, LogSink
 
 if TYPE_CHECKING:
     from Classes import *
@@ -20,6 +21,7 @@ class SPBLogger:
     __slots__ = (
         "_state",
         "_alyah",
+        "_sink",
     )
 
 ################################################################################
@@ -27,11 +29,18 @@ class SPBLogger:
 
         self._state: StaffPartyBot = state
         self._alyah: User = None  # type: ignore
+        self._sink: LogSink = LogSink(state)
 
 ################################################################################
     async def load_all(self) -> None:
 
         self._alyah = await self.bot.fetch_user(334530475479531520)
+        self._sink.start()
+
+################################################################################
+    async def close(self) -> None:
+
+        await self._sink.close()
 
 ################################################################################
     @property
@@ -39,6 +48,12 @@ class SPBLogger:
 
         return self._state
 
+################################################################################
+    @property
+    def sink(self) -> LogSink:
+
+        return self._sink
+
 ################################################################################
     @property
     async def log_channel(self) -> Optional[TextChannel]:
@@ -46,13 +61,29 @@ class SPBLogger:
         return await self.bot.channel_manager.log_channel
 
 ################################################################################
-    async def _log(self, message: Embed, **kwargs) -> Optional[Message]:
+    async def _log(
+        self,
+        message: Embed,
+        priority: LogPriority = LogPriority.Low,
+        **kwargs
+    ) -> Optional[Message]:
+        """
+        Queues the embed for the next batched send to the log channel. Anything
+        sent with a view (or at `Immediate` priority) goes out right away and
+        the resulting message is returned.
+        """
 
         channel = await self.log_channel
         if channel is None:
             return None
 
-        return await channel.send(embed=message, **kwargs)
+        return await self._sink.send(channel, message, priority, **kwargs)
+
+################################################################################
+    async def _alert(self, message: Embed, priority: LogPriority = LogPriority.Low) -> None:
+
+        if not self.bot.DEBUG:
+            await self._sink.send(self._alyah, message, priority)
 
 ################################################################################
     async def venue_created(self, venue: Venue) -> None:
@@ -75,8 +106,7 @@ class SPBLogger:
         )
 
         await self._log(embed)
-        if not self.bot.DEBUG:
-            await self._alyah.send(embed=embed)
+        await self._alert(embed)
 
 ################################################################################
     async def bg_check_submitted(self, bg_check: BGCheck) -> Message:
@@ -139,8 +169,7 @@ class SPBLogger:
             ),
             timestamp=True
         )
-        if not self.bot.DEBUG:
-            await self._alyah.send(embed=alert)
+        await self._alert(alert, LogPriority.High)
 
         return msg
 
@@ -191,7 +220,8 @@ class SPBLogger:
         jobs_canceled: int,
     ) -> None:
 
-        profile = self.bot.profile_manager.get_profile(member.id)
+        # Look the profile up rather than `get_profile()`, which would create one.
+        profile = self.bot.profile_manager[member.id]
         qualifications = ", ".join(
             [p.name for p in profile.details.positions]
         ) if profile is not None else "`None`"
@@ -218,6 +248,28 @@ class SPBLogger:
 
         await self._log(embed)
 
+################################################################################
+    async def on_mass_member_leave(self, reports: List[Dict[str, Any]]) -> None:
+
+        members = "\n".join(f"* {r['member'].mention} ({r['member'].id})" for r in reports)
+        embed = U.make_embed(
+            title="Mass Member Departure!",
+            description=U.string_clamp(
+                f"`{len(reports)}` members left the server together:\n{members}", 4000
+            ),
+            fields=[
+                ("__Jobs Deleted__", f"`{sum(r['jobs_deleted'] for r in reports)}`", True),
+                ("__Jobs Re-Opened__", f"`{sum(r['jobs_canceled'] for r in reports)}`", True),
+                ("** **", "** **", False),
+                ("__Venues Deleted__", f"`{sum(r['venue_deleted'] for r in reports)}`", True),
+                ("__Profiles Deleted__", f"`{sum(r['profile_deleted'] for r in reports)}`", True),
+                ("__DJ Profiles Deleted__", f"`{sum(r['dj_profile_deleted'] for r in reports)}`", True)
+            ],
+            timestamp=True
+        )
+
+        await self._log(embed, LogPriority.High)
+
 ################################################################################
     async def temp_job_posted(self, job: TemporaryJobPosting) -> None:
 
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, Optional, Set
+
+from discord import Guild, Member, Role
+
+from Enums import Service
+from logger import log
+################################################################################
+
+__all__ = ("ServiceRoleIndex", )
+
+# Service roles are matched to their service by name.
+_SERVICE_NAMES: Dict[str, Service] = {s.proper_name: s for s in Service}
+
+################################################################################
+class ServiceRoleIndex:
+    """
+    Tracks which guild role belongs to each `Service` and which members hold
+    it. Built once from the guild's member list, then kept current from
+    member and role events, so finding everyone who offers a service costs
+    only as much as the number of people who do.
+    """
+
+    __slots__ = (
+        "_guild_id",
+        "_roles",
+        "_services",
+        "_members",
+    )
+
+################################################################################
+    def __init__(self) -> None:
+
+        self._guild_id: Optional[int] = None
+
+        self._roles: Dict[Service, Role] = {}
+        self._services: Dict[int, Service] = {}
+        self._members: Dict[Service, Set[int]] = {s: set() for s in Service}
+
+################################################################################
+    def rebuild(self, guild: Guild) -> None:
+
+        self._guild_id = guild.id
+        self._roles.clear()
+        self._services.clear()
+        for members in self._members.values():
+            members.clear()
+
+        for role in guild.roles:
+            self._map_role(role)
+
+        # One pass over the guild rather than one per service role.
+        for member in guild.members:
+            self._add_member(member.id, member.roles)
+
+################################################################################
+    def role(self, service: Service) -> Optional[Role]:
+
+        return self._roles.get(service)
+
+################################################################################
+    def member_ids(self, service: Service) -> Set[int]:
+
+        return set(self._members[service])
+
+################################################################################
+    def on_member_join(self, member: Member) -> None:
+
+        if member.guild.id != self._guild_id:
+            return
+
+        self._add_member(member.id, member.roles)
+
+################################################################################
+    def on_member_remove(self, member: Member) -> None:
+
+        if member.guild.id != self._guild_id:
+            return
+
+        for members in self._members.values():
+            members.discard(member.id)
+
+################################################################################
+    def on_member_update(self, before: Member, after: Member) -> None:
+
+        if after.guild.id != self._guild_id:
+            return
+
+        before_ids = {r.id for r in before.roles}
+        after_ids = {r.id for r in after.roles}
+        if before_ids == after_ids:
+            return
+
+        for role_id in before_ids - after_ids:
+            service = self._services.get(role_id)
+            if service is not None:
+                self._members[service].discard(after.id)
+
+        for role_id in after_ids - before_ids:
+            service = self._services.get(role_id)
+            if service is not None:
+                self._members[service].add(after.id)
+
+################################################################################
+    def on_role_create(self, role: Role) -> None:
+
+        if role.guild.id != self._guild_id:
+            return
+
+        self._map_role(role)
+
+################################################################################
+    def on_role_update(self, before: Role, after: Role) -> None:
+
+        if after.guild.id != self._guild_id:
+            return
+
+        if before.name == after.name:
+            # Same role, same service; just keep the newer object around.
+            service = self._services.get(after.id)
+            if service is not None:
+                self._roles[service] = after
+            return
+
+        self._unmap_role(before)
+        if self._map_role(after):
+            # A role renamed into a service carries its existing holders.
+            service = self._services[after.id]
+            self._members[service].update(m.id for m in after.members)
+
+################################################################################
+    def on_role_delete(self, role: Role) -> None:
+
+        if role.guild.id != self._guild_id:
+            return
+
+        self._unmap_role(role)
+
+################################################################################
+    def _map_role(self, role: Role) -> bool:
+
+        service = _SERVICE_NAMES.get(role.name)
+        if service is None:
+            return False
+
+        existing = self._roles.get(service)
+        if existing is not None and existing.id != role.id:
+            log.warning(
+                f"Multiple roles found for service type: {service.proper_name}; "
+                f"keeping '{existing.id}', ignoring '{role.id}'.",
+                None
+            )
+            return False
+
+        self._roles[service] = role
+        self._services[role.id] = service
+        return True
+
+################################################################################
+    def _unmap_role(self, role: Role) -> None:
+
+        service = self._services.pop(role.id, None)
+        if service is None:
+            return
+
+        self._roles.pop(service, None)
+        self._members[service].clear()
+
+################################################################################
+    def _add_member(self, user_id: int, roles: Iterable[Role]) -> None:
+
+        for role in roles:
+            service = self._services.get(role.id)
+            if service is not None:
+                self._members[service].add(user_id)
+
+################################################################################
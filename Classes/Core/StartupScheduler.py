@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from logger import log
+
+if TYPE_CHECKING:
+    from Classes import StaffPartyBot
+################################################################################
+
+__all__ = ("StartupScheduler", "StartupPhase")
+
+StartupJob = Callable[..., Awaitable[Any]]
+
+################################################################################
+class StartupPhase:
+
+    __slots__ = (
+        "_name",
+        "_total",
+        "_done",
+        "_failed",
+        "_started",
+        "_finished",
+    )
+
+################################################################################
+    def __init__(self, name: str) -> None:
+
+        self._name: str = name
+
+        self._total: int = 0
+        self._done: int = 0
+        self._failed: int = 0
+
+        self._started: Optional[float] = None
+        self._finished: Optional[float] = None
+
+################################################################################
+    @property
+    def name(self) -> str:
+
+        return self._name
+
+################################################################################
+    @property
+    def total(self) -> int:
+
+        return self._total
+
+################################################################################
+    @property
+    def done(self) -> int:
+
+        return self._done
+
+################################################################################
+    @property
+    def failed(self) -> int:
+
+        return self._failed
+
+################################################################################
+    @property
+    def complete(self) -> bool:
+
+        return self._done + self._failed >= self._total
+
+################################################################################
+    @property
+    def duration(self) -> Optional[float]:
+
+        if self._started is None:
+            return None
+
+        return (self._finished or time.monotonic()) - self._started
+
+################################################################################
+    def add(self) -> None:
+
+        self._total += 1
+
+################################################################################
+    def start(self) -> None:
+
+        if self._started is None:
+            self._started = time.monotonic()
+
+################################################################################
+    def finish(self, success: bool) -> None:
+
+        if success:
+            self._done += 1
+        else:
+            self._failed += 1
+
+        if self.complete:
+            self._finished = time.monotonic()
+
+################################################################################
+    def format(self) -> str:
+
+        duration = self.duration
+        return (
+            f"{self._name}: {self._done}/{self._total} repaired"
+            + (f", {self._failed} failed" if self._failed else "")
+            + (f" in {duration:.2f}s" if duration is not None else "")
+        )
+
+################################################################################
+class _ChannelBucket:
+    """Serializes edits within a single channel and spaces them out."""
+
+    __slots__ = (
+        "_lock",
+        "_next",
+        "_interval",
+    )
+
+################################################################################
+    def __init__(self, interval: float) -> None:
+
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._next: float = 0.0
+        self._interval: float = interval
+
+################################################################################
+    async def __aenter__(self) -> None:
+
+        await self._lock.acquire()
+
+        delay = self._next - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+################################################################################
+    async def __aexit__(self, *_) -> None:
+
+        self._next = time.monotonic() + self._interval
+        self._lock.release()
+
+################################################################################
+class StartupScheduler:
+    """
+    Bounded-concurrency runner for the post repairs done after a cold start.
+
+    Jobs are keyed by the channel their message lives in, so edits to the same
+    channel share a rate-limit bucket while different channels (every forum
+    post is its own thread) are repaired in parallel.
+    """
+
+    __slots__ = (
+        "_state",
+        "_semaphore",
+        "_buckets",
+        "_phases",
+        "_jobs",
+        "_timings",
+        "_marks",
+    )
+
+    MAX_CONCURRENCY = 8
+    # Discord allows 5 message edits per 5 seconds per channel.
+    CHANNEL_INTERVAL = 1.0
+
+################################################################################
+    def __init__(self, state: StaffPartyBot) -> None:
+
+        self._state: StaffPartyBot = state
+
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._buckets: Dict[int, _ChannelBucket] = {}
+        self._phases: Dict[str, StartupPhase] = {}
+        self._jobs: List[Tuple[StartupPhase, Optional[int], StartupJob, Tuple[Any, ...]]] = []
+
+        self._timings: Dict[str, float] = {}
+        self._marks: Dict[str, float] = {}
+
+################################################################################
+    @property
+    def phases(self) -> List[StartupPhase]:
+
+        return list(self._phases.values())
+
+################################################################################
+    @property
+    def metrics(self) -> Dict[str, float]:
+
+        ret = dict(self._timings)
+        for phase in self._phases.values():
+            if phase.duration is not None:
+                ret[phase.name] = phase.duration
+
+        return ret
+
+################################################################################
+    @property
+    def pending(self) -> int:
+
+        return sum(p.total - p.done - p.failed for p in self._phases.values())
+
+################################################################################
+    def begin(self, name: str) -> None:
+
+        self._marks[name] = time.monotonic()
+
+################################################################################
+    def end(self, name: str) -> float:
+
+        elapsed = time.monotonic() - self._marks.pop(name, time.monotonic())
+        self._timings[name] = elapsed
+        print(f"{name} took {elapsed:.2f}s.")
+
+        return elapsed
+
+################################################################################
+    def phase(self, name: str) -> StartupPhase:
+
+        if name not in self._phases:
+            self._phases[name] = StartupPhase(name)
+
+        return self._phases[name]
+
+################################################################################
+    def submit(self, phase: str, message_url: Optional[str], job: StartupJob, *args: Any) -> None:
+
+        p = self.phase(phase)
+        p.add()
+
+        self._jobs.append((p, self._channel_id(message_url), job, args))
+
+################################################################################
+    @staticmethod
+    def _channel_id(message_url: Optional[str]) -> Optional[int]:
+
+        if not message_url:
+            return None
+
+        try:
+            return int(message_url.split("/")[-2])
+        except (ValueError, IndexError):
+            return None
+
+################################################################################
+    def _bucket(self, channel_id: Optional[int]) -> Any:
+
+        if channel_id is None:
+            return nullcontext()
+
+        if channel_id not in self._buckets:
+            self._buckets[channel_id] = _ChannelBucket(self.CHANNEL_INTERVAL)
+
+        return self._buckets[channel_id]
+
+################################################################################
+    async def run(self) -> None:
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+
+        jobs, self._jobs = self._jobs, []
+        await asyncio.gather(*[self._run_job(*job) for job in jobs])
+
+################################################################################
+    async def _run_job(
+        self,
+        phase: StartupPhase,
+        channel_id: Optional[int],
+        job: StartupJob,
+        args: Tuple[Any, ...]
+    ) -> None:
+
+        success = True
+        async with self._bucket(channel_id):
+            async with self._semaphore:
+                phase.start()
+                try:
+                    await job(*args)
+                except Exception as ex:
+                    success = False
+                    log.warning(f"Startup job in phase '{phase.name}' failed: {ex!r}", None)
+
+        phase.finish(success)
+        if phase.complete:
+            print(phase.format())
+
+################################################################################
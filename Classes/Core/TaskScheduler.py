@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from logger import log
+
+if TYPE_CHECKING:
+    from Classes import StaffPartyBot
+################################################################################
+
+__all__ = ("TaskScheduler", "ScheduledTask")
+
+# Called with the task's reference id once it comes due.
+TaskHandler = Callable[[int], Awaitable[None]]
+TaskKey = Tuple[str, int]
+
+################################################################################
+class ScheduledTask:
+
+    __slots__ = (
+        "_id",
+        "_kind",
+        "_ref_id",
+        "_due_at",
+        "_attempts",
+    )
+
+################################################################################
+    def __init__(self, **kwargs) -> None:
+
+        # No id means the task isn't stored; its owner re-tracks it on load.
+        self._id: Optional[int] = kwargs.get("id")
+        self._kind: str = kwargs["kind"]
+        self._ref_id: int = kwargs["ref_id"]
+        self._due_at: datetime = kwargs["due_at"].astimezone(timezone.utc)
+        # Failed runs so far; not stored, so a restart starts the count over.
+        self._attempts: int = 0
+
+################################################################################
+    @property
+    def id(self) -> Optional[int]:
+
+        return self._id
+
+################################################################################
+    @property
+    def kind(self) -> str:
+
+        return self._kind
+
+################################################################################
+    @property
+    def ref_id(self) -> int:
+
+        return self._ref_id
+
+################################################################################
+    @property
+    def key(self) -> TaskKey:
+
+        return self._kind, self._ref_id
+
+################################################################################
+    @property
+    def due_at(self) -> datetime:
+
+        return self._due_at
+
+################################################################################
+    def to_dict(self) -> Dict[str, Any]:
+
+        return {
+            "due_at": self._due_at,
+        }
+
+################################################################################
+class TaskScheduler:
+    """
+    Runs deferred work at a set UTC time. Tasks are identified by a kind and
+    the id of the object they're about, with one pending task per pair, and
+    owners register a handler per kind. Pending tasks sit on a min-heap
+    serviced by a single task that sleeps until the earliest is due.
+
+    `schedule()` stores the task so it survives a restart; `track()` keeps
+    it in memory only, for deadlines the owner already stores itself. A
+    stored task's row is only deleted once its handler has returned, and a
+    handler that raises is retried with backoff up to `MAX_ATTEMPTS` times.
+    """
+
+    __slots__ = (
+        "_state",
+        "_handlers",
+        "_tasks",
+        "_heap",
+        "_wake",
+        "_runner",
+        "_firing",
+    )
+
+    MAX_ATTEMPTS = 5
+    RETRY_DELAY = timedelta(minutes=1)  # doubled after each failure
+
+################################################################################
+    def __init__(self, state: StaffPartyBot) -> None:
+
+        self._state: StaffPartyBot = state
+
+        self._handlers: Dict[str, TaskHandler] = {}
+        self._tasks: Dict[TaskKey, ScheduledTask] = {}
+        self._heap: List[Tuple[datetime, str, int]] = []
+        self._wake: asyncio.Event = asyncio.Event()
+        self._runner: Optional[asyncio.Task] = None
+        self._firing: Set[asyncio.Task] = set()
+
+################################################################################
+    async def load_all(self, payload: Dict[str, Any]) -> None:
+
+        async for chunk in payload["tasks"]:
+            for data in chunk:
+                self._push(ScheduledTask(**data))
+
+################################################################################
+    @property
+    def bot(self) -> StaffPartyBot:
+
+        return self._state
+
+################################################################################
+    def register(self, kind: str, handler: TaskHandler) -> None:
+
+        self._handlers[kind] = handler
+
+################################################################################
+    def start(self) -> None:
+
+        if self._runner is None or self._runner.done():
+            self._runner = asyncio.create_task(self._run())
+
+################################################################################
+    async def close(self) -> None:
+
+        if self._runner is not None:
+            self._runner.cancel()
+            await asyncio.gather(self._runner, return_exceptions=True)
+
+        # Let handlers already running finish their writes before the
+        # database goes away.
+        if self._firing:
+            await asyncio.gather(*self._firing, return_exceptions=True)
+
+################################################################################
+    def get(self, kind: str, ref_id: int) -> Optional[ScheduledTask]:
+
+        return self._tasks.get((kind, ref_id))
+
+################################################################################
+    async def schedule(self, kind: str, ref_id: int, due_at: datetime) -> ScheduledTask:
+
+        assert kind in self._handlers, f"No scheduled task handler registered for '{kind}'."
+
+        task = self._tasks.get((kind, ref_id))
+        if task is not None and task.id is not None:
+            task._due_at = due_at.astimezone(timezone.utc)
+            self.bot.db.update.scheduled_task(task)
+        else:
+            data = await self.bot.db.insert.scheduled_task(kind, ref_id, due_at)
+            task = ScheduledTask(**data)
+
+        self._push(task)
+        return task
+
+################################################################################
+    def track(self, kind: str, ref_id: int, due_at: datetime) -> ScheduledTask:
+
+        assert kind in self._handlers, f"No scheduled task handler registered for '{kind}'."
+
+        task = ScheduledTask(kind=kind, ref_id=ref_id, due_at=due_at)
+        self._push(task)
+
+        return task
+
+################################################################################
+    def cancel(self, kind: str, ref_id: int) -> None:
+
+        # Its heap entry goes stale and is skipped when it surfaces.
+        task = self._tasks.pop((kind, ref_id), None)
+        if task is not None and task.id is not None:
+            self.bot.db.delete.scheduled_task(task.id)
+
+################################################################################
+    def _push(self, task: ScheduledTask) -> None:
+
+        self._tasks[task.key] = task
+        heapq.heappush(self._heap, (task.due_at, task.kind, task.ref_id))
+
+        # Only a new earliest deadline changes how long the runner sleeps.
+        if self._heap[0] == (task.due_at, task.kind, task.ref_id):
+            self._wake.set()
+
+################################################################################
+    async def _run(self) -> None:
+
+        while True:
+            if not self._heap:
+                self._wake.clear()
+                await self._wake.wait()
+                continue
+
+            due_at, kind, ref_id = self._heap[0]
+            delay = (due_at - datetime.now(timezone.utc)).total_seconds()
+            if delay > 0:
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self._heap)
+            task = self._tasks.get((kind, ref_id))
+            if task is None or task.due_at != due_at:
+                continue
+
+            # Untracked before firing so the handler is free to schedule a
+            # follow-up; the stored row stays until the handler is done.
+            del self._tasks[(kind, ref_id)]
+            fired = asyncio.create_task(self._fire(task))
+            self._firing.add(fired)
+            fired.add_done_callback(self._firing.discard)
+
+################################################################################
+    async def _fire(self, task: ScheduledTask) -> None:
+
+        handler = self._handlers.get(task.kind)
+        if handler is None:
+            log.warning(f"No handler for scheduled task {task.kind}:{task.ref_id}; dropping it.", None)
+            self._finish(task)
+            return
+
+        try:
+            await handler(task.ref_id)
+        except Exception as ex:
+            task._attempts += 1
+            # Cancelled, or replaced by a follow-up, while it was running.
+            superseded = task.key in self._tasks
+            if superseded or task._attempts >= self.MAX_ATTEMPTS:
+                log.error(f"Scheduled task {task.kind}:{task.ref_id} failed; giving up: {ex}", None)
+                self._finish(task)
+                return
+
+            delay = self.RETRY_DELAY * 2 ** (task._attempts - 1)
+            log.error(f"Scheduled task {task.kind}:{task.ref_id} failed; retrying in {delay}: {ex}", None)
+            task._due_at = datetime.now(timezone.utc) + delay
+            if task.id is not None:
+                self.bot.db.update.scheduled_task(task)
+            self._push(task)
+            return
+
+        self._finish(task)
+
+################################################################################
+    def _finish(self, task: ScheduledTask) -> None:
+
+        # A follow-up the handler scheduled has its own row (and key entry).
+        if task.id is not None:
+            self.bot.db.delete.scheduled_task(task.id)
+
+################################################################################
@@ -2,7 +2,17 @@ from .Bot import StaffPartyBot
 from .ChannelManager import ChannelManager
 from .GuildData import GuildData
 from .GuildManager import GuildManager
+from .MemberBatcher import MemberBatcher
+from .MemberAssets import MemberAssets
+from .ImageIngestor import ImageIngestor, ImageUpload, UploadedImage
+from .DepartureQueue import DepartureQueue
 from .SPBLogger import SPBLogger
+from .LogSink import LogSink, LogPriority
+from .DMFanout import DMFanout, DMBlast, BlastContent
+from .TaskScheduler import TaskScheduler, ScheduledTask
+from .PostFingerprints import PostFingerprints, PostFingerprint
 from .RoleManager import RoleManager
+from .ServiceRoleIndex import ServiceRoleIndex
 from .HelpMessage import HelpMessage
+from .StartupScheduler import StartupScheduler, StartupPhase
 ################################################################################
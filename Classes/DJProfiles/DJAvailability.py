@@ -25,7 +25,8 @@ class DJAvailability(Availability):
         "_start_hour",
         "_start_minute",
         "_end_hour",
-        "_end_minute"
+        "_end_minute",
+        "_bitmap",
     )
 
 ################################################################################
@@ -37,7 +38,7 @@ class DJAvailability(Availability):
 
 ################################################################################
     @classmethod
-    def new(
+    async def new(
         cls: Type[A],
         parent: DJProfile,
         day: Weekday,
@@ -47,7 +48,7 @@ class DJAvailability(Availability):
         end_minute: int
     ) -> A:
 
-        new_data = parent.bot.db.insert.dj_availability(
+        new_data = await parent.bot.db.insert.dj_availability(
             parent.id, day.value, start_hour, start_minute, end_hour, end_minute
         )
         return cls(parent=parent, **new_data)
@@ -104,12 +104,15 @@ class DJImageManager:
             title="Set DJ Logo",
             description="Please provide the image you want to set as your logo."
         )
-        image_url = await U.wait_for_image(interaction, prompt)
-        if image_url is None:
+        image = await U.wait_for_image(interaction, prompt)
+        if image is None:
             return
 
-        self.logo = image_url
-        await self._parent.update_post_components()
+        async def _apply(url: str) -> None:
+            self.logo = url
+            await self._parent.update_post_components()
+
+        image.then(_apply, slot=(id(self), "logo"))
 
 ################################################################################
     async def set_banner(self, interaction: Interaction) -> None:
@@ -118,12 +121,15 @@ class DJImageManager:
             title="Set Profile Banner",
             description="Please provide the image you want to set as your banner."
         )
-        image_url = await U.wait_for_image(interaction, prompt)
-        if image_url is None:
+        image = await U.wait_for_image(interaction, prompt)
+        if image is None:
             return
 
-        self.banner = image_url
-        await self._parent.update_post_components()
+        async def _apply(url: str) -> None:
+            self.banner = url
+            await self._parent.update_post_components()
+
+        image.then(_apply, slot=(id(self), "banner"))
 
 ################################################################################
     async def remove_thumbnail(self, interaction: Interaction) -> None:
@@ -1,14 +1,14 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional, Dict, List
+from typing import TYPE_CHECKING, Any, Optional, Dict
 
 from discord import Interaction, User, Embed, ForumChannel, Thread
 
-from Classes.Common import ObjectManager
+from Classes.Common import ObjectManager, IndexedCollection, EligibilityIndex
 from .DJProfile import DJProfile
 
 if TYPE_CHECKING:
-    from Classes import StaffPartyBot
+    from Classes import StaffPartyBot, StartupScheduler
     from UI.Common import FroggeView
 ################################################################################
 
@@ -17,32 +17,54 @@ __all__ = ("DJManager",)
 ################################################################################
 class DJManager(ObjectManager):
 
+    __slots__ = (
+        "_eligibility",
+    )
+
+################################################################################
     def __init__(self, state: StaffPartyBot) -> None:
 
         super().__init__(state)
 
+        # Unlike staff, DJs have to list a region to be matched at all.
+        self._eligibility: EligibilityIndex = EligibilityIndex(
+            DJProfile.eligibility_record,
+            any_region_if_empty=False
+        )
+
 ################################################################################
     async def load_all(self, payload: Dict[str, Any]) -> None:
 
-        self._managed = [DJProfile(self, **profile) for profile in payload["profiles"]]
+        profiles = []
+        async for chunk in payload["profiles"]:
+            profiles.extend(DJProfile(self, **profile) for profile in chunk)
+
+        self._managed.replace(profiles)
+        self._eligibility.rebuild(profiles)
 
 ################################################################################
-    async def finalize_load(self) -> None:
+    async def finalize_load(self, scheduler: StartupScheduler) -> None:
 
         for profile in self.profiles:
-            await profile.update_post_components()
+            scheduler.submit("DJ Profiles", profile.post_url, profile.update_post_components)
 
 ################################################################################
     def __getitem__(self, user_id: int) -> Optional[DJProfile]:
 
-        return next((profile for profile in self._managed if profile.id == int(user_id)), None)
+        return self._managed.get(int(user_id))
 
 ################################################################################
     @property
-    def profiles(self) -> List[DJProfile]:
+    def profiles(self) -> IndexedCollection[DJProfile]:
 
         return self._managed
 
+################################################################################
+    @property
+    def eligibility(self) -> EligibilityIndex:
+
+        return self._eligibility
+
 ################################################################################
     @property
     async def post_channel(self) -> Optional[ForumChannel]:
@@ -75,37 +97,38 @@ class DJManager(ObjectManager):
         pass
 
 ################################################################################
-    def get_profile(self, user_id: int) -> DJProfile:
+    async def get_profile(self, user_id: int) -> DJProfile:
 
-        for p in self._managed:
-            if p.id == int(user_id):
-                return p
+        if profile := self._managed.get(int(user_id)):
+            return profile
 
-        profile = DJProfile.new(self, user_id)
+        profile = await DJProfile.new(self, user_id)
         self._managed.append(profile)
+        self._eligibility.mark_dirty(profile)
 
         return profile
 
 ################################################################################
     async def user_menu(self, interaction: Interaction) -> None:
 
-        profile = self.get_profile(interaction.user.id)
+        profile = await self.get_profile(interaction.user.id)
         await profile.menu(interaction)
 
 ################################################################################
     async def on_member_leave(self, member) -> bool:
 
-        for profile in self._managed:
-            if profile.user_id == member.id:
-                post_message = await profile.post_message
-                try:
-                    if isinstance(post_message.channel, Thread):
-                        await post_message.channel.delete()
-                    else:
-                        await post_message.delete()
-                    return True
-                except:
-                    pass
+        profile = self._managed.get(member.id)
+        if profile is not None:
+            post_message = await profile.post_message
+            try:
+                if isinstance(post_message.channel, Thread):
+                    await post_message.channel.delete()
+                else:
+                    await post_message.delete()
+                self.bot.post_fingerprints.forget(post_message.id)
+                return True
+            except:
+                pass
 
         return False
 
@@ -19,7 +19,7 @@ from discord import (
 from discord.utils import MISSING
 
 from Assets import BotEmojis, BotImages
-from Classes.Common import ManagedObject, LazyUser, LazyMessage
+from Classes.Common import ManagedObject, LazyUser, LazyMessage, EligibilityRecord
 from Errors import InsufficientPermissions
 from UI.DJs import DJProfileStatusView
 from UI.Profiles import ProfileUserMuteView
@@ -94,9 +94,9 @@ class DJProfile(ManagedObject):
 
 ################################################################################
     @classmethod
-    def new(cls: Type[DJP], mgr: DJManager, user_id: int) -> DJP:
+    async def new(cls: Type[DJP], mgr: DJManager, user_id: int) -> DJP:
 
-        new_data = mgr.bot.db.insert.dj_profile(user_id=user_id)
+        new_data = await mgr.bot.db.insert.dj_profile(user_id=user_id)
         return cls(mgr, **new_data)
 
 ################################################################################
@@ -252,6 +252,7 @@ class DJProfile(ManagedObject):
     def post_message(self, value: Optional[Message]) -> None:
 
         self._post_message.set(value)
+        self._mgr.eligibility.mark_dirty(self)
 
     @property
     def post_url(self) -> Optional[str]:
@@ -268,6 +269,19 @@ class DJProfile(ManagedObject):
     def update(self) -> None:
 
         self.bot.db.update.dj_profile(self)
+        self._mgr.eligibility.mark_dirty(self)
+
+################################################################################
+    def eligibility_record(self) -> EligibilityRecord:
+
+        return EligibilityRecord(
+            self.user_id,
+            posted=self.post_url is not None,
+            nsfw=self.nsfw,
+            regions=self.regions,
+            genres=self.genres,
+            availability=self.availability
+        )
 
 ################################################################################
     def to_dict(self) -> Dict[str, Any]:
@@ -681,6 +695,7 @@ class DJProfile(ManagedObject):
         for i, a in enumerate(self._availability):
             if a.day == weekday:
                 self._availability.pop(i).delete()
+                self._mgr.eligibility.mark_dirty(self)
                 break
 
         if view.value is Hours.Unavailable:
@@ -733,7 +748,7 @@ class DJProfile(ManagedObject):
         end_utc   = end_with_tz.astimezone(ZoneInfo("UTC"))
 
         # 5) Store the UTC times
-        availability = DJAvailability.new(
+        availability = await DJAvailability.new(
             self,
             weekday,
             start_utc.hour,
@@ -742,6 +757,7 @@ class DJProfile(ManagedObject):
             end_utc.minute
         )
         self._availability.append(availability)
+        self._mgr.eligibility.mark_dirty(self)
 
         await self.update_post_components()
 
@@ -868,7 +884,7 @@ class DJProfile(ManagedObject):
         assert isinstance(post_message.channel, Thread)
 
         try:
-            await post_message.channel.edit(applied_tags=await self.get_tags())
+            await self.bot.post_fingerprints.edit_tags(post_message.channel, post_message.id, await self.get_tags())
         except NotFound:
             return False
         except HTTPException as ex:
@@ -907,7 +923,9 @@ class DJProfile(ManagedObject):
             self.bot.add_view(view, message_id=post_message.id)
 
         try:
-            await post_message.edit(
+            # Skipped entirely if the post already shows exactly this.
+            await self.bot.post_fingerprints.edit(
+                post_message,
                 embeds=embeds if update_embeds else MISSING,
                 view=view
             )
@@ -944,11 +962,11 @@ class DJProfile(ManagedObject):
         )
 
 ################################################################################
-    def venue_mute(self, venue: Venue) -> None:
+    async def venue_mute(self, venue: Venue) -> None:
 
         already_muted = venue.id in self._muted_venue_ids
         newly_muted = not already_muted
-        staff_profile = self.bot.profile_manager.get_profile(self.user_id)
+        staff_profile = await self.bot.profile_manager.get_profile(self.user_id)
 
         if newly_muted:
             self._muted_venue_ids.append(venue.id)
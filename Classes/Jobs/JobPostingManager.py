@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta, UTC
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Literal, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Literal, Set, Tuple, Union
 from zoneinfo import ZoneInfo
 
-from discord import Interaction, ForumChannel, ButtonStyle, EmbedField, SelectOption, User, ChannelType, Member
+from discord import Interaction, ForumChannel, ButtonStyle, EmbedField, SelectOption, User, ChannelType, Member, \
+    Message, Thread, RawMessageDeleteEvent, RawBulkMessageDeleteEvent
 
 from Enums import Month, Timezone, Position, MusicGenre
 from UI.Common import ConfirmCancelView, FroggeSelectView, BasicTextModal, FroggeMultiMenuSelect, TimeSelectView, \
@@ -12,15 +14,28 @@ from UI.Common import ConfirmCancelView, FroggeSelectView, BasicTextModal, Frogg
 from Utilities import Utilities as U
 from .PermanentJobPosting import PermanentJobPosting
 from .TemporaryJobPosting import TemporaryJobPosting
+from .ThreadMessageIndex import ThreadMessageIndex
 from .TraineeMessage import TraineeMessage
-from Classes.Common import RevisitTimer
+from Classes.Common.BlastContent import BlastContent
+from Classes.Common.IndexedCollection import IndexedCollection
 
 if TYPE_CHECKING:
-    from Classes import StaffPartyBot, Venue, Profile, Availability, VenueHours
+    from Classes import StaffPartyBot, StartupScheduler, Venue, TraineeMatch
 ################################################################################
 
 __all__ = ("JobPostingManager", )
 
+# How long after a permanent posting is picked up to check in with its poster.
+REVISIT_DELAY = timedelta(days=3)
+
+# Postings by venue, poster and candidate. A candidate can change after the
+# posting is added, so `reindex()` has to be called when it does.
+JOB_INDEXES = {
+    "venue_id": lambda j: (j._venue_id, ),
+    "user_id": lambda j: (j._user.id, ),
+    "candidate_id": lambda j: (j._candidate.id, ),
+}
+
 ################################################################################
 # noinspection PySimplifyBooleanCheck
 class JobPostingManager:
@@ -30,7 +45,8 @@ class JobPostingManager:
         "_temporary",
         "_permanent",
         "_trainee_msg",
-        "_revisits",
+        "_thread_index",
+        "_departing",
     )
 
 ################################################################################
@@ -38,25 +54,56 @@ class JobPostingManager:
 
         self._state: StaffPartyBot = state
 
-        self._temporary: List[TemporaryJobPosting] = []
-        self._permanent: List[PermanentJobPosting] = []
+        self._temporary: IndexedCollection[TemporaryJobPosting] = IndexedCollection(multi_indexes=JOB_INDEXES)
+        self._permanent: IndexedCollection[PermanentJobPosting] = IndexedCollection(multi_indexes=JOB_INDEXES)
         self._trainee_msg: TraineeMessage = TraineeMessage(state)
-        self._revisits: List[RevisitTimer] = []
+        self._thread_index: ThreadMessageIndex = ThreadMessageIndex()
+        # Postings being handled for a departure in the current batch.
+        self._departing: Set[Union[TemporaryJobPosting, PermanentJobPosting]] = set()
+
+        state.fanout.register("job_alert", self.job_alert_content)
+        state.scheduler.register("job_expiry", self.expire_posting)
+        state.scheduler.register("job_revisit", self.revisit_posting)
 
 ################################################################################
     async def load_all(self, payload: Dict[str, Any]) -> None:
 
-        self._temporary = [TemporaryJobPosting(self, **p) for p in payload["temporary_jobs"]]
-        self._permanent = [PermanentJobPosting(self, **p) for p in payload["permanent_jobs"]]
+        self._temporary.replace([
+            TemporaryJobPosting(self, **p)
+            async for chunk in payload["temporary_jobs"]
+            for p in chunk
+        ])
+        self._permanent.replace([
+            PermanentJobPosting(self, **p)
+            async for chunk in payload["permanent_jobs"]
+            for p in chunk
+        ])
+
+        self._trainee_msg.load(payload["trainee_message"])
+
+        for posting in self._temporary:
+            posting.schedule_expiry()
+
+        print("Loaded all job postings.")
+
+################################################################################
+    async def finalize_load(self, scheduler: StartupScheduler) -> None:
 
         for job in self.temporary_postings:
-            await job.update_post_components(False)
+            scheduler.submit("Temporary Jobs", job.post_url, job.update_post_components, False)
         for job in self.permanent_postings:
-            await job.update_post_components(False)
+            scheduler.submit("Permanent Jobs", job.post_url, job.update_post_components, False)
 
-        self._trainee_msg.load(payload["trainee_message"])
+        scheduler.submit("Temporary Job Threads", None, self._rebuild_thread_index)
 
-        print("Loaded all job postings.")
+################################################################################
+    async def _rebuild_thread_index(self) -> None:
+
+        temporary_jobs_channel = await self.temp_jobs_channel
+        if temporary_jobs_channel is None:
+            return
+
+        await self._thread_index.rebuild(temporary_jobs_channel.threads)
 
 ################################################################################
     @property
@@ -80,13 +127,54 @@ class JobPostingManager:
     @property
     def temporary_postings(self) -> List[TemporaryJobPosting]:
 
-        return self._temporary
+        return list(self._temporary)
 
 ################################################################################
     @property
     def permanent_postings(self) -> List[PermanentJobPosting]:
 
-        return self._permanent
+        return list(self._permanent)
+
+################################################################################
+    def get_temp_job(self, job_id: int) -> Optional[TemporaryJobPosting]:
+
+        return self._temporary.get(int(job_id))
+
+################################################################################
+    def get_perm_job(self, job_id: int) -> Optional[PermanentJobPosting]:
+
+        return self._permanent.get(int(job_id))
+
+################################################################################
+    def temp_jobs_for_venue(self, venue_id: int) -> List[TemporaryJobPosting]:
+
+        return self._temporary.lookup_all("venue_id", venue_id)
+
+################################################################################
+    def perm_jobs_for_venue(self, venue_id: int) -> List[PermanentJobPosting]:
+
+        return self._permanent.lookup_all("venue_id", venue_id)
+
+################################################################################
+    def jobs_posted_by(self, user_id: int) -> List[Union[TemporaryJobPosting, PermanentJobPosting]]:
+
+        return self._temporary.lookup_all("user_id", user_id) + self._permanent.lookup_all("user_id", user_id)
+
+################################################################################
+    def jobs_accepted_by(self, user_id: int) -> List[Union[TemporaryJobPosting, PermanentJobPosting]]:
+
+        return (
+            self._temporary.lookup_all("candidate_id", user_id)
+            + self._permanent.lookup_all("candidate_id", user_id)
+        )
+
+################################################################################
+    def reindex(self, posting: Union[TemporaryJobPosting, PermanentJobPosting]) -> None:
+
+        if isinstance(posting, TemporaryJobPosting):
+            self._temporary.reindex(posting)
+        else:
+            self._permanent.reindex(posting)
 
 ################################################################################
     async def temp_job_wizard(self, interaction: Interaction, v: Venue) -> None:
@@ -379,11 +467,12 @@ class JobPostingManager:
             genres = [MusicGenre(int(g)) for g in view.value]
 
         for pos, descr in pos_descriptions.items():
-            new_job = TemporaryJobPosting.new(
+            new_job = await TemporaryJobPosting.new(
                 self, v, interaction.user, pos, descr, salary,
                 start_dt, end_dt, genres, tz
             )
             self._temporary.append(new_job)
+            new_job.schedule_expiry()
 
             await new_job.create_post(inter)
             await inter.respond(
@@ -502,17 +591,58 @@ class JobPostingManager:
         if temporary_jobs_channel is None:
             return
 
-        for posting in self._temporary:
-            await posting.expiration_check()
-
         assert isinstance(temporary_jobs_channel, ForumChannel)
-        for thread in temporary_jobs_channel.threads:
-            count = 0
-            async for _ in thread.history():
-                count += 1
-            if count == 0:
+        for thread_id in self._thread_index.unverified_threads:
+            thread = temporary_jobs_channel.get_thread(thread_id)
+            if thread is None:
+                self._thread_index.discard(thread_id)
+                continue
+            await self._thread_index.probe(thread)
+
+        for thread_id in self._thread_index.empty_threads:
+            thread = temporary_jobs_channel.get_thread(thread_id)
+            self._thread_index.discard(thread_id)
+            if thread is not None:
                 await thread.delete()
 
+################################################################################
+    async def _is_temp_jobs_thread(self, channel: Any) -> bool:
+
+        if not isinstance(channel, Thread):
+            return False
+
+        temporary_jobs_channel = await self.temp_jobs_channel
+        return temporary_jobs_channel is not None and channel.parent_id == temporary_jobs_channel.id
+
+################################################################################
+    async def on_thread_create(self, thread: Thread) -> None:
+
+        if await self._is_temp_jobs_thread(thread):
+            self._thread_index.on_thread_create(thread.id)
+
+################################################################################
+    def on_thread_delete(self, thread_id: int) -> None:
+
+        self._thread_index.discard(thread_id)
+
+################################################################################
+    async def on_message(self, message: Message) -> None:
+
+        if await self._is_temp_jobs_thread(message.channel):
+            self._thread_index.on_message(message.channel.id)
+
+################################################################################
+    def on_message_delete(self, payload: RawMessageDeleteEvent) -> None:
+
+        self._thread_index.on_message_delete(payload.channel_id)
+
+################################################################################
+    def on_bulk_message_delete(self, payload: RawBulkMessageDeleteEvent) -> None:
+
+        # A purge arrives as one event; count each message it removed.
+        for _ in payload.message_ids:
+            self._thread_index.on_message_delete(payload.channel_id)
+
 ################################################################################
     async def perm_job_wizard(self, interaction: Interaction, v: Venue) -> None:
 
@@ -698,7 +828,7 @@ class JobPostingManager:
         salary = modal.value or None
 
         for pos, descr in pos_descriptions.items():
-            new_job = PermanentJobPosting.new(self, v, interaction.user, pos, descr, salary)
+            new_job = await PermanentJobPosting.new(self, v, interaction.user, pos, descr, salary)
             self._permanent.append(new_job)
 
             await new_job.create_post(inter)
@@ -714,115 +844,25 @@ class JobPostingManager:
             )
 
 ################################################################################
-    def _get_trainee_matches(self, venue: Venue, position: Position) -> Dict[Profile, int]:
+    async def job_alert_content(self, job_id: int) -> Optional[BlastContent]:
+
+        job = self._temporary.get(int(job_id))
+        if job is None:
+            return None
+
+        # Stop alerting once someone has taken the job.
+        return BlastContent(job.alert_embed(), active=lambda: not job.is_accepted)
+
+################################################################################
+    def _get_trainee_matches(self, venue: Venue, position: Position) -> List[TraineeMatch]:
         """
-        Returns a list of Profiles who want training for the given position,
-        are on the same data center, and have availability covering the venue's schedule.
-        Then also calculates a "compatibility percentage" based on comparing
-        the venue's RP level / tags to each profile's.
+        Returns the best-matching Profiles who want training for the given
+        position, share the venue's data center and have availability during
+        its hours, ranked by how closely their RP level and tags fit the venue.
         """
 
-        def matches_hours(avail: Availability, hours: VenueHours) -> bool:
-            """
-            Returns True if at least one hour of availability overlaps with the venue's open hours.
-            Supports crossing midnight (e.g., 15:00–03:00).
-            """
-
-            def to_minutes_with_wrap(start, end):
-                s = start.hour * 60 + start.minute
-                e = end.hour * 60 + end.minute
-                if e <= s:
-                    e += 1440  # Treat end as next day if it wraps past midnight
-                return s, e
-
-            avail_s, avail_e = to_minutes_with_wrap(avail.start_time, avail.end_time)
-            hrs_s, hrs_e = to_minutes_with_wrap(hours.start_time, hours.end_time)
-
-            # Find overlap in minutes
-            overlap_start = max(avail_s, hrs_s)
-            overlap_end = min(avail_e, hrs_e)
-            overlap_duration = overlap_end - overlap_start
-
-            return overlap_duration >= 60
-
-        # First, gather all profiles who want training (bot-side logic).
-        ret = self.bot.profile_manager.profiles_wanting_training()
-
-        # Filter out profiles that don't match position, data center, or schedule
-        # Note: removing from a list while iterating can be brittle.
-        #       A safer approach is to build a new list with the matches.
-        filtered = []
-        for profile in ret:
-            # 1) Must desire 'position'
-            if position not in profile.desired_trainings:
-                continue
-            # 2) Must share a data center with the venue
-            if not any(dc.contains(venue.location.data_center) for dc in profile.data_centers):
-                continue
-            # 3) Must have availability covering at least one of the venue's scheduled hours
-            if not any(matches_hours(avail, hours) for avail in profile.availability for hours in venue.schedule):
-                continue
-            # 4) NSFW preference must match venue's NSFW status
-            if venue.nsfw:
-                if not profile.nsfw_preference:
-                    continue
-
-            filtered.append(profile)
-            if len(filtered) >= 9: # Limit to 9 profiles for looks
-                break
-
-        # Make 'filtered' the final list
-        ret = filtered
-
-        # Start everyone at 100% compatibility
-        pct_dict = {profile: 100 for profile in ret}
-
-        # Compare RP Level & Tags to reduce or adjust the percentage
-        for profile in ret:
-            # 1) Compare RP Level
-            #    Let's assume your RP enum can be cast to an integer or has a .value attribute.
-            #    The bigger the difference in levels, the more we reduce compatibility.
-            #    For example: 0 difference => no penalty, difference of 4 => big penalty.
-            venue_rp_value = venue.rp_level.value  # e.g. integer from 0..4
-            profile_rp_value = profile.rp_level.value
-            rp_diff = abs(venue_rp_value - profile_rp_value)
-
-            # Simple penalty example: 10% penalty per difference in RP level
-            rp_penalty = 10 * rp_diff
-
-            # 2) Compare Tags
-            #    Suppose we do a simple overlap-based bonus or penalty.
-            #    Example: If the venue has "tags = ['Nightlife','18+','LGBTQ+']"
-            #    and the profile has "['Nightlife','Roleplay','All Ages']",
-            #    then the overlap is 1 out of the venue's 3 tags.
-            venue_tags = set(venue.tags)
-            profile_tags = set(profile.venue_tags)
-            overlap = venue_tags.intersection(profile_tags)
-
-            # Let's say for every missing venue tag, we take a penalty,
-            # or for every matched tag, we do no penalty.
-            # You can do something more complex or a small bonus for each match.
-            # Here, let's do a negative penalty for each mismatch:
-            total_venue_tags = len(venue_tags)
-            matched_tags = len(overlap)
-            missing_count = total_venue_tags - matched_tags
-
-            # For each missing tag, reduce 5% or so
-            tag_penalty = 5 * missing_count
-
-            # Combine the penalties.
-            # Alternatively, you could store them separately or do a more weighted approach.
-            total_penalty = rp_penalty + tag_penalty
-
-            # Apply the penalty to the existing 100% base (clamp at 0 if it goes negative).
-            new_pct = max(0, pct_dict[profile] - total_penalty)
-            pct_dict[profile] = new_pct
-
-        # Debug / check results:
-        for p, pct in pct_dict.items():
-            print(p.char_name, pct)
-
-        return pct_dict
+        # Limit to 9 profiles for looks
+        return self.bot.profile_manager.trainee_matcher.top_matches(venue, position, k=9)
 
 ################################################################################
     async def internship_wizard(self, interaction: Interaction, parent: Venue) -> None:
@@ -866,22 +906,22 @@ class JobPostingManager:
             ),
             fields=[
                 EmbedField(
-                    name=profile.char_name,
+                    name=m.profile.char_name,
                     value=(
-                        f"Match: {pct}%\n"
-                        f"[(View Profile)]({profile.post_url})\n"
+                        f"Match: {m.score}%\n"
+                        f"[(View Profile)]({m.profile.post_url})\n"
                     ),
                     inline=True
-                ) for profile, pct in matches.items()
+                ) for m in matches
             ]
         )
         options = [
             SelectOption(
-                label=profile.char_name,
-                value=str(profile.id),
-                description=f"Compatibility: {pct}%",
+                label=m.profile.char_name,
+                value=str(m.profile.id),
+                description=f"Compatibility: {m.score}%",
             )
-            for profile, pct in matches.items()
+            for m in matches
         ]
         view = FroggeSelectView(interaction.user, options, multi_select=True)
 
@@ -952,40 +992,50 @@ class JobPostingManager:
 ################################################################################
     async def on_member_leave(self, member: Member) -> Tuple[int, int]:
 
-        removed = 0
-        reopened = 0
-
-        for temp_job in self._temporary:
-            if temp_job._user.id == member.id:
-                await temp_job.poster_left()
-                removed += 1
-            elif temp_job._candidate.id == member.id:
-                await temp_job.cancel(None)
-                reopened += 1
+        # Look everything up and claim it before acting; handling a posting
+        # removes it from (or moves it within) the index, and other members
+        # of the same departure batch may share it.
+        posted = [j for j in self._temporary.lookup_all("user_id", member.id) if j not in self._departing]
+        # A posting whose poster has left too is deleted by the poster's
+        # cleanup, so there's nothing to cancel.
+        accepted = [
+            j for j in self._temporary.lookup_all("candidate_id", member.id)
+            if j not in posted
+            and j not in self._departing
+            and self.bot.SPB_GUILD.get_member(j._user.id) is not None
+        ]
+        permanent = [j for j in self._permanent.lookup_all("user_id", member.id) if j not in self._departing]
 
-        for perm_job in self._permanent:
-            if perm_job._user.id == member.id:
-                await perm_job.delete()
-                removed += 1
+        claimed = {*posted, *accepted, *permanent}
+        self._departing |= claimed
+        try:
+            await asyncio.gather(
+                *(job.poster_left() for job in posted),
+                *(job.cancel(None) for job in accepted),
+                *(job.delete() for job in permanent),
+            )
+        finally:
+            self._departing -= claimed
 
-        return removed, reopened
+        return len(posted) + len(permanent), len(accepted)
 
 ################################################################################
-    async def check_revisits(self):
+    async def expire_posting(self, job_id: int) -> None:
 
-        final = []
+        posting = self._temporary.get(job_id)
+        if posting is not None:
+            await posting.expiration_check()
 
-        for revisit in self._revisits:
-            if revisit.is_expired():
-                await revisit.context.revisit()
-            else:
-                final.append(revisit)
+################################################################################
+    async def revisit_posting(self, job_id: int) -> None:
 
-        self._revisits = final
+        posting = self._permanent.get(job_id)
+        if posting is not None:
+            await posting.revisit()
 
 ################################################################################
-    def register_revisit(self, posting: PermanentJobPosting, duration_sec: int = 30) -> None:  # 3 days
+    async def register_revisit(self, posting: PermanentJobPosting, delay: timedelta = REVISIT_DELAY) -> None:
 
-        self._revisits.append(RevisitTimer(posting, duration_sec))
+        await self.bot.scheduler.schedule("job_revisit", posting.id, datetime.now(UTC) + delay)
 
 ################################################################################
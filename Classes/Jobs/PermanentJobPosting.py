@@ -51,7 +51,7 @@ class PermanentJobPosting(Identifiable):
 
 ################################################################################
     @classmethod
-    def new(
+    async def new(
         cls: Type[PJP],
         mgr: JobPostingManager,
         venue: Venue,
@@ -61,7 +61,7 @@ class PermanentJobPosting(Identifiable):
         salary: Optional[str]
     ) -> PJP:
 
-        new_data = mgr.bot.db.insert.permanent_job(
+        new_data = await mgr.bot.db.insert.permanent_job(
             venue.id, user.id, position.value, descr, salary
         )
         return cls(mgr, **new_data)
@@ -146,6 +146,7 @@ class PermanentJobPosting(Identifiable):
     def candidate(self, value: Optional[User]) -> None:
 
         self._candidate.set(value)
+        self._mgr.reindex(self)
 
 ################################################################################
     @property
@@ -172,6 +173,7 @@ class PermanentJobPosting(Identifiable):
     async def delete(self) -> None:
 
         self.bot.db.delete.permanent_job(self.id)
+        self.bot.post_fingerprints.forget(self._post_msg.message_id)
 
         post_message = await self.post_message
         if post_message:
@@ -180,10 +182,7 @@ class PermanentJobPosting(Identifiable):
             except Exception as e:
                 print(e)
 
-        for i, timer in enumerate(self._mgr._revisits):
-            if timer.context == self:
-                self._mgr._revisits.pop(i)
-                break
+        self.bot.scheduler.cancel("job_revisit", self.id)
 
         self._mgr._permanent.remove(self)
 
@@ -341,8 +340,9 @@ class PermanentJobPosting(Identifiable):
             self.post_message = None
             return False
 
+        fingerprints = self.bot.post_fingerprints
         if update_status and not update_view:
-            await post_message.edit(embed=await self.compile())
+            await fingerprints.edit(post_message, embeds=[await self.compile()])
             return True
 
         view = JobPostingPickupView(self)
@@ -350,12 +350,13 @@ class PermanentJobPosting(Identifiable):
         msg_id = self._post_msg.id.split("/")[-1]
         self.bot.add_view(view, message_id=int(msg_id))
 
+        # Either edit is skipped if the post already shows exactly this.
         try:
             if update_view and not update_status:
-                await post_message.edit(view=view)
+                await fingerprints.edit(post_message, view=view)
                 pass
             else:
-                await post_message.edit(embed=await self.compile(), view=view)
+                await fingerprints.edit(post_message, embeds=[await self.compile()], view=view)
         except HTTPException as ex:
             if ex.code != 50083 and not _addl_attempt:
                 return False
@@ -440,7 +441,7 @@ class PermanentJobPosting(Identifiable):
             await interaction.respond(embed=error, ephemeral=True)
             return
 
-        profile = self.bot.profile_manager.get_profile(interaction.user.id)
+        profile = await self.bot.profile_manager.get_profile(interaction.user.id)
         if self.venue in profile.muted_venues:
             error = U.make_error(
                 title="Muted Venue",
@@ -491,7 +492,7 @@ class PermanentJobPosting(Identifiable):
             pass
 
         await self.bot.log.job_accepted(self)
-        self.register_revisit_timer()
+        await self.register_revisit_timer()
 
 ################################################################################
     async def _open_thread(self, interaction: Interaction) -> Optional[Thread]:
@@ -568,7 +569,7 @@ class PermanentJobPosting(Identifiable):
         if user in await self.venue.muted_users:
             return False
 
-        profile = self.bot.profile_manager.get_profile(user.id)
+        profile = await self.bot.profile_manager.get_profile(user.id)
         if self.venue in profile.muted_venues:
             return False
 
@@ -607,8 +608,8 @@ class PermanentJobPosting(Identifiable):
         await posting_user.send(embed=prompt, view=view)
 
 ################################################################################
-    def register_revisit_timer(self) -> None:
+    async def register_revisit_timer(self) -> None:
 
-        self._mgr.register_revisit(self)
+        await self._mgr.register_revisit(self)
 
 ################################################################################
\ No newline at end of file
@@ -15,8 +15,8 @@ from discord import (
 )
 
 from Assets import BotEmojis
-from Classes.Common import Identifiable, LazyUser, LazyMessage
-from Enums import Weekday, Position, MusicGenre, Timezone, Month, TimeType, Hours, Minutes
+from Classes.Common import Identifiable, LazyUser, LazyMessage, WeekBitmap
+from Enums import Position, MusicGenre, Timezone, Month, TimeType, Hours, Minutes
 from UI.Jobs import JobPostingPickupView, TemporaryJobPostingStatusView, JobTimeButtonsView, JobTimeComponentView
 from Utilities import Utilities as U
 from UI.Common import ConfirmCancelView, BasicTextModal, FroggeSelectView, FroggeMultiMenuSelect, TimeSelectView
@@ -77,7 +77,7 @@ class TemporaryJobPosting(Identifiable):
 
 ################################################################################
     @classmethod
-    def new(
+    async def new(
         cls: Type[JP],
         mgr: JobPostingManager,
         venue: Venue,
@@ -91,7 +91,7 @@ class TemporaryJobPosting(Identifiable):
         tz: Optional[ZoneInfo] = None
     ) -> JP:
 
-        new_data = mgr.bot.db.insert.temporary_job(
+        new_data = await mgr.bot.db.insert.temporary_job(
             venue_id=venue.id,
             user_id=user.id,
             position_id=position.value,
@@ -148,6 +148,7 @@ class TemporaryJobPosting(Identifiable):
     def candidate(self, value: Optional[User]) -> None:
 
         self._candidate.set(value)
+        self._mgr.reindex(self)
 
     @property
     def is_accepted(self) -> bool:
@@ -189,6 +190,15 @@ class TemporaryJobPosting(Identifiable):
 
         return self._start
 
+################################################################################
+    @property
+    def bitmap(self) -> WeekBitmap:
+
+        if self._start is None or self._end is None:
+            return WeekBitmap()
+
+        return WeekBitmap.from_window(self._start.weekday(), self._start.time(), self._end.time())
+
 ################################################################################
     def _set_schedule_impl(self, start: datetime, end: datetime) -> None:
 
@@ -196,6 +206,7 @@ class TemporaryJobPosting(Identifiable):
         self._end = end.astimezone(UTC)
         self._schedule_updated = True
         self.update()
+        self.schedule_expiry()
 
 ################################################################################
     @property
@@ -243,6 +254,8 @@ class TemporaryJobPosting(Identifiable):
     async def delete(self) -> None:
 
         self.bot.db.delete.temporary_job(self.id)
+        self.bot.scheduler.cancel("job_expiry", self.id)
+        self.bot.post_fingerprints.forget(self._post_msg.message_id)
 
         post_message = await self.post_message
         if post_message:
@@ -447,18 +460,20 @@ class TemporaryJobPosting(Identifiable):
             self.post_message = None
             return False
 
+        fingerprints = self.bot.post_fingerprints
         if update_status and not update_view:
-            await post_message.edit(embed=await self.compile())
+            await fingerprints.edit(post_message, embeds=[await self.compile()])
             return True
 
         view = JobPostingPickupView(self)
         self.bot.add_view(view, message_id=self._post_msg.id)
 
+        # Either edit is skipped if the post already shows exactly this.
         try:
             if update_view and not update_status:
-                await post_message.edit(view=view)
+                await fingerprints.edit(post_message, view=view)
             else:
-                await post_message.edit(embed=await self.compile(), view=view)
+                await fingerprints.edit(post_message, embeds=[await self.compile()], view=view)
         except HTTPException as ex:
             if ex.code != 50083 and not _addl_attempt:
                 return False
@@ -484,7 +499,7 @@ class TemporaryJobPosting(Identifiable):
         if user in await self.venue.muted_users:
             return False
 
-        profile = self.bot.profile_manager.get_profile(user.id)
+        profile = await self.bot.profile_manager.get_profile(user.id)
         if check_mutes:
             if self.venue in profile.muted_venues:
                 return False
@@ -511,13 +526,8 @@ class TemporaryJobPosting(Identifiable):
 
         # If comparing schedules, check if the user is available during the job's times
         if compare_schedule and check_profile:
-            job_day = Weekday(self._start.weekday())
-            for availability in profile.details.availability:
-                if availability.day == job_day:
-                    start_time, end_time = self._start.time(), self._end.time()
-                    if availability.contains(start_time, end_time):
-                        return True
-            return False  # If no matching availability was found
+            window = self.bitmap
+            return any(a.bitmap.contains(window) for a in profile.details.availability)
 
         # If not comparing schedules or none of the above conditions matched, the user is eligible
         return True
@@ -537,7 +547,7 @@ class TemporaryJobPosting(Identifiable):
         if user in await self.venue.muted_users:
             return False
 
-        profile = self.bot.dj_profile_manager.get_profile(user.id)
+        profile = await self.bot.dj_profile_manager.get_profile(user.id)
         # if self.venue in profile.muted_venues:
         if self.venue in []:
             return False
@@ -563,14 +573,8 @@ class TemporaryJobPosting(Identifiable):
 
         # If comparing schedules, check if the user is available during the job's times
         if compare_schedule and check_profile:
-            job_day = Weekday(self._start.weekday())
-            for availability in profile.availability:
-                if availability.day == job_day:
-                    start_time, end_time = self._start.time(), self._end.time()
-                    print(start_time, end_time)
-                    if availability.contains(start_time, end_time):
-                        return True
-            return False  # If no matching availability was found
+            window = self.bitmap
+            return any(a.bitmap.contains(window) for a in profile.availability)
 
         # If not comparing schedules or none of the above conditions matched, the user is eligible
         return True
@@ -599,7 +603,7 @@ class TemporaryJobPosting(Identifiable):
             await interaction.respond(embed=error, ephemeral=True)
             return
 
-        profile = self.bot.profile_manager.get_profile(interaction.user.id)
+        profile = await self.bot.profile_manager.get_profile(interaction.user.id)
         if self.venue in profile.muted_venues:
             error = U.make_error(
                 title="Muted Venue",
@@ -719,42 +723,47 @@ class TemporaryJobPosting(Identifiable):
         except Exception:
             pass
 
+################################################################################
+    def schedule_expiry(self) -> None:
+
+        # The end time is already stored on the posting, so this isn't persisted.
+        self.bot.scheduler.track("job_expiry", self.id, self._end)
+
 ################################################################################
     async def expiration_check(self) -> None:
 
-        if self._end.timestamp() <= datetime.now().timestamp():
+        if self._end <= datetime.now(UTC):
             await self.delete()
 
 ################################################################################
     async def notify_eligible_applicants(self) -> None:
 
+        # Candidates come straight out of the manager's eligibility index
+        # instead of awaiting is_*_eligible() for every profile.
+        criteria = dict(
+            data_center=self.venue.location.data_center,
+            nsfw_venue=self.venue.nsfw,
+            window=self.bitmap,
+            exclude=self.venue.muted_user_ids
+        )
         if self.is_dj_posting:
-            eligible = [
-                profile for profile in self.bot.dj_profile_manager.profiles
-                if await self.is_dj_eligible(
-                    user=await profile.user,
-                    compare_data_centers=True,
-                    compare_schedule=True,
-                    check_profile=True,
-                    check_nsfw=True,
-                    check_genres=self.genres
-                )
-            ]
+            index = self.bot.dj_profile_manager.eligibility
+            user_ids = index.query(genres=self.genres or None, **criteria)
         else:
-            eligible = [
-                profile for profile in self.bot.profile_manager.profiles
-                if await self.is_user_eligible(
-                    user=await profile.user,
-                    compare_data_centers=True,
-                    compare_schedule=True,
-                    check_profile=True,
-                    check_tags=True
-                )
-            ]
-        if not eligible:
-            return
+            index = self.bot.profile_manager.eligibility
+            user_ids = index.query(
+                venue_id=self.venue.id,
+                tags=self.venue.tags,
+                **criteria
+            )
+
+        # Sent in the background; see JobPostingManager.job_alert_content().
+        await self.bot.fanout.start("job_alert", self.id, sorted(user_ids))
+
+################################################################################
+    def alert_embed(self) -> Embed:
 
-        embed = U.make_embed(
+        return U.make_embed(
             title="Job Posting Alert",
             description=(
                 f"An opportunity has been posted for a `{self.position.proper_name}` position at "
@@ -763,12 +772,6 @@ class TemporaryJobPosting(Identifiable):
             )
         )
 
-        for profile in eligible:
-            try:
-                await (await profile.user).send(embed=embed)
-            except Exception:
-                continue
-
 ################################################################################
     def format(self, _name_override: Optional[str] = None, v_name: bool = True) -> str:
 
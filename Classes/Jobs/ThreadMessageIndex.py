@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Optional, Set
+
+if TYPE_CHECKING:
+    from discord import Thread
+################################################################################
+
+__all__ = ("ThreadMessageIndex", )
+
+################################################################################
+class ThreadMessageIndex:
+    """
+    Event-driven message-count index for the threads of a forum channel.
+
+    A count of ``None`` means the thread is known to be non-empty, but its
+    exact count is unknown (it was probed with ``limit=1``). Those threads are
+    re-probed the next time one of their messages is deleted. Threads with a
+    known count are tracked exactly from gateway events.
+    """
+
+    __slots__ = (
+        "_counts",
+        "_empty",
+        "_unverified",
+    )
+
+################################################################################
+    def __init__(self) -> None:
+
+        self._counts: Dict[int, Optional[int]] = {}
+        self._empty: Set[int] = set()
+        self._unverified: Set[int] = set()
+
+################################################################################
+    def __contains__(self, thread_id: int) -> bool:
+
+        return thread_id in self._counts
+
+################################################################################
+    def __len__(self) -> int:
+
+        return len(self._counts)
+
+################################################################################
+    @property
+    def empty_threads(self) -> List[int]:
+
+        return list(self._empty)
+
+################################################################################
+    @property
+    def unverified_threads(self) -> List[int]:
+
+        return list(self._unverified)
+
+################################################################################
+    async def rebuild(self, threads: List[Thread]) -> None:
+
+        self._counts.clear()
+        self._empty.clear()
+        self._unverified.clear()
+
+        for thread in threads:
+            await self.probe(thread)
+
+################################################################################
+    async def probe(self, thread: Thread) -> bool:
+        """Checks a thread for any message at all. Returns True if it is empty."""
+
+        has_message = False
+        async for _ in thread.history(limit=1):
+            has_message = True
+
+        self._unverified.discard(thread.id)
+        if has_message:
+            self._counts[thread.id] = None
+            self._empty.discard(thread.id)
+        else:
+            self._counts[thread.id] = 0
+            self._empty.add(thread.id)
+
+        return not has_message
+
+################################################################################
+    def on_thread_create(self, thread_id: int) -> None:
+
+        # A gateway MESSAGE_CREATE for the starter message may have been
+        # processed first, so never overwrite an existing entry.
+        if thread_id not in self._counts:
+            self._counts[thread_id] = None
+            self._unverified.add(thread_id)
+
+################################################################################
+    def on_message(self, thread_id: int) -> None:
+
+        count = self._counts.get(thread_id)
+        self._counts[thread_id] = count + 1 if count is not None else None
+        self._empty.discard(thread_id)
+
+################################################################################
+    def on_message_delete(self, thread_id: int) -> None:
+
+        if thread_id not in self._counts:
+            return
+
+        count = self._counts[thread_id]
+        if count is None:
+            self._unverified.add(thread_id)
+            return
+
+        count = max(0, count - 1)
+        self._counts[thread_id] = count
+        if count == 0:
+            self._empty.add(thread_id)
+
+################################################################################
+    def discard(self, thread_id: int) -> None:
+
+        self._counts.pop(thread_id, None)
+        self._empty.discard(thread_id)
+        self._unverified.discard(thread_id)
+
+################################################################################
@@ -2,4 +2,5 @@ from .TemporaryJobPosting import TemporaryJobPosting
 from .PermanentJobPosting import PermanentJobPosting
 from .JobPostingManager import JobPostingManager
 from .TraineeMessage import TraineeMessage
+from .ThreadMessageIndex import ThreadMessageIndex
 ################################################################################
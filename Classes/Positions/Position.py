@@ -41,9 +41,9 @@ class Position(ManagedObject):
 
 ################################################################################
     @classmethod
-    def new(cls: Type[P], mgr: PositionManager, name: str) -> P:
+    async def new(cls: Type[P], mgr: PositionManager, name: str) -> P:
 
-        new_data = mgr.bot.db.insert.position(name)
+        new_data = await mgr.bot.db.insert.position(name)
         return cls(mgr, new_data["id"], name=name)
 
 ################################################################################
@@ -219,7 +219,7 @@ class Position(ManagedObject):
         if not modal.complete:
             return
 
-        new_req = Requirement.new(self._mgr, self.id, modal.value)
+        new_req = await Requirement.new(self._mgr, self.id, modal.value)
         self._requirements.append(new_req)
 
 ################################################################################
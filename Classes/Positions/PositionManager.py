@@ -36,7 +36,7 @@ class PositionManager(ObjectManager):
 ################################################################################
     async def load_all(self, payload: Dict[str, Any]) -> None:
         
-        self._managed = [Position(self, **pos) for pos in payload["positions"]]
+        self._managed.replace(Position(self, **pos) for pos in payload["positions"])
         self._requirements = [Requirement(self, **req) for req in payload["global_requirements"]]
 
 ################################################################################
@@ -55,8 +55,7 @@ class PositionManager(ObjectManager):
     @property
     def positions(self) -> List[Position]:
 
-        self._managed.sort(key=lambda p: p.name)
-        return self._managed
+        return sorted(self._managed, key=lambda p: p.name)
 
 ################################################################################
     def select_options(self) -> List[SelectOption]:
@@ -131,7 +130,7 @@ class PositionManager(ObjectManager):
             await interaction.respond(embed=error, ephemeral=True)
             return
 
-        position = Position.new(self, pos_name)
+        position = await Position.new(self, pos_name)
         self._managed.append(position)
 
         await position.menu(interaction)
@@ -191,7 +190,7 @@ class PositionManager(ObjectManager):
         if not modal.complete:
             return
 
-        new_req = Requirement.new(self, None, modal.value)
+        new_req = await Requirement.new(self, None, modal.value)
         self._requirements.append(new_req)
 
 ################################################################################
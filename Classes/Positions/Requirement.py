@@ -36,9 +36,9 @@ class Requirement(Identifiable):
 
 ################################################################################
     @classmethod
-    def new(cls: Type[R], mgr: PositionManager, pos_id: Optional[int], text: str) -> R:
+    async def new(cls: Type[R], mgr: PositionManager, pos_id: Optional[int], text: str) -> R:
 
-        new_data = mgr.bot.db.insert.requirement(pos_id, text)
+        new_data = await mgr.bot.db.insert.requirement(pos_id, text)
         pos = mgr[pos_id] if pos_id else None
         return cls(mgr, new_data["id"], text=text, position=pos)
 
@@ -39,9 +39,9 @@ class AdditionalImage(Identifiable):
 
 ################################################################################
     @classmethod
-    def new(cls: Type[AI], parent: ProfileImages, url: str, caption: Optional[str]) -> AI:
+    async def new(cls: Type[AI], parent: ProfileImages, url: str, caption: Optional[str]) -> AI:
 
-        new_data = parent.bot.db.insert.additional_image(parent.profile_id, url, caption)
+        new_data = await parent.bot.db.insert.additional_image(parent.profile_id, url, caption)
         return cls(parent, **new_data)
 
 ################################################################################
@@ -2,10 +2,10 @@ from __future__ import annotations
 
 from zoneinfo import ZoneInfo
 from datetime import time, date, datetime, timedelta
-from typing import TYPE_CHECKING, List, Type, TypeVar, Union
+from typing import TYPE_CHECKING, List, Optional, Type, TypeVar, Union
 from zoneinfo import ZoneInfo
 
-from Classes.Common import Identifiable
+from Classes.Common import Identifiable, WeekBitmap
 from Enums import Weekday
 from Utilities import Utilities as U
 
@@ -26,7 +26,8 @@ class Availability(Identifiable):
         "_start_hour",
         "_start_minute",
         "_end_hour",
-        "_end_minute"
+        "_end_minute",
+        "_bitmap",
     )
 
 ################################################################################
@@ -46,9 +47,11 @@ class Availability(Identifiable):
         self._end_hour: int = kwargs.get("end_hour")
         self._end_minute: int = kwargs.get("end_minute")
 
+        self._bitmap: Optional[WeekBitmap] = None
+
 ################################################################################
     @classmethod
-    def new(
+    async def new(
         cls: Type[A],
         parent: Profile,
         day: Weekday,
@@ -58,7 +61,7 @@ class Availability(Identifiable):
         end_minute: int
     ) -> A:
 
-        new_data = parent.bot.db.insert.availability(
+        new_data = await parent.bot.db.insert.availability(
             parent.id, day.value, start_hour, start_minute, end_hour, end_minute
         )
         return cls(parent=parent, **new_data)
@@ -87,6 +90,15 @@ class Availability(Identifiable):
 
         return time(self._end_hour, self._end_minute)
 
+################################################################################
+    @property
+    def bitmap(self) -> WeekBitmap:
+
+        # Availability rows are replaced rather than edited, so build once.
+        if self._bitmap is None:
+            self._bitmap = WeekBitmap.from_window(self.day, self.start_time, self.end_time)
+        return self._bitmap
+
 ################################################################################
     @property
     def start_timestamp(self) -> str:
@@ -159,22 +171,11 @@ class Availability(Identifiable):
 ################################################################################
     def contains(self, range_start: time, range_end: time) -> bool:
         """
-        Returns True if [range_start, range_end] is fully contained within
-        [self.start_time, self.end_time], accounting for crossing midnight.
+        Returns True if [range_start, range_end] on this day is fully contained
+        within [self.start_time, self.end_time], accounting for crossing midnight.
         """
-        # Convert self's start & end to minutes from midnight
-        s = self.start_time.hour * 60 + self.start_time.minute
-        e = self.end_time.hour * 60 + self.end_time.minute
-        if e <= s:
-            e += 24 * 60  # crosses midnight
-
-        # Convert the range's start & end similarly
-        rs = range_start.hour * 60 + range_start.minute
-        re = range_end.hour * 60 + range_end.minute
-        if re <= rs:
-            re += 24 * 60  # crosses midnight
-
-        return s <= rs and e >= re
+
+        return self.bitmap.contains(WeekBitmap.from_window(self.day, range_start, range_end))
 
 ################################################################################
     @staticmethod
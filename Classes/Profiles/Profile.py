@@ -17,7 +17,7 @@ from discord import (
 from discord.utils import MISSING
 
 from Assets import BotEmojis, BotImages
-from Classes.Common import ManagedObject, LazyUser, LazyMessage
+from Classes.Common import ManagedObject, LazyUser, LazyMessage, EligibilityRecord
 from UI.Profiles import ProfileMainMenuView, ProfileUserMuteView
 from .ProfileMainInfo import ProfileMainInfo
 from .ProfileAtAGlance import ProfileAtAGlance
@@ -68,9 +68,9 @@ class Profile(ManagedObject):
 
 ################################################################################
     @classmethod
-    def new(cls: Type[P], mgr: ProfileManager, user_id: int) -> P:
+    async def new(cls: Type[P], mgr: ProfileManager, user_id: int) -> P:
 
-        new_data = mgr.bot.db.insert.profile(user_id)
+        new_data = await mgr.bot.db.insert.profile(user_id)
         return cls(mgr, **new_data)
 
 ################################################################################
@@ -142,6 +142,7 @@ class Profile(ManagedObject):
     def post_message(self, value: Optional[Message]) -> None:
 
         self._post_msg.set(value)
+        self._mgr.mark_dirty(self)
 
     @property
     def post_url(self) -> Optional[str]:
@@ -194,6 +195,7 @@ class Profile(ManagedObject):
     def update(self) -> None:
 
         self.bot.db.update.profile(self)
+        self._mgr.mark_dirty(self)
 
 ################################################################################
     def to_dict(self) -> Dict[str, Any]:
@@ -208,7 +210,23 @@ class Profile(ManagedObject):
     def delete(self) -> None:
 
         self.bot.db.delete.profile(self.id)
+        self.bot.post_fingerprints.forget(self._post_msg.message_id)
         self._mgr._managed.remove(self)
+        self._mgr.forget(self.user_id)
+
+################################################################################
+    def eligibility_record(self) -> EligibilityRecord:
+
+        return EligibilityRecord(
+            self.user_id,
+            posted=self.post_url is not None,
+            nsfw=self.nsfw_preference,
+            regions=self.data_centers,
+            tags=[t.proper_name for t in self._main_info.preferred_tags],
+            positions=self.details.positions,
+            muted_venue_ids=self._muted_venue_ids,
+            availability=self.availability
+        )
 
 ################################################################################
     def is_complete(self) -> bool:
@@ -520,7 +538,7 @@ class Profile(ManagedObject):
         assert isinstance(post_message.channel, Thread)
 
         try:
-            await post_message.channel.edit(applied_tags=await self.get_tags())
+            await self.bot.post_fingerprints.edit_tags(post_message.channel, post_message.id, await self.get_tags())
         except NotFound:
             return False
         except HTTPException as ex:
@@ -557,7 +575,9 @@ class Profile(ManagedObject):
         embeds = [main_profile, availability] + ([aboutme] if aboutme else [])
 
         try:
-            await post_message.edit(
+            # Skipped entirely if the post already shows exactly this.
+            await self.bot.post_fingerprints.edit(
+                post_message,
                 embeds=embeds if update_embeds else MISSING,
                 view=view if update_view else MISSING
             )
@@ -594,11 +614,11 @@ class Profile(ManagedObject):
         )
 
 ################################################################################
-    def mute_venue(self, venue: Venue) -> bool:
+    async def mute_venue(self, venue: Venue) -> bool:
 
         already_muted = venue.id in self._muted_venue_ids
         newly_muted = not already_muted
-        dj_profile = self.bot.dj_profile_manager.get_profile(self.user_id)
+        dj_profile = await self.bot.dj_profile_manager.get_profile(self.user_id)
 
         if newly_muted:
             self._muted_venue_ids.append(venue.id)
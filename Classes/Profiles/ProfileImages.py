@@ -26,7 +26,8 @@ class ProfileImages(ProfileSection):
         "_thumbnail",
         "_main_image",
         "_additional",
-        "_adding"
+        "_adding",
+        "_uploading",
     )
 
     MAX_ADDITIONAL_IMAGES: int = 3
@@ -42,6 +43,8 @@ class ProfileImages(ProfileSection):
             AdditionalImage(self, **a) for a in kwargs.get("additional_images", [])
         ]
         self._adding: bool = False
+        # Additional images accepted but still uploading
+        self._uploading: int = 0
 
 ################################################################################
     @property
@@ -248,18 +251,23 @@ class ProfileImages(ProfileSection):
         )
 
         if image := await U.wait_for_image(interaction, prompt):
-            if image_type == "Thumbnail":
-                self.thumbnail = image
-            else:
-                self.main_image = image
+            async def _apply(url: str) -> None:
+                if image_type == "Thumbnail":
+                    self.thumbnail = url
+                else:
+                    self.main_image = url
+                await self.update_post_components()
+
+            image.then(_apply, slot=(id(self), image_type))
 
-        await self.update_post_components()
         self._adding = False
 
 ################################################################################
     async def add_additional_image(self, interaction: Interaction) -> None:
 
-        if len(self._additional) >= self.MAX_ADDITIONAL_IMAGES:
+        # Uploads still in flight hold their slot, so the limit can't be
+        # overshot by adding images faster than they upload.
+        if len(self._additional) + self._uploading >= self.MAX_ADDITIONAL_IMAGES:
             error = MaxItemsReached("Additional Images", self.MAX_ADDITIONAL_IMAGES)
             await interaction.respond(embed=error, ephemeral=True)
             return
@@ -281,9 +289,21 @@ class ProfileImages(ProfileSection):
         )
 
         if image := await U.wait_for_image(interaction, prompt, U.DumpMethod.Cloudinary):
-            self._additional.append(AdditionalImage.new(self, image, None))
+            self._uploading += 1
+
+            async def _apply(url: str) -> None:
+                try:
+                    self._additional.append(await AdditionalImage.new(self, url, None))
+                finally:
+                    self._uploading -= 1
+                await self.update_post_components()
+
+            async def _release() -> None:
+                self._uploading -= 1
+
+            image.then(_apply)
+            image.on_failure(_release)
 
-        await self.update_post_components()
         self._adding = False
 
 ################################################################################
@@ -559,6 +559,7 @@ class ProfileMainInfo(ProfileSection):
         for i, a in enumerate(self._availability):
             if a.day == weekday:
                 self._availability.pop(i).delete()
+                self.bot.profile_manager.mark_dirty(self.parent)
                 break
 
         if view.value is Hours.Unavailable:
@@ -620,7 +621,7 @@ class ProfileMainInfo(ProfileSection):
         end_utc   = end_with_tz.astimezone(ZoneInfo("UTC"))
 
         # 5) Store the UTC times
-        availability = Availability.new(
+        availability = await Availability.new(
             self.parent,
             weekday,
             start_utc.hour,
@@ -629,6 +630,7 @@ class ProfileMainInfo(ProfileSection):
             end_utc.minute
         )
         self._availability.append(availability)
+        self.bot.profile_manager.mark_dirty(self.parent)
 
         await self.update_post_components()
 
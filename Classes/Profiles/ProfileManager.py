@@ -4,11 +4,12 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from discord import Interaction, User, Embed, ForumChannel, Member, Thread
 
-from Classes.Common import ObjectManager
+from Classes.Common import ObjectManager, IndexedCollection, EligibilityIndex
 from .Profile import Profile
+from .TraineeMatcher import TraineeMatcher
 
 if TYPE_CHECKING:
-    from Classes import StaffPartyBot
+    from Classes import StaffPartyBot, StartupScheduler
     from UI.Common import FroggeView
 ################################################################################
 
@@ -17,20 +18,39 @@ __all__ = ("ProfileManager", )
 ################################################################################
 class ProfileManager(ObjectManager):
 
+    __slots__ = (
+        "_eligibility",
+        "_trainee_matcher",
+    )
+
+################################################################################
     def __init__(self, state: StaffPartyBot) -> None:
 
         super().__init__(state)
 
+        # Profiles without regions are open to any data center.
+        self._eligibility: EligibilityIndex = EligibilityIndex(
+            Profile.eligibility_record,
+            any_region_if_empty=True
+        )
+        self._trainee_matcher: TraineeMatcher = TraineeMatcher()
+
 ################################################################################
     async def load_all(self, payload: Dict[str, Any]) -> None:
 
-        self._managed = [Profile(self, **p) for p in payload["profiles"]]
+        profiles = []
+        async for chunk in payload["profiles"]:
+            profiles.extend(Profile(self, **p) for p in chunk)
+
+        self._managed.replace(profiles)
+        self._eligibility.rebuild(profiles)
+        self._trainee_matcher.rebuild(profiles)
 
 ################################################################################
-    async def finalize_load(self) -> None:
+    async def finalize_load(self, scheduler: StartupScheduler) -> None:
 
         for profile in self.profiles:
-            await profile.update_post_components()
+            scheduler.submit("Profiles", profile.post_url, profile.update_post_components)
 
 ################################################################################
     @property
@@ -40,10 +60,35 @@ class ProfileManager(ObjectManager):
 
 ################################################################################
     @property
-    def profiles(self) -> List[Profile]:
+    def profiles(self) -> IndexedCollection[Profile]:
 
         return self._managed
 
+################################################################################
+    @property
+    def eligibility(self) -> EligibilityIndex:
+
+        return self._eligibility
+
+################################################################################
+    @property
+    def trainee_matcher(self) -> TraineeMatcher:
+
+        return self._trainee_matcher
+
+################################################################################
+    def mark_dirty(self, profile: Profile) -> None:
+        """Queues the profile for re-indexing after it changes."""
+
+        self._eligibility.mark_dirty(profile)
+        self._trainee_matcher.mark_dirty(profile)
+
+################################################################################
+    def forget(self, user_id: int) -> None:
+
+        self._eligibility.remove(user_id)
+        self._trainee_matcher.remove(user_id)
+
 ################################################################################
     async def status(self) -> Embed:
 
@@ -70,37 +115,38 @@ class ProfileManager(ObjectManager):
         pass
 
 ################################################################################
-    def get_profile(self, user_id: int) -> Profile:
+    async def get_profile(self, user_id: int) -> Profile:
 
-        for p in self._managed:
-            if p.user_id == user_id:
-                return p
+        if profile := self._managed.get(user_id):
+            return profile
 
-        profile = Profile.new(self, user_id)
+        profile = await Profile.new(self, user_id)
         self._managed.append(profile)
+        self.mark_dirty(profile)
 
         return profile
 
 ################################################################################
     async def user_menu(self, interaction: Interaction) -> None:
 
-        profile = self.get_profile(interaction.user.id)
+        profile = await self.get_profile(interaction.user.id)
         await profile.menu(interaction)
 
 ################################################################################
     async def on_member_leave(self, member: Member) -> bool:
 
-        for profile in self._managed:
-            if profile.user_id == member.id:
-                post_message = await profile.post_message
-                try:
-                    if isinstance(post_message.channel, Thread):
-                        await post_message.channel.delete()
-                    else:
-                        await post_message.delete()
-                    return True
-                except:
-                    pass
+        profile = self._managed.get(member.id)
+        if profile is not None:
+            post_message = await profile.post_message
+            try:
+                if isinstance(post_message.channel, Thread):
+                    await post_message.channel.delete()
+                else:
+                    await post_message.delete()
+                self.bot.post_fingerprints.forget(post_message.id)
+                return True
+            except:
+                pass
 
         return False
 
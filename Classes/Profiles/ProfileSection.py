@@ -73,6 +73,7 @@ class ProfileSection(ABC):
     def update(self) -> None:
 
         self.bot.db.update.profile(self)
+        self.bot.profile_manager.mark_dirty(self._parent)
 
 ################################################################################
     @abstractmethod
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import heapq
+from typing import TYPE_CHECKING, Dict, Iterable, List, NamedTuple, Tuple
+
+from Classes.Common import WeekBitmap
+from Enums import DataCenter, Position, VenueTag
+
+if TYPE_CHECKING:
+    from Classes import Profile, Venue
+################################################################################
+
+__all__ = ("TraineeMatcher", "TraineeMatch")
+
+# Venues store their tags by display name.
+_TAG_BITS: Dict[str, int] = {t.proper_name: 1 << t.value for t in VenueTag}
+
+RP_PENALTY = 10    # Per level of RP difference
+TAG_PENALTY = 5    # Per venue tag the profile doesn't list
+MIN_OVERLAP = 60   # Minutes one availability window must share with one of the venue's hours
+
+################################################################################
+class TraineeMatch(NamedTuple):
+
+    profile: Profile
+    score: int
+    rp_penalty: int
+    tag_penalty: int
+    matched_tags: int
+    overlap_minutes: int
+
+################################################################################
+class _Features(NamedTuple):
+
+    trainings: int
+    data_centers: int
+    nsfw: bool
+    rp_level: int
+    tags: int
+    availability: int
+    # Each availability window on its own, for the per-window overlap check
+    windows: Tuple[int, ...]
+
+################################################################################
+class TraineeMatcher:
+    """
+    Ranks profiles that want training against a venue. Each profile is
+    reduced to integer features once (bitmasks for trainings, data centers,
+    tags and weekly availability) and re-reduced only after it changes, so
+    scoring every candidate is a flat pass of bitwise operations feeding a
+    bounded top-k heap.
+    """
+
+    __slots__ = (
+        "_features",
+        "_dirty",
+    )
+
+################################################################################
+    def __init__(self) -> None:
+
+        self._features: Dict[int, Tuple[Profile, _Features]] = {}
+        self._dirty: Dict[int, Profile] = {}
+
+################################################################################
+    def rebuild(self, profiles: Iterable[Profile]) -> None:
+
+        self._features.clear()
+        self._dirty.clear()
+
+        for profile in profiles:
+            self._add(profile)
+
+################################################################################
+    def mark_dirty(self, profile: Profile) -> None:
+
+        self._dirty[profile.user_id] = profile
+
+################################################################################
+    def remove(self, user_id: int) -> None:
+
+        self._dirty.pop(user_id, None)
+        self._features.pop(user_id, None)
+
+################################################################################
+    def _flush(self) -> None:
+
+        if not self._dirty:
+            return
+
+        dirty, self._dirty = self._dirty, {}
+        for profile in dirty.values():
+            self._add(profile)
+
+################################################################################
+    def _add(self, profile: Profile) -> None:
+
+        # Only posted profiles asking for training are ever candidates.
+        if not profile.desired_trainings or profile.post_url is None:
+            self._features.pop(profile.user_id, None)
+            return
+
+        self._features[profile.user_id] = (profile, self.features(profile))
+
+################################################################################
+    @staticmethod
+    def features(profile: Profile) -> _Features:
+
+        data_centers = 0
+        for region in profile.data_centers:
+            for dc in DataCenter:
+                if region.contains(dc):
+                    data_centers |= 1 << dc.value
+
+        return _Features(
+            trainings=_mask(p.value for p in profile.desired_trainings),
+            data_centers=data_centers,
+            nsfw=profile.nsfw_preference,
+            rp_level=profile.rp_level.value if profile.rp_level is not None else 0,
+            tags=_mask(t.value for t in profile.venue_tags),
+            availability=WeekBitmap.union(a.bitmap for a in profile.availability).bits,
+            windows=tuple(a.bitmap.bits for a in profile.availability),
+        )
+
+################################################################################
+    def top_matches(self, venue: Venue, position: Position, k: int) -> List[TraineeMatch]:
+        """
+        Returns the `k` best-scoring profiles that want training for
+        `position`, cover the venue's data center, accept its NSFW setting and
+        have an availability window sharing at least `MIN_OVERLAP` minutes
+        with one of the venue's scheduled hours. Ranked by score, then total
+        overlap minutes.
+        """
+
+        self._flush()
+
+        want = 1 << position.value
+        dc = venue.location.data_center
+        dc_bit = 1 << dc.value if dc is not None else 0
+        nsfw = venue.nsfw
+        rp_level = venue.rp_level.value if venue.rp_level is not None else 0
+        venue_tags = 0
+        for tag in venue.tags:
+            venue_tags |= _TAG_BITS.get(tag, 0)
+        total_tags = venue_tags.bit_count()
+        windows = [h.bitmap.bits for h in venue.schedule]
+        hours = WeekBitmap.union(h.bitmap for h in venue.schedule).bits
+
+        heap: List[Tuple[int, int, int, int, int, int]] = []
+        for user_id, (_, f) in self._features.items():
+            if not f.trainings & want or not f.data_centers & dc_bit:
+                continue
+            if nsfw and not f.nsfw:
+                continue
+            overlap = (f.availability & hours).bit_count()
+            if overlap < MIN_OVERLAP:
+                continue
+            # Slivers of overlap spread across windows don't add up to a match.
+            if not any((a & h).bit_count() >= MIN_OVERLAP for a in f.windows for h in windows):
+                continue
+
+            rp_penalty = RP_PENALTY * abs(rp_level - f.rp_level) if rp_level and f.rp_level else 0
+            matched = (f.tags & venue_tags).bit_count()
+            tag_penalty = TAG_PENALTY * (total_tags - matched)
+            score = max(0, 100 - rp_penalty - tag_penalty)
+
+            # Lower user ids win ties so results are stable between calls.
+            entry = (score, overlap, -user_id, rp_penalty, tag_penalty, matched)
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+
+        return [
+            TraineeMatch(
+                profile=self._features[-neg_id][0],
+                score=score,
+                rp_penalty=rp_penalty,
+                tag_penalty=tag_penalty,
+                matched_tags=matched,
+                overlap_minutes=overlap,
+            )
+            for score, overlap, neg_id, rp_penalty, tag_penalty, matched
+            in sorted(heap, reverse=True)
+        ]
+
+################################################################################
+def _mask(bits: Iterable[int]) -> int:
+
+    ret = 0
+    for b in bits:
+        ret |= 1 << b
+
+    return ret
+
+################################################################################
@@ -3,6 +3,7 @@ from .ProfileManager import ProfileManager
 from .ProfileMainInfo import ProfileMainInfo
 from .ProfileSection import ProfileSection
 from .Availability import Availability
+from .TraineeMatcher import TraineeMatcher, TraineeMatch
 from .ProfileAtAGlance import ProfileAtAGlance
 from .ProfileImages import ProfileImages
 from .ProfilePersonality import ProfilePersonality
@@ -0,0 +1,127 @@
+"""
+Times `TraineeMatcher.top_matches` over a set of synthetic profiles against
+the straightforward approach of filtering and scoring every profile from its
+attributes and sorting the lot, and checks both return the same ranking.
+
+    python -m Classes.Profiles._benchmark_trainee_matches [--profiles 10000] [--venues 100]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from datetime import time as dt_time
+from types import SimpleNamespace
+from typing import Any, List, Tuple
+
+from Classes.Common import WeekBitmap
+from Enums import DataCenter, Position, RPLevel, VenueTag, Weekday, XIVRegion
+from .TraineeMatcher import MIN_OVERLAP, RP_PENALTY, TAG_PENALTY, TraineeMatcher
+################################################################################
+
+K = 9
+
+################################################################################
+def _window(rng: random.Random) -> SimpleNamespace:
+
+    day = rng.choice(list(Weekday))
+    start = dt_time(rng.randrange(24), rng.choice((0, 30)))
+    end = dt_time(rng.randrange(24), rng.choice((0, 30)))
+
+    return SimpleNamespace(bitmap=WeekBitmap.from_window(day, start, end))
+
+################################################################################
+def _profile(rng: random.Random, user_id: int) -> Any:
+
+    return SimpleNamespace(
+        user_id=user_id,
+        post_url="https://discord.com/channels/1/2/3",
+        desired_trainings=rng.sample(list(Position), rng.randint(1, 3)),
+        data_centers=rng.sample(list(XIVRegion), rng.randint(1, 2)),
+        nsfw_preference=rng.random() < 0.5,
+        rp_level=rng.choice(list(RPLevel)),
+        venue_tags=rng.sample(list(VenueTag), rng.randint(0, 6)),
+        availability=[_window(rng) for _ in range(rng.randint(1, 5))],
+    )
+
+################################################################################
+def _venue(rng: random.Random) -> Any:
+
+    return SimpleNamespace(
+        location=SimpleNamespace(data_center=rng.choice(list(DataCenter))),
+        nsfw=rng.random() < 0.3,
+        rp_level=rng.choice(list(RPLevel)),
+        tags=[t.proper_name for t in rng.sample(list(VenueTag), rng.randint(1, 5))],
+        schedule=[_window(rng) for _ in range(rng.randint(1, 4))],
+    )
+
+################################################################################
+def _naive(profiles: List[Any], venue: Any, position: Position) -> List[Tuple[int, int, int]]:
+
+    hours = WeekBitmap.union(h.bitmap for h in venue.schedule)
+    venue_tags = set(venue.tags)
+
+    scored = []
+    for p in profiles:
+        if position not in p.desired_trainings:
+            continue
+        if not any(r.contains(venue.location.data_center) for r in p.data_centers):
+            continue
+        if venue.nsfw and not p.nsfw_preference:
+            continue
+        if not any(
+            a.bitmap.overlaps_at_least(h.bitmap, MIN_OVERLAP)
+            for a in p.availability
+            for h in venue.schedule
+        ):
+            continue
+        overlap = WeekBitmap.union(a.bitmap for a in p.availability).overlap_minutes(hours)
+
+        rp_penalty = RP_PENALTY * abs(venue.rp_level.value - p.rp_level.value)
+        matched = len(venue_tags & {t.proper_name for t in p.venue_tags})
+        score = max(0, 100 - rp_penalty - TAG_PENALTY * (len(venue_tags) - matched))
+        scored.append((score, overlap, -p.user_id))
+
+    scored.sort(reverse=True)
+    return scored[:K]
+
+################################################################################
+def main() -> None:
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--profiles", type=int, default=10_000)
+    parser.add_argument("--venues", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    profiles = [_profile(rng, i) for i in range(1, args.profiles + 1)]
+    queries = [(_venue(rng), rng.choice(list(Position))) for _ in range(args.venues)]
+
+    start = time.perf_counter()
+    matcher = TraineeMatcher()
+    matcher.rebuild(profiles)  # type: ignore
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = [_naive(profiles, venue, position) for venue, position in queries]
+    naive = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = [matcher.top_matches(venue, position, K) for venue, position in queries]  # type: ignore
+    ranked = time.perf_counter() - start
+
+    actual = [[(m.score, m.overlap_minutes, -m.profile.user_id) for m in r] for r in results]
+    if actual != expected:
+        raise SystemExit("Matcher results differ from the naive ranking!")
+
+    print(f"{args.profiles} profiles, {args.venues} venues, top {K}")
+    print(f"  feature build:   {build * 1000:8.1f} ms")
+    print(f"  naive ranking:   {naive / args.venues * 1000:8.3f} ms/venue")
+    print(f"  top_matches:     {ranked / args.venues * 1000:8.3f} ms/venue")
+
+################################################################################
+if __name__ == "__main__":
+    main()
+
+################################################################################
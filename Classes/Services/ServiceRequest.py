@@ -53,7 +53,7 @@ class ServiceRequest(ManagedObject):
 
 ################################################################################
     @classmethod
-    def new(
+    async def new(
         cls: Type[SR],
         mgr: ServicesManager,
         user: User,
@@ -64,7 +64,7 @@ class ServiceRequest(ManagedObject):
     ) -> SR:
 
         dc_value = dc.value if dc else None
-        new_obj = mgr.bot.db.insert.service_request(user.id, service.value, dc_value, description, budget)
+        new_obj = await mgr.bot.db.insert.service_request(user.id, service.value, dc_value, description, budget)
         return cls(
             mgr,
             new_obj["id"],
@@ -119,6 +119,7 @@ class ServiceRequest(ManagedObject):
     def candidate(self, value: Optional[User]) -> None:
 
         self._candidate.set(value)
+        self._mgr._managed.reindex(self)
 
     @property
     def is_accepted(self) -> bool:
@@ -161,6 +162,11 @@ class ServiceRequest(ManagedObject):
         self._messages = [LazyMessage(self, msg.jump_url) for msg in value]
         self.update()
 
+    def add_blast_message(self, message: Message) -> None:
+
+        self._messages.append(LazyMessage(self, message.jump_url))
+        self.update()
+
 ################################################################################
     @property
     async def post_message(self) -> Optional[Message]:
@@ -172,6 +178,20 @@ class ServiceRequest(ManagedObject):
 
         self._post_message.set(value)
 
+################################################################################
+    @property
+    def post_url(self) -> Optional[str]:
+
+        return self._post_message.url
+
+################################################################################
+    async def finalize_load(self) -> None:
+
+        # The blast refresh and the post edit touch the same request, so
+        # they run in order.
+        await self.refresh()
+        await self.update_post_components()
+
 ################################################################################
     def update(self) -> None:
 
@@ -194,6 +214,8 @@ class ServiceRequest(ManagedObject):
     def delete(self) -> None:
 
         self.bot.db.delete.service_request(self.id)
+        self.bot.scheduler.cancel("service_revisit", self.id)
+        self.bot.post_fingerprints.forget(self._post_message.message_id)
         self._mgr._managed.remove(self)
 
 ################################################################################
@@ -371,8 +393,8 @@ class ServiceRequest(ManagedObject):
 ################################################################################
     async def submit(self, interaction: Interaction) -> bool:
 
-        roles = [r for r in interaction.guild.roles if r.name == self.service_type.proper_name]
-        if not roles:
+        role_mgr = self.bot.role_manager
+        if role_mgr.service_role(self.service_type) is None:
             await interaction.respond(
                 embed=U.make_error(
                     title="Role Not Found",
@@ -383,18 +405,10 @@ class ServiceRequest(ManagedObject):
             )
             return False
 
-        assert len(roles) == 1, f"Multiple roles found for service type: {self.service_type.proper_name}, this should not happen."
-
-        role = roles[0]
-        messages = []
-        for member in interaction.guild.members:
-            if member == interaction.user:
-                continue
-            if role in member.roles:
-                view = ServiceRequestAcceptView(self)
-                messages.append(await member.send(embed=await self.blast_message(), view=view))
-
-        self.blast_messages = messages
+        recipients = role_mgr.service_member_ids(self.service_type)
+        recipients.discard(interaction.user.id)
+        # DMs go out in the background; see ServicesManager.blast_content().
+        await self.bot.fanout.start("service_request", self.id, sorted(recipients))
 
         post_channel = await self.bot.channel_manager.services_channel
         if post_channel is None:
@@ -499,7 +513,7 @@ class ServiceRequest(ManagedObject):
         self.blast_messages = []
         await self.update_post_components(True)
 
-        self.register_revisit_timer()
+        await self.register_revisit_timer()
 
 ################################################################################
     async def decline(self, interaction: Interaction) -> None:
@@ -531,18 +545,20 @@ class ServiceRequest(ManagedObject):
             self.post_message = None
             return False
 
+        fingerprints = self.bot.post_fingerprints
         if update_status and not update_view:
-            await post_message.edit(embed=await self.compile())
+            await fingerprints.edit(post_message, embeds=[await self.compile()])
             return True
 
         view = ServiceRequestPickupView(self)
         self.bot.add_view(view, message_id=self._post_message.id)
 
+        # Either edit is skipped if the post already shows exactly this.
         try:
             if update_view and not update_status:
-                await post_message.edit(view=view)
+                await fingerprints.edit(post_message, view=view)
             else:
-                await post_message.edit(embed=await self.compile(), view=view)
+                await fingerprints.edit(post_message, embeds=[await self.compile()], view=view)
         except HTTPException as ex:
             if ex.code != 50083 and not _addl_attempt:
                 return False
@@ -644,9 +660,9 @@ class ServiceRequest(ManagedObject):
         return True
 
 ################################################################################
-    def register_revisit_timer(self) -> None:
+    async def register_revisit_timer(self) -> None:
 
-        self._mgr.register_revisit(self)  # type: ignore
+        await self._mgr.register_revisit(self)  # type: ignore
 
 ################################################################################
     async def revisit(self) -> None:
@@ -1,55 +1,59 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List
+from datetime import datetime, timedelta, UTC
+from typing import TYPE_CHECKING, Any, List, Optional
 
 from discord import Interaction, User, Embed, ButtonStyle, SelectOption, EmbedField
 from discord.ext.pages import Page
 
-from Classes.Common import ObjectManager, RevisitTimer
+from Classes.Common import ObjectManager
+from Classes.Common.BlastContent import BlastContent
 from Enums import Service, XIVRegion
 from UI.Common import FroggeView, FroggeSelectView, ConfirmCancelView, BasicTextModal, Frogginator
-from UI.Services import NoServicesAddView
+from UI.Services import NoServicesAddView, ServiceRequestAcceptView
 from Utilities import Utilities as U
 from .ServiceRequest import ServiceRequest
 
 
 if TYPE_CHECKING:
-    from Classes import StaffPartyBot
+    from Classes import StaffPartyBot, StartupScheduler
 ################################################################################
 
 __all__ = ("ServicesManager", )
 
+# How long after a request is accepted to check in with its requester.
+REVISIT_DELAY = timedelta(days=3)
+
 ################################################################################
 class ServicesManager(ObjectManager):
 
-    __slots__ = (
-        "_revisits",
-    )
+    MULTI_INDEXES = {
+        "user_id": lambda r: (r.user_id, ),
+        "candidate_id": lambda r: (r._candidate.id, ),
+    }
 
 ################################################################################
     def __init__(self, bot: StaffPartyBot) -> None:
 
         super().__init__(bot)
 
-        self._revisits: List[RevisitTimer] = []
+        bot.fanout.register("service_request", self.blast_content)
+        bot.scheduler.register("service_revisit", self.revisit_request)
 
 ################################################################################
     async def load_all(self, payload: Any) -> None:
 
-        self._managed = [
-            ServiceRequest(self, **data)
-            for data
-            in payload.get("service_requests", [])
-        ]
+        requests = []
+        async for chunk in payload["service_requests"]:
+            requests.extend(ServiceRequest(self, **data) for data in chunk)
+
+        self._managed.replace(requests)
 
 ################################################################################
-    async def finalize_load(self) -> None:
+    async def finalize_load(self, scheduler: StartupScheduler) -> None:
 
         for request in self._managed:
-            await request.refresh()
-            await request.update_post_components()
-
-        print("Finalized loading of service requests.")
+            scheduler.submit("Service Requests", request.post_url, request.finalize_load)
 
 ################################################################################
     @property
@@ -57,6 +61,30 @@ class ServicesManager(ObjectManager):
 
         return self._managed
 
+################################################################################
+    def requests_by_user(self, user_id: int) -> List[ServiceRequest]:
+
+        return self._managed.lookup_all("user_id", user_id)
+
+################################################################################
+    def requests_accepted_by(self, user_id: int) -> List[ServiceRequest]:
+
+        return self._managed.lookup_all("candidate_id", user_id)
+
+################################################################################
+    async def blast_content(self, request_id: int) -> Optional[BlastContent]:
+
+        request = self[request_id]
+        if request is None:
+            return None
+
+        return BlastContent(
+            await request.blast_message(),
+            view=lambda: ServiceRequestAcceptView(request),
+            active=lambda: not request.is_accepted,
+            on_sent=lambda _, message: request.add_blast_message(message)
+        )
+
 ################################################################################
     async def status(self) -> Embed:
 
@@ -230,7 +258,7 @@ class ServicesManager(ObjectManager):
             else:
                 data_center = XIVRegion(int(view.value))
 
-        request = ServiceRequest.new(
+        request = await ServiceRequest.new(
             mgr=self,
             user=interaction.user,
             service=service,
@@ -276,21 +304,15 @@ class ServicesManager(ObjectManager):
         return pages
 
 ################################################################################
-    async def check_revisits(self):
-
-        final = []
-
-        for revisit in self._revisits:
-            if revisit.is_expired():
-                await revisit.context.revisit()
-            else:
-                final.append(revisit)
+    async def revisit_request(self, request_id: int) -> None:
 
-        self._revisits = final
+        request = self[request_id]
+        if request is not None:
+            await request.revisit()
 
 ################################################################################
-    def register_revisit(self, request: ServiceRequest, duration_sec: int = 30) -> None:  # 3 days 259200
+    async def register_revisit(self, request: ServiceRequest, delay: timedelta = REVISIT_DELAY) -> None:
 
-        self._revisits.append(RevisitTimer(request, duration_sec))
+        await self.bot.scheduler.schedule("service_revisit", request.id, datetime.now(UTC) + delay)
 
 ################################################################################
@@ -56,7 +56,7 @@ class SpecialEvent(Identifiable):
 
 ################################################################################
     @classmethod
-    def new(
+    async def new(
         cls: Type[SE],
         mgr: SpecialEventManager,
         title: str,
@@ -68,7 +68,7 @@ class SpecialEvent(Identifiable):
         requirements: Optional[str]
     ) -> SE:
 
-        new_data = mgr.bot.db.insert.special_event(
+        new_data = await mgr.bot.db.insert.special_event(
             venue_id=mgr.venue.id,
             title=title,
             description=description,
@@ -277,6 +277,39 @@ class SpecialEvent(Identifiable):
             ]
         )
 
+################################################################################
+    def notification_embed(self) -> Embed:
+
+        return U.make_embed(
+            title="New Special Event Posted!",
+            description=(
+                f"Your venue has been tagged for an event!\n\n"
+                f"Event: **{self.title}**\n"
+                f"Description: **{U.string_clamp(self.description or '`Not Set`', 100)}**\n"
+                f"Location: **{self.location or '`Not Set`'}**\n"
+                f"Date: **{self.start or '`Not Set`'}**\n"
+                f"Length: **{self.length or '`Not Set`'}**\n\n"
+                
+                f"[Click here to view the full event listing]({self.post_url})\n"
+            ),
+            fields=[
+                EmbedField(
+                    name="__Related Links__",
+                    value=self._links_field(),
+                    inline=False
+                ),
+                EmbedField(
+                    name="__Participation Requirements__",
+                    value=U.string_clamp(self.requirements or '`Not Set`', 250),
+                    inline=False
+                )
+            ],
+            footer_text=(
+                "If you want to stop receiving notifications for special events,"
+                "you may do so in your `/venue profile`."
+            )
+        )
+
 ################################################################################
     def _links_field(self) -> str:
 
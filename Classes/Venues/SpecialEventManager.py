@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Optional
 
 from discord import Interaction, Embed, EmbedField, ForumChannel
 
+from Classes.Common import IndexedCollection
 from Errors import MaxItemsReached
 from UI.Common import BasicTextModal, ConfirmCancelView, FroggeSelectView, ConfirmCancelView2
 from UI.Venues import SpecialEventManagerMenuView
@@ -30,16 +31,16 @@ class SpecialEventManager:
     def __init__(self, parent: Venue, **kwargs) -> None:
 
         self._parent: Venue = parent
-        self._events: List[SpecialEvent] = [
+        self._events: IndexedCollection[SpecialEvent] = IndexedCollection(
             SpecialEvent(self, **ev)
             for ev
             in kwargs.get("special_events", [])
-        ]
+        )
 
 ################################################################################
     def __getitem__(self, event_id: int) -> SpecialEvent:
 
-        return next((e for e in self._events if e.id == int(event_id)), None)
+        return self._events.get(int(event_id))
 
 ################################################################################
     @property
@@ -403,7 +404,7 @@ class SpecialEventManager:
 
             requirements, inter = modal.value
 
-        new_event = SpecialEvent.new(
+        new_event = await SpecialEvent.new(
             self,
             title=title,
             description=description,
@@ -474,12 +475,18 @@ class SpecialEventManager:
 ################################################################################
     async def notify_venues_of_event(self, event: SpecialEvent) -> None:
 
-        venues = [
-            v
-            for v in self.bot.venue_manager.venues
-            if v.event_participation
-        ]
-        for venue in venues:
-            await venue.notify_of_event(event)
+        assert event.post_url is not None
+
+        # Sent in the background; see VenueManager.event_notification_content().
+        await self.bot.fanout.start(
+            "special_event",
+            event.id,
+            [
+                user_id
+                for v in self.bot.venue_manager.venues
+                if v.event_participation
+                for user_id in v.manager_ids
+            ]
+        )
 
 ################################################################################
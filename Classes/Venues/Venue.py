@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, TypeVar, List, Optional, Type, Dict, Any
+from typing import TYPE_CHECKING, TypeVar, List, Optional, Type, Dict, Any, Tuple
 
 from discord import (
     User,
@@ -14,6 +14,7 @@ from discord import (
     Thread,
     SelectOption
 )
+from discord.utils import MISSING
 
 from Assets import BotEmojis, BotImages
 from Classes.Common import ManagedObject, LazyUser, LazyMessage
@@ -34,7 +35,7 @@ from .VenueJobSupervisor import VenueJobSupervisor
 from .SpecialEventManager import SpecialEventManager
 
 if TYPE_CHECKING:
-    from Classes import VenueManager, XIVVenue, SpecialEvent
+    from Classes import VenueManager, XIVVenue
 ################################################################################
 
 __all__ = ("Venue",)
@@ -66,6 +67,9 @@ class Venue(ManagedObject):
         "_event_mgr",
     )
 
+    # Columns that never appear on the venue's forum post.
+    HIDDEN_COLUMNS = ("xiv_id", "mare_id", "mare_password")
+
 ################################################################################
     def __init__(self, mgr: VenueManager, id: int, **kwargs):
 
@@ -116,7 +120,7 @@ class Venue(ManagedObject):
     @classmethod
     async def new(cls: Type[V], mgr: VenueManager, xiv_venue: XIVVenue) -> V:
 
-        new_data = mgr.bot.db.insert.venue(xiv_venue.id, xiv_venue.name)
+        new_data = await mgr.bot.db.insert.venue(xiv_venue.id, xiv_venue.name)
         self: V = cls(mgr, new_data["id"])
         await self.update_from_xiv_venue(xiv_venue)
         return self
@@ -142,6 +146,7 @@ class Venue(ManagedObject):
     def name(self, value: str) -> None:
 
         self._name = value
+        self._mgr.on_venue_renamed(self)
         self.update()
 
 ################################################################################
@@ -240,6 +245,24 @@ class Venue(ManagedObject):
 
         return [await u.get() for u in self._mutes]
 
+################################################################################
+    @property
+    def muted_user_ids(self) -> List[int]:
+
+        return [u.id for u in self._mutes]
+
+################################################################################
+    @property
+    def manager_ids(self) -> List[int]:
+
+        return [u.id for u in self._users]
+
+################################################################################
+    @property
+    def event_manager(self) -> SpecialEventManager:
+
+        return self._event_mgr
+
 ################################################################################
     @property
     def tags(self) -> List[str]:
@@ -329,6 +352,7 @@ class Venue(ManagedObject):
     async def delete(self) -> None:
 
         self.bot.db.delete.venue(self.id)
+        self.bot.post_fingerprints.forget(self._post_msg.message_id)
 
         try:
             post_message = await self.post_message
@@ -444,12 +468,28 @@ class Venue(ManagedObject):
     async def update_from_xiv_venue(self, venue: Optional[XIVVenue] = None) -> None:
 
         if venue is None:
-            venue = self.bot.xiv_client.get_venue_by_id(self._xiv_id)
+            venue = await self.bot.xiv_client.get_venue_by_id(self._xiv_id)
             if venue is None:
                 return
 
+        self._apply_xiv_fields(venue)
+
+        for s in self._schedule:
+            s.delete()
+        self._schedule = [
+            await VenueHours.from_xiv_schedule(self, h)
+            for h in venue.schedule
+        ]
+
+        self.update()
+        await self.update_post_components(True, True)
+
+################################################################################
+    def _apply_xiv_fields(self, venue: XIVVenue) -> None:
+
         self._xiv_id = venue.id
         self._name = venue.name
+        self._mgr.on_venue_renamed(self)
         self._description = venue.description.copy() if venue.description else []
 
         self._mare_id = venue.mare_id
@@ -464,16 +504,33 @@ class Venue(ManagedObject):
             LazyUser(self, user_id)
             for user_id in venue.managers
         ]
+        self._mgr.on_venue_managers_changed(self)
 
-        for s in self._schedule:
-            s.delete()
-        self._schedule = [
-            VenueHours.from_xiv_schedule(self, h)
-            for h in venue.schedule
-        ]
+################################################################################
+    def apply_xiv_diff(self, venue: XIVVenue) -> Tuple[Dict[str, Any], Optional[List[Dict[str, Any]]]]:
+        """
+        Applies an XIV listing in memory without touching the database.
 
-        self.update()
-        await self.update_post_components(True, True)
+        Returns the venue columns that changed, and the new schedule rows if
+        the schedule changed (None otherwise).
+        """
+
+        before = self.to_dict()
+        self._apply_xiv_fields(venue)
+        after = self.to_dict()
+
+        columns = {k: v for k, v in after.items() if before.get(k) != v}
+
+        schedule = [VenueHours.xiv_to_dict(h) for h in venue.schedule]
+        if schedule == [h.to_dict() for h in self._schedule]:
+            schedule = None
+
+        return columns, schedule
+
+################################################################################
+    def replace_schedule(self, ids: List[int], rows: List[Dict[str, Any]]) -> None:
+
+        self._schedule = [VenueHours(self, _id, **row) for _id, row in zip(ids, rows)]
 
 ################################################################################
     def complete(self, rp_bypass: bool = False) -> bool:
@@ -590,23 +647,30 @@ class Venue(ManagedObject):
         if post_message is None:
             return
 
+        embeds = MISSING
+        if status or not update_view:
+            embeds = [await self.status(post=True)]
+
+        view = MISSING
+        if update_view or not status:
+            view = VenuePostingMuteView(self)
+            self.bot.add_view(view)
+
+        # Nothing to do (not even un-archiving the thread) if the post
+        # already shows exactly this.
+        fingerprints = self.bot.post_fingerprints
+        changes = fingerprints.changed(post_message.id, embeds=embeds, view=view)
+        if not changes:
+            return
+
         if post_message.channel.archived:
             try:
                 await post_message.channel.send("Hey Ur Cute~", delete_after=0.1)
             except:
                 return
 
-        if status and not update_view:
-            await post_message.edit(embed=await self.status(post=True))
-            return
-
-        view = VenuePostingMuteView(self)
-        self.bot.add_view(view)
-
-        if update_view and not status:
-            await post_message.edit(view=view)
-        else:
-            await post_message.edit(embed=await self.status(post=True), view=view)
+        await post_message.edit(**changes)
+        await fingerprints.record(post_message.id, changes)
 
 ################################################################################
     async def set_rp_level(self, interaction: Interaction) -> None:
@@ -846,11 +910,14 @@ class Venue(ManagedObject):
             ),
             footer_text="Type 'CANCEL' to skip this step."
         )
-        image_url = await U.wait_for_image(interaction, prompt)
-        if image_url is not None:
-            self._urls.logo = image_url
-            self.update()
-            await self.update_post_components(True)
+        image = await U.wait_for_image(interaction, prompt)
+        if image is not None:
+            async def _apply(url: str) -> None:
+                self._urls.logo = url
+                self.update()
+                await self.update_post_components(True)
+
+            image.then(_apply, slot=(id(self._urls), "logo"))
 
         confirm = U.make_embed(
             title="Venue Import Complete",
@@ -901,46 +968,4 @@ class Venue(ManagedObject):
         await interaction.respond(embed=embed, view=view)
         await view.wait()
 
-################################################################################
-    async def notify_of_event(self, event: SpecialEvent):
-
-        assert self.event_participation
-        assert event.post_url is not None
-
-        notification = U.make_embed(
-            title="New Special Event Posted!",
-            description=(
-                f"Your venue has been tagged for an event!\n\n"
-                f"Event: **{event.title}**\n"
-                f"Description: **{U.string_clamp(event.description or '`Not Set`', 100)}**\n"
-                f"Location: **{event.location or '`Not Set`'}**\n"
-                f"Date: **{event.start or '`Not Set`'}**\n"
-                f"Length: **{event.length or '`Not Set`'}**\n\n"
-                
-                f"[Click here to view the full event listing]({event.post_url})\n"
-            ),
-            fields=[
-                EmbedField(
-                    name="__Related Links__",
-                    value=event._links_field(),
-                    inline=False
-                ),
-                EmbedField(
-                    name="__Participation Requirements__",
-                    value=U.string_clamp(event.requirements or '`Not Set`', 250),
-                    inline=False
-                )
-            ],
-            footer_text=(
-                "If you want to stop receiving notifications for special events,"
-                "you may do so in your `/venue profile`."
-            )
-        )
-
-        for manager in await self.managers:
-            try:
-                await manager.send(embed=notification)
-            except:
-                pass
-
 ################################################################################
@@ -5,7 +5,7 @@ import calendar
 from datetime import datetime, timedelta, time
 from typing import TYPE_CHECKING, Type, TypeVar, Any, Dict, Optional
 
-from Classes.Common import Identifiable
+from Classes.Common import Identifiable, WeekBitmap
 from Enums import Weekday, XIVIntervalType
 from Utilities import Utilities as U
 
@@ -29,6 +29,7 @@ class VenueHours(Identifiable):
         "_close_minute",
         "_interval_type",
         "_interval_arg",
+        "_bitmap",
     )
 
 ################################################################################
@@ -55,11 +56,13 @@ class VenueHours(Identifiable):
         )
         self._interval_arg: int = kwargs.get("interval_arg")
 
+        self._bitmap: Optional[WeekBitmap] = None
+
 ################################################################################
     @classmethod
-    def from_xiv_schedule(cls: Type[VH], parent: Venue, xiv: XIVScheduleComponent) -> VH:
+    async def from_xiv_schedule(cls: Type[VH], parent: Venue, xiv: XIVScheduleComponent) -> VH:
 
-        new_data = parent.bot.db.insert.venue_schedule(parent.id)
+        new_data = await parent.bot.db.insert.venue_schedule(parent.id)
         self: VH = cls(parent, new_data["id"])
         self.update_from_xiv_venue(xiv)
         return self
@@ -82,6 +85,18 @@ class VenueHours(Identifiable):
 
         return time(self._close_hour, self._close_minute)
 
+################################################################################
+    @property
+    def bitmap(self) -> WeekBitmap:
+
+        if self._bitmap is None:
+            if self._open_hour is None or self._close_hour is None:
+                self._bitmap = WeekBitmap()
+            else:
+                self._bitmap = WeekBitmap.from_window(self._day, self.start_time, self.end_time)
+
+        return self._bitmap
+
 ################################################################################
     def open_timestamp(self) -> str:
 
@@ -130,6 +145,20 @@ class VenueHours(Identifiable):
 
         self.bot.db.delete.venue_hours(self.id)
 
+################################################################################
+    @staticmethod
+    def xiv_to_dict(xiv: XIVScheduleComponent) -> Dict[str, Any]:
+
+        return {
+            "day": Weekday(xiv.day).value if xiv.day is not None else None,
+            "start_hour": xiv.utc.start.hour,
+            "start_minute": xiv.utc.start.minute,
+            "end_hour": xiv.utc.end.hour if xiv.utc.end is not None else None,
+            "end_minute": xiv.utc.end.minute if xiv.utc.end is not None else None,
+            "interval_type": XIVIntervalType(xiv.interval.interval_type).value,
+            "interval_arg": xiv.interval.arg,
+        }
+
 ################################################################################
     def update_from_xiv_venue(self, xiv: XIVScheduleComponent) -> None:
 
@@ -140,6 +169,7 @@ class VenueHours(Identifiable):
         self._close_minute = xiv.utc.end.minute if xiv.utc.end is not None else None
         self._interval_type = XIVIntervalType(xiv.interval.interval_type)
         self._interval_arg = xiv.interval.arg
+        self._bitmap = None
 
         self.update()
 
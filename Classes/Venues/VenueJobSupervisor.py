@@ -50,38 +50,39 @@ class VenueJobSupervisor:
     @property
     def temp_jobs(self) -> List[TemporaryJobPosting]:
 
-        return sorted([
-            j
-            for j in self.jobs_manager.temporary_postings
-            if j._venue_id == self._parent.id
-        ], key=lambda j: (j.position.proper_name, j._start))
+        return sorted(
+            self.jobs_manager.temp_jobs_for_venue(self._parent.id),
+            key=lambda j: (j.position.proper_name, j._start)
+        )
 
     def get_temp_job(self, job_id: int) -> Optional[TemporaryJobPosting]:
 
-        return next((j for j in self.temp_jobs if j.id == int(job_id)), None)
+        job = self.jobs_manager.get_temp_job(job_id)
+        return job if job is not None and job._venue_id == self._parent.id else None
 
 ################################################################################
     @property
     def perm_jobs(self) -> List[PermanentJobPosting]:
 
-        return sorted([
-            j
-            for j in self.jobs_manager.permanent_postings
-            if j._venue_id == self._parent.id
-        ], key=lambda j: j.position.proper_name)
+        return sorted(
+            self.jobs_manager.perm_jobs_for_venue(self._parent.id),
+            key=lambda j: j.position.proper_name
+        )
 
     def get_perm_job(self, job_id: int) -> Optional[PermanentJobPosting]:
 
-        return next((j for j in self.perm_jobs if j.id == int(job_id)), None)
+        job = self.jobs_manager.get_perm_job(job_id)
+        return job if job is not None and job._venue_id == self._parent.id else None
 
 ################################################################################
     def status(self) -> Embed:
 
-        temp_counts = Counter(j.position.proper_name for j in self.temp_jobs)
+        temp_jobs = self.temp_jobs
+        temp_counts = Counter(j.position.proper_name for j in temp_jobs)
         temp_pos_seen = {}  # tracks how many times we've labeled a given position
         temp_job_strs = []
 
-        for j in self.temp_jobs:
+        for j in temp_jobs:
             pos = j.position.proper_name  # or j.position.name if it's an enum/object
             if temp_counts[pos] == 1:
                 # Only one job with this position -> just "Bartender"
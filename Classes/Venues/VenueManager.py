@@ -1,16 +1,21 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, List, Dict, Optional
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, List, Dict, Optional, Set
 
 from discord import Interaction, User, Embed, ForumChannel, Member, SelectOption
 
 from Classes.Common import ObjectManager
+from Classes.Common.BlastContent import BlastContent
+from logger import log
 from UI.Common import FroggeView, ConfirmCancelView, FroggeSelectView, BasicTextModal
 from Utilities import Utilities as U
 from .Venue import Venue
+from .VenueSyncSummary import VenueSyncSummary
 
 if TYPE_CHECKING:
-    from Classes import StaffPartyBot, XIVVenue
+    from Classes import StaffPartyBot, StartupScheduler, XIVVenue, SpecialEvent
 ################################################################################
 
 __all__ = ("VenueManager", )
@@ -18,20 +23,42 @@ __all__ = ("VenueManager", )
 ################################################################################
 class VenueManager(ObjectManager):
 
+    __slots__ = (
+        "_departing",
+    )
+
+    INDEXES = {
+        "name": lambda v: v.name.lower() if v.name else None,
+        "xiv_id": lambda v: v.xiv_id,
+    }
+    MULTI_INDEXES = {
+        "manager_id": lambda v: v.manager_ids,
+    }
+
+################################################################################
     def __init__(self, state: StaffPartyBot) -> None:
 
         super().__init__(state)
 
+        # Ids of venues being deleted because their managers left.
+        self._departing: Set[int] = set()
+
+        state.fanout.register("special_event", self.event_notification_content)
+
 ################################################################################
     async def load_all(self, payload: Dict[str, Any]) -> None:
 
-        self._managed = [Venue(self, **v) for v in payload["venues"]]
+        venues = []
+        async for chunk in payload["venues"]:
+            venues.extend(Venue(self, **v) for v in chunk)
+
+        self._managed.replace(venues)
 
 ################################################################################
-    async def finalize_load(self) -> None:
+    async def finalize_load(self, scheduler: StartupScheduler) -> None:
 
         for venue in self._managed:
-            await venue.finalize_load()
+            scheduler.submit("Venues", venue.post_url, venue.finalize_load)
 
 ################################################################################
     @property
@@ -73,15 +100,65 @@ class VenueManager(ObjectManager):
 ################################################################################
     def get_venues_by_user(self, user_id: int) -> List[Venue]:
 
-        return [
-            v for v in self._managed
-            if user_id in [m.id for m in v._users]
-        ]
+        return self._managed.lookup_all("manager_id", user_id)
 
 ################################################################################
     def get_venue(self, name: str) -> Optional[Venue]:
 
-        return next((v for v in self._managed if v.name.lower() == name.lower()), None)
+        return self._managed.lookup("name", name.lower())
+
+################################################################################
+    def get_special_event(self, event_id: int) -> Optional[SpecialEvent]:
+
+        for venue in self._managed:
+            if (event := venue.event_manager[event_id]) is not None:
+                return event
+
+        return None
+
+################################################################################
+    async def event_notification_content(self, event_id: int) -> Optional[BlastContent]:
+
+        event = self.get_special_event(event_id)
+        if event is None or event.post_url is None:
+            return None
+
+        return BlastContent(event.notification_embed())
+
+################################################################################
+    def get_venue_by_xiv_id(self, xiv_id: str) -> Optional[Venue]:
+
+        return self._managed.lookup("xiv_id", xiv_id)
+
+################################################################################
+    def on_venue_renamed(self, venue: Venue) -> None:
+
+        self._managed.reindex(venue)
+
+################################################################################
+    def on_venue_managers_changed(self, venue: Venue) -> None:
+
+        self._managed.reindex(venue)
+
+################################################################################
+    def verify_indexes(self) -> bool:
+        """
+        Checks the name, XIV id and manager indexes against the venues
+        themselves, rebuilding them if anything has drifted.
+        """
+
+        problems = self._managed.verify()
+        if not problems:
+            return True
+
+        log.warning(
+            f"Venue indexes out of sync ({len(problems)} problems), rebuilding: "
+            + "; ".join(problems[:10]),
+            None
+        )
+        self._managed.replace(self._managed.to_list())
+
+        return False
 
 ################################################################################
     async def import_venue(
@@ -137,7 +214,7 @@ class VenueManager(ObjectManager):
         user_to_get = admin_user or interaction.user
         results = [
             v for v in
-            self.bot.xiv_client.get_venues_by_manager(user_to_get.id)
+            await self.bot.xiv_client.get_venues_by_manager(user_to_get.id)
             if v.name.lower() == name.lower()
         ]
 
@@ -290,25 +367,34 @@ class VenueManager(ObjectManager):
     async def on_member_leave(self, member: Member) -> bool:
         """Returns True if a venue was deleted as a result of the member leaving."""
 
-        for venue in self.venues:
-            managers = await venue.managers
-            if member in managers:
-                flag = False
-                for user in managers:
-                    if self.bot.SPB_GUILD.get_member(user.id) is not None:
-                        flag = True
-                        break
+        # Only venues the member managed, and only those with no other
+        # manager still in the server. Co-managers leaving in the same batch
+        # all see the venue orphaned, so the first to get here claims it.
+        orphaned = [
+            venue
+            for venue in self.get_venues_by_user(member.id)
+            if venue.id not in self._departing
+            and not any(
+                user_id != member.id and self.bot.SPB_GUILD.get_member(user_id) is not None
+                for user_id in venue.manager_ids
+            )
+        ]
+        if not orphaned:
+            return False
 
-                if not flag:
-                    await venue.delete()
-                    return True
+        claimed = {venue.id for venue in orphaned}
+        self._departing |= claimed
+        try:
+            await asyncio.gather(*(venue.delete() for venue in orphaned))
+        finally:
+            self._departing -= claimed
 
-        return False
+        return True
 
 ################################################################################
     async def new_venue_menu(self, interaction: Interaction) -> None:
 
-        xiv_venues = self.bot.xiv_client.get_venues_by_manager(interaction.user.id)
+        xiv_venues = await self.bot.xiv_client.get_venues_by_manager(interaction.user.id)
         if not xiv_venues:
             error = U.make_error(
                 title="Unable to Import Venue",
@@ -424,9 +510,52 @@ class VenueManager(ObjectManager):
         await interaction.respond(embed=confirm, ephemeral=True)
 
 ################################################################################
-    async def update_all_from_xiv(self) -> None:
+    async def update_all_from_xiv(self) -> VenueSyncSummary:
+
+        summary = VenueSyncSummary()
+        start = time.monotonic()
 
-        for venue in self.venues:
-            await venue.update_from_xiv_venue()
+        xiv_venues = {v.id: v for v in await self.bot.xiv_client.get_all_venues()}
+
+        changes = []
+        to_render = []
+        for venue in self._managed:
+            xiv_venue = xiv_venues.get(venue.xiv_id)
+            if xiv_venue is None:
+                summary.missing.append(venue)
+                continue
+
+            columns, schedule = venue.apply_xiv_diff(xiv_venue)
+            if not columns and schedule is None:
+                summary.unchanged += 1
+                continue
+
+            summary.changed.append(venue)
+            changes.append((venue.id, columns, schedule))
+            if schedule is not None or any(c not in Venue.HIDDEN_COLUMNS for c in columns):
+                to_render.append(venue)
+
+        if changes:
+            new_schedule_ids = await self.bot.db.update.venue_sync(changes)
+            for venue_id, _, schedule in changes:
+                if schedule is not None:
+                    self[venue_id].replace_schedule(new_schedule_ids[venue_id], schedule)
+
+        for venue in to_render:
+            try:
+                await venue.update_post_components(True, False)
+                summary.rendered += 1
+            except Exception as ex:
+                log.warning(f"Failed to re-render venue post for '{venue.name}': {ex}", None)
+
+        # Every venue's name and managers were just reapplied; make sure
+        # the lookups still agree with them.
+        self.verify_indexes()
+
+        summary.duration = time.monotonic() - start
+        print(summary.format())
+        log.info(summary.format(), None)
+
+        return summary
 
 ################################################################################
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List
+
+if TYPE_CHECKING:
+    from Classes import Venue
+################################################################################
+
+__all__ = ("VenueSyncSummary", )
+
+################################################################################
+class VenueSyncSummary:
+
+    __slots__ = (
+        "changed",
+        "unchanged",
+        "missing",
+        "rendered",
+        "duration",
+    )
+
+################################################################################
+    def __init__(self) -> None:
+
+        self.changed: List[Venue] = []
+        self.unchanged: int = 0
+        self.missing: List[Venue] = []
+        self.rendered: int = 0
+        self.duration: float = 0.0
+
+################################################################################
+    def format(self) -> str:
+
+        ret = (
+            f"XIV venue sync finished in {self.duration:.2f}s: "
+            f"{len(self.changed)} changed, {self.unchanged} unchanged, "
+            f"{len(self.missing)} missing, {self.rendered} post(s) re-rendered."
+        )
+        if self.missing:
+            ret += " Missing: " + ", ".join(v.name for v in self.missing)
+
+        return ret
+
+################################################################################
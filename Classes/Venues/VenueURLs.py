@@ -78,12 +78,15 @@ class VenueURLs:
             title="Set Venue Logo",
             description="Please upload an image for the venue's logo.",
         )
-        image_url = await U.wait_for_image(interaction, prompt)
-        if image_url is None:
+        image = await U.wait_for_image(interaction, prompt)
+        if image is None:
             return
 
-        self.logo = image_url
-        self._parent.update()
+        async def _apply(url: str) -> None:
+            self.logo = url
+            self._parent.update()
+
+        image.then(_apply, slot=(id(self), "logo"))
 
 ################################################################################
     async def set_application_url(self, interaction: Interaction) -> None:
@@ -5,4 +5,5 @@ from .VenueLocation import VenueLocation
 from .VenueHours import VenueHours
 from .SpecialEvent import SpecialEvent
 from .SpecialEventManager import SpecialEventManager
+from .VenueSyncSummary import VenueSyncSummary
 ################################################################################
@@ -0,0 +1,102 @@
+"""
+Compares finding a user's venues with a linear scan over every venue (the
+old `get_venues_by_user` behaviour) against the `manager_id` index on
+`VenueManager`'s collection, over a set of synthetic venues. Run it from
+the repository root, with the bot's requirements installed (importing
+`Classes` pulls in discord and friends):
+
+    python -m Classes.Venues._benchmark_manager_index [--venues 5000] [--users 20000] [--lookups 10000]
+
+Both approaches must agree on every lookup, and the index must pass
+`verify()` after a round of manager changes; the run aborts otherwise.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from types import SimpleNamespace
+from typing import Any, List
+
+from Classes.Common.IndexedCollection import IndexedCollection
+################################################################################
+
+def _managers(rng: random.Random, users: int) -> List[Any]:
+
+    return [SimpleNamespace(id=u) for u in rng.sample(range(users), rng.randint(1, 4))]
+
+################################################################################
+def _venue(rng: random.Random, venue_id: int, users: int) -> Any:
+
+    venue = SimpleNamespace(id=venue_id, name=f"Venue {venue_id}", _users=_managers(rng, users))
+    venue.manager_ids = lambda: [u.id for u in venue._users]
+    return venue
+
+################################################################################
+def _scan(venues: IndexedCollection, user_id: int) -> List[Any]:
+
+    return [
+        v for v in venues
+        if user_id in [m.id for m in v._users]
+    ]
+
+################################################################################
+def main() -> None:
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--venues", type=int, default=5_000)
+    parser.add_argument("--users", type=int, default=20_000)
+    parser.add_argument("--lookups", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    venues = [_venue(rng, i, args.users) for i in range(args.venues)]
+    lookups = [rng.randrange(args.users) for _ in range(args.lookups)]
+
+    start = time.perf_counter()
+    collection = IndexedCollection(
+        venues,
+        indexes={"name": lambda v: v.name.lower()},
+        multi_indexes={"manager_id": lambda v: v.manager_ids()}
+    )
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = [_scan(collection, u) for u in lookups]
+    scan = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = [collection.lookup_all("manager_id", u) for u in lookups]
+    query = time.perf_counter() - start
+
+    if [sorted(v.id for v in a) for a in actual] != [sorted(v.id for v in e) for e in expected]:
+        raise SystemExit("Index results differ from the linear scan!")
+
+    # Reassign the managers of 1% of venues as an XIV sync would.
+    start = time.perf_counter()
+    for venue in rng.sample(venues, max(1, args.venues // 100)):
+        venue._users = _managers(rng, args.users)
+        collection.reindex(venue)
+    reindex = time.perf_counter() - start
+
+    start = time.perf_counter()
+    problems = collection.verify()
+    verify = time.perf_counter() - start
+
+    if problems:
+        raise SystemExit(f"Index failed verification: {problems[:5]}")
+
+    matches = sum(len(e) for e in expected) / len(lookups)
+    print(f"{args.venues} venues, {args.users} users, {args.lookups} lookups, {matches:.2f} venues/lookup")
+    print(f"  index build:     {build * 1000:8.1f} ms")
+    print(f"  linear scan:     {scan / len(lookups) * 1000:8.3f} ms/lookup")
+    print(f"  index lookup:    {query / len(lookups) * 1000:8.4f} ms/lookup")
+    print(f"  1% re-index:     {reindex * 1000:8.1f} ms")
+    print(f"  verify:          {verify * 1000:8.1f} ms")
+
+################################################################################
+if __name__ == "__main__":
+    main()
+
+################################################################################
@@ -1,27 +1,106 @@
 from __future__ import annotations
 
-from datetime import timedelta
-from typing import TYPE_CHECKING, Optional
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-import discord
-from discord import TextChannel, Member, Interaction
-from discord.ext.tasks import loop
+from discord import TextChannel, Member
 
 from Assets import BotEmojis
+from logger import log
 
 if TYPE_CHECKING:
     from Classes import StaffPartyBot
 ################################################################################
 
-__all__ = ("WelcomeManager", )
+__all__ = ("WelcomeManager", "PendingWelcome")
+
+################################################################################
+class PendingWelcome:
+
+    __slots__ = (
+        "_id",
+        "_user_id",
+        "_due_at",
+        "_attempts",
+    )
+
+################################################################################
+    def __init__(self, **kwargs) -> None:
+
+        self._id: int = kwargs["id"]
+        self._user_id: int = kwargs["user_id"]
+        self._due_at: datetime = kwargs["due_at"].astimezone(timezone.utc)
+        self._attempts: int = kwargs.get("attempts", 0)
+
+################################################################################
+    @property
+    def id(self) -> int:
+
+        return self._id
+
+################################################################################
+    @property
+    def user_id(self) -> int:
+
+        return self._user_id
+
+################################################################################
+    @property
+    def due_at(self) -> datetime:
+
+        return self._due_at
+
+################################################################################
+    def to_dict(self) -> Dict[str, Any]:
+
+        return {
+            "due_at": self._due_at,
+            "attempts": self._attempts,
+        }
 
 ################################################################################
 class WelcomeManager:
+    """
+    Welcomes new members once they've picked a role. Each join is stored with
+    its next check time and attempt count, and the checks run on the bot's
+    `TaskScheduler` as `welcome_check` tasks, so any number of joins are
+    tracked at once and checks still pending at shutdown carry over to the
+    next start.
+    """
+
+    __slots__ = (
+        "_state",
+        "_pending",
+    )
+
+    TASK_KIND = "welcome_check"
+    # One minute for role selection, checked up to five times.
+    CHECK_INTERVAL = timedelta(minutes=1)
+    MAX_ATTEMPTS = 5
 
+################################################################################
     def __init__(self, state: StaffPartyBot):
 
         self._state: StaffPartyBot = state
 
+        self._pending: Dict[int, PendingWelcome] = {}
+
+        # Our rows hold the deadlines, so the scheduler only tracks them.
+        state.scheduler.register(self.TASK_KIND, self._check_user)
+
+################################################################################
+    async def load_all(self, payload: Dict[str, Any]) -> None:
+
+        async for chunk in payload["pending"]:
+            for data in chunk:
+                self._track(PendingWelcome(**data))
+
+################################################################################
+    @property
+    def bot(self) -> StaffPartyBot:
+
+        return self._state
+
 ################################################################################
     @property
     async def channel(self) -> Optional[TextChannel]:
@@ -29,7 +108,66 @@ class WelcomeManager:
         return await self._state.channel_manager.welcome_channel
 
 ################################################################################
-    @loop(count=1)
+    async def schedule(self, member: Member) -> None:
+
+        if member.id in self._pending:
+            return
+
+        joined_at = member.joined_at or datetime.now(timezone.utc)
+        data = await self.bot.db.insert.pending_welcome(member.id, joined_at + self.CHECK_INTERVAL)
+
+        self._track(PendingWelcome(**data))
+
+################################################################################
+    def _track(self, welcome: PendingWelcome) -> None:
+
+        self._pending[welcome.user_id] = welcome
+        self.bot.scheduler.track(self.TASK_KIND, welcome.user_id, welcome.due_at)
+
+################################################################################
+    def _finish(self, welcome: PendingWelcome) -> None:
+
+        self._pending.pop(welcome.user_id, None)
+        self.bot.db.delete.pending_welcome(welcome.id)
+
+################################################################################
+    async def _check_user(self, user_id: int) -> None:
+
+        welcome = self._pending.get(user_id)
+        if welcome is None:
+            return
+
+        try:
+            await self._check(welcome)
+        except Exception as ex:
+            log.error(f"Failed to welcome member {user_id}: {ex}", None)
+            self._finish(welcome)
+
+################################################################################
+    async def _check(self, welcome: PendingWelcome) -> None:
+
+        member = self.bot.SPB_GUILD.get_member(welcome.user_id)
+        if member is None:
+            # Left before picking a role.
+            self._finish(welcome)
+            return
+
+        # Only @everyone means they haven't picked a role yet.
+        if len(member.roles) == 1:
+            welcome._attempts += 1
+            if welcome._attempts >= self.MAX_ATTEMPTS:
+                self._finish(welcome)
+                return
+
+            welcome._due_at += self.CHECK_INTERVAL
+            self.bot.db.update.pending_welcome(welcome)
+            self._track(welcome)
+            return
+
+        self._finish(welcome)
+        await self.welcome(member)
+
+################################################################################
     async def welcome(self, member: Member) -> None:
 
         welcome_channel = await self.channel
@@ -63,25 +201,6 @@ class WelcomeManager:
             f"channels! {BotEmojis.ThumbsUp}"
         )
 
-        attempts = 0
-        target_dt = member.joined_at
-        while attempts < 5:
-            target_dt += timedelta(minutes=1)
-            # One minute for role selection
-            await discord.utils.sleep_until(target_dt)
-
-            # Get updated member object
-            if get_member := self._state.SPB_GUILD.get_member(member.id):
-                member = get_member
-
-            if len(member.roles) == 1:
-                attempts += 1
-            else:
-                break
-
-            if attempts >= 5:
-                return
-
         await welcome_channel.send(welcome_message)
 
 ################################################################################
@@ -1,2 +1,2 @@
-from .WelcomeManager import WelcomeManager
+from .WelcomeManager import WelcomeManager, PendingWelcome
 ################################################################################
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 import os
-from typing import TYPE_CHECKING, List, Optional
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Hashable
 
-import requests
+import aiohttp
 from dotenv import load_dotenv
 
+from logger import log
 from .XIVVenue import XIVVenue
 
 if TYPE_CHECKING:
@@ -14,86 +17,195 @@ if TYPE_CHECKING:
 
 __all__ = ("XIVVenuesClient",)
 
+################################################################################
+class _CacheEntry:
+
+    __slots__ = (
+        "data",
+        "etag",
+        "fetched_at",
+    )
+
+################################################################################
+    def __init__(self, data: Any, etag: Optional[str]) -> None:
+
+        self.data: Any = data
+        self.etag: Optional[str] = etag
+        self.fetched_at: float = time.monotonic()
+
+################################################################################
+    def age(self) -> float:
+
+        return time.monotonic() - self.fetched_at
+
 ################################################################################
 class XIVVenuesClient:
+    """
+    Async client for the FFXIV Venues API.
+
+    Responses are cached per query (venue id, manager id, full list) and served
+    stale while a background refresh runs once their TTL has passed. Requests
+    revalidate with the last ETag, so an unchanged venue costs a 304.
+    """
 
     __slots__ = (
         "_state",
+        "_base_url",
+        "_session",
+        "_cache",
+        "_refreshing",
     )
 
     URL_BASE = "https://api.ffxivvenues.com/venue"
 
+    CACHE_TTL = 300  # seconds
+    REQUEST_TIMEOUT = 15
+    MAX_CONNECTIONS = 10
+    MAX_RETRIES = 3
+    RETRY_BACKOFF = 0.5
+
 ################################################################################
-    def __init__(self, state: StaffPartyBot):
+    def __init__(self, state: StaffPartyBot, base_url: Optional[str] = None):
 
         self._state: StaffPartyBot = state
 
+        load_dotenv()
+        # XIV_VENUES_URL lets the client run against the local stub server.
+        self._base_url: str = base_url or os.getenv("XIV_VENUES_URL") or self.URL_BASE
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        self._cache: Dict[Hashable, _CacheEntry] = {}
+        self._refreshing: Dict[Hashable, asyncio.Task] = {}
+
+################################################################################
+    @property
+    def session(self) -> aiohttp.ClientSession:
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.MAX_CONNECTIONS),
+                timeout=aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT),
+            )
+
+        return self._session
+
+################################################################################
+    async def close(self) -> None:
+
+        for task in self._refreshing.values():
+            task.cancel()
+        self._refreshing.clear()
+
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
 ################################################################################
-    def get_venues_by_manager(self, manager_id: int) -> List[XIVVenue]:
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
 
-        query = self.URL_BASE + "?manager=" + str(manager_id)
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(key, None)
+
+################################################################################
+    async def _fetch(self, url: str, etag: Optional[str]) -> Tuple[int, Any, Optional[str]]:
 
         if self._state.DEBUG:
-            print("Executing XIVClient query: " + query)
+            print("Executing XIVClient query: " + url)
+
+        headers = {"If-None-Match": etag} if etag else {}
+
+        for attempt in range(self.MAX_RETRIES):
+            try:
+                async with self.session.get(url, headers=headers) as response:
+                    if response.status == 429 or response.status >= 500:
+                        raise aiohttp.ClientResponseError(
+                            response.request_info,
+                            response.history,
+                            status=response.status
+                        )
+                    if response.status in (304, 404):
+                        return response.status, None, etag
+                    if response.status != 200:
+                        raise Exception(
+                            "XIVClient query failed - response status code: " +
+                            str(response.status)
+                        )
+
+                    data = await response.json(content_type=None)
+                    return response.status, data, response.headers.get("ETag")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+                if attempt == self.MAX_RETRIES - 1:
+                    raise Exception(f"XIVClient query failed after {self.MAX_RETRIES} attempts: {ex!r}")
+                await asyncio.sleep(self.RETRY_BACKOFF * (2 ** attempt))
 
-        response = requests.get(query)
+################################################################################
+    async def _load(self, key: Hashable, url: str) -> Any:
 
-        if response.status_code != 200:
-            raise Exception(
-                "Failed to get venue by manager - response status code: " +
-                str(response.status_code)
-            )
+        entry = self._cache.get(key)
+        status, data, etag = await self._fetch(url, entry.etag if entry else None)
+
+        if status == 304 and entry is not None:
+            entry.fetched_at = time.monotonic()
+            return entry.data
 
         if self._state.DEBUG:
-            print("Response: " + str(response.json()))
+            print("Response: " + str(data))
+
+        if isinstance(data, dict) and data.get("status") == 404:
+            data = None
 
-        return [XIVVenue.from_data(venue) for venue in response.json()]
+        self._cache[key] = _CacheEntry(data, etag)
+        return data
 
 ################################################################################
-    def get_venue_by_id(self, _id: str) -> Optional[XIVVenue]:
+    async def _get(self, key: Hashable, url: str) -> Any:
 
-        query = self.URL_BASE + f"/{_id}"
+        entry = self._cache.get(key)
+        if entry is None:
+            return await self._load(key, url)
 
-        if self._state.DEBUG:
-            print("Executing XIVClient query: " + query)
+        if entry.age() >= self.CACHE_TTL and key not in self._refreshing:
+            task = asyncio.create_task(self._refresh(key, url))
+            self._refreshing[key] = task
 
-        response = requests.get(query)
+        return entry.data
 
-        if response.status_code != 200:
-            raise Exception(
-                "Failed to get venue by name - response status code: " +
-                str(response.status_code)
-            )
+################################################################################
+    async def _refresh(self, key: Hashable, url: str) -> None:
 
-        if self._state.DEBUG:
-            print("Response: " + str(response.json()))
+        try:
+            await self._load(key, url)
+        except Exception as ex:
+            log.warning(f"Background refresh of XIV Venues query '{url}' failed: {ex}", None)
+        finally:
+            self._refreshing.pop(key, None)
 
-        js = response.json()
-        if "status" in js and js["status"] == 404:
-            return None
+################################################################################
+    async def get_venues_by_manager(self, manager_id: int) -> List[XIVVenue]:
 
-        return XIVVenue.from_data(js)
+        data = await self._get(("manager", int(manager_id)), f"{self._base_url}?manager={manager_id}")
+        return [XIVVenue.from_data(venue) for venue in data or []]
 
 ################################################################################
-    async def get_all_venues(self) -> List[XIVVenue]:
+    async def get_venue_by_id(self, _id: str) -> Optional[XIVVenue]:
 
-        query = self.URL_BASE
+        data = await self._get(("venue", _id), f"{self._base_url}/{_id}")
+        if data is None:
+            return None
 
-        load_dotenv()
-        if os.getenv("DEBUG") == "True":
-            print("Executing XIVClient query: " + query)
+        return XIVVenue.from_data(data)
 
-        response = requests.get(query)
+################################################################################
+    async def get_all_venues(self) -> List[XIVVenue]:
 
-        if response.status_code != 200:
-            raise Exception(
-                "Failed to get all venues - response status code: " +
-                str(response.status_code)
-            )
+        # Always hit the API here; this is the daily sync's source of truth.
+        data = await self._load(("all", ), self._base_url) or []
 
         ret = []
-
-        for venue in response.json():
+        for venue in data:
+            # Seed the per-venue cache so follow-up lookups don't refetch.
+            self._cache[("venue", venue["id"])] = _CacheEntry(venue, None)
             ret.append(XIVVenue.from_data(venue))
 
         print(f"Returned {len(ret)} venues.")
@@ -0,0 +1,62 @@
+"""
+Offline stand-in for the FFXIV Venues API, fed by `_test_data.json`.
+
+Run with `python -m Classes.XIVVenues._stub_server [port]` and point the bot at
+it by setting `XIV_VENUES_URL=http://localhost:<port>/venue`.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+from typing import Any, Dict, List
+
+from aiohttp import web
+################################################################################
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), "_test_data.json")
+
+################################################################################
+def _json_response(request: web.Request, payload: Any) -> web.Response:
+
+    body = json.dumps(payload)
+    etag = '"' + hashlib.sha1(body.encode("utf-8")).hexdigest() + '"'
+
+    if request.headers.get("If-None-Match") == etag:
+        return web.Response(status=304, headers={"ETag": etag})
+
+    return web.Response(text=body, content_type="application/json", headers={"ETag": etag})
+
+################################################################################
+def make_app(data: List[Dict[str, Any]]) -> web.Application:
+
+    by_id = {v["id"]: v for v in data}
+
+    async def venues(request: web.Request) -> web.Response:
+        manager = request.query.get("manager")
+        if manager is None:
+            return _json_response(request, data)
+        return _json_response(request, [v for v in data if manager in v.get("managers", [])])
+
+    async def venue(request: web.Request) -> web.Response:
+        ret = by_id.get(request.match_info["venue_id"])
+        if ret is None:
+            return web.json_response({"status": 404}, status=404)
+        return _json_response(request, ret)
+
+    app = web.Application()
+    app.router.add_get("/venue", venues)
+    app.router.add_get("/venue/{venue_id}", venue)
+
+    return app
+
+################################################################################
+if __name__ == "__main__":
+
+    with open(DATA_PATH, "r", encoding="utf-8") as file:
+        test_data = json.load(file)
+
+    web.run_app(make_app(test_data), port=int(sys.argv[1]) if len(sys.argv) > 1 else 8085)
+
+################################################################################
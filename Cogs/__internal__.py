@@ -4,6 +4,8 @@ from discord import Cog
 from typing import TYPE_CHECKING, List
 from discord.ext import tasks
 
+from Classes.Common import LazyLoadableType
+
 if TYPE_CHECKING:
     from Classes import StaffPartyBot
 ################################################################################
@@ -36,8 +38,88 @@ class Internal(Cog):
     @Cog.listener("on_member_remove")
     async def on_member_remove(self, member) -> None:
 
+        self.bot.resolver_cache.invalidate(LazyLoadableType.User, member.id)
         await self.bot.on_member_leave(member)
         
+################################################################################
+    @Cog.listener("on_member_update")
+    async def on_member_update(self, before, after) -> None:
+
+        self.bot.resolver_cache.invalidate(LazyLoadableType.User, after.id)
+        self.bot.role_manager.on_member_update(before, after)
+
+################################################################################
+    @Cog.listener("on_guild_role_create")
+    async def on_guild_role_create(self, role) -> None:
+
+        self.bot.role_manager.on_role_create(role)
+
+################################################################################
+    @Cog.listener("on_guild_role_update")
+    async def on_guild_role_update(self, before, after) -> None:
+
+        self.bot.resolver_cache.invalidate(LazyLoadableType.Role, after.id)
+        self.bot.role_manager.on_role_update(before, after)
+
+################################################################################
+    @Cog.listener("on_guild_role_delete")
+    async def on_guild_role_delete(self, role) -> None:
+
+        self.bot.resolver_cache.invalidate(LazyLoadableType.Role, role.id)
+        self.bot.role_manager.on_role_delete(role)
+
+################################################################################
+    @Cog.listener("on_guild_channel_update")
+    async def on_guild_channel_update(self, before, after) -> None:
+
+        self.bot.resolver_cache.invalidate(LazyLoadableType.Channel, after.id)
+
+################################################################################
+    @Cog.listener("on_guild_channel_delete")
+    async def on_guild_channel_delete(self, channel) -> None:
+
+        self.bot.resolver_cache.invalidate(LazyLoadableType.Channel, channel.id)
+
+################################################################################
+    @Cog.listener("on_message")
+    async def on_message(self, message) -> None:
+
+        await self.bot.jobs_manager.on_message(message)
+
+################################################################################
+    @Cog.listener("on_raw_message_delete")
+    async def on_raw_message_delete(self, payload) -> None:
+
+        self.bot.resolver_cache.invalidate(LazyLoadableType.Message, payload.message_id)
+        self.bot.jobs_manager.on_message_delete(payload)
+
+################################################################################
+    @Cog.listener("on_raw_bulk_message_delete")
+    async def on_raw_bulk_message_delete(self, payload) -> None:
+
+        for message_id in payload.message_ids:
+            self.bot.resolver_cache.invalidate(LazyLoadableType.Message, message_id)
+        self.bot.jobs_manager.on_bulk_message_delete(payload)
+
+################################################################################
+    @Cog.listener("on_raw_message_edit")
+    async def on_raw_message_edit(self, payload) -> None:
+
+        self.bot.resolver_cache.invalidate(LazyLoadableType.Message, payload.message_id)
+        self.bot.attachment_cache.on_message_edit(payload.message_id)
+
+################################################################################
+    @Cog.listener("on_thread_create")
+    async def on_thread_create(self, thread) -> None:
+
+        await self.bot.jobs_manager.on_thread_create(thread)
+
+################################################################################
+    @Cog.listener("on_raw_thread_delete")
+    async def on_raw_thread_delete(self, payload) -> None:
+
+        self.bot.jobs_manager.on_thread_delete(payload.thread_id)
+
 ################################################################################
     @tasks.loop(minutes=5)
     async def clear_member_cache_routine(self) -> None:
@@ -49,9 +131,6 @@ class Internal(Cog):
     async def manager_routines(self) -> None:
 
         await self.bot.jobs_manager.cull_postings()
-        await self.bot.jobs_manager.check_revisits()
-
-        await self.bot.services_manager.check_revisits()
 
 ################################################################################
     @tasks.loop(hours=24)
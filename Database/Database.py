@@ -1,17 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 import os
+import threading
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Generator
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Generator
 
 from dotenv import load_dotenv
 from sqlalchemy import create_engine, Engine
 from sqlalchemy.orm import sessionmaker, Session, scoped_session
 
 from .DatabaseDeleter import DatabaseDeleter
+from .DatabaseExecutor import AsyncFacade, DatabaseExecutor
 from .DatabaseInserter import DatabaseInserter
 from .DatabaseLoader import DatabaseLoader
 from .DatabaseUpdater import DatabaseUpdater
+from .UnitOfWork import UnitOfWork
 
 if TYPE_CHECKING:
     from Classes import StaffPartyBot
@@ -30,8 +34,15 @@ class Database:
         "_loader",
         "_engine",
         "_session",
+        "_uow",
+        "_executor",
+        "_streams",
     )
 
+    # Each open stream holds a pooled connection for its whole read, so only
+    # this many run at once, leaving the rest of the pool free for other work.
+    MAX_STREAMS = 4
+
 ################################################################################
     def __init__(self, state: StaffPartyBot) -> None:
 
@@ -52,14 +63,21 @@ class Database:
             sessionmaker(autocommit=False, autoflush=False, bind=self._engine)
         )
 
-        self._inserter: DatabaseInserter = DatabaseInserter(self)
+        # Every query and commit runs on this worker so the event loop never
+        # blocks on the database.
+        self._executor: DatabaseExecutor = DatabaseExecutor()
+        self._uow: UnitOfWork = UnitOfWork(self)
+
+        self._inserter: AsyncFacade = AsyncFacade(self._executor, DatabaseInserter(self))
         self._updater: DatabaseUpdater = DatabaseUpdater(self)
         self._deleter: DatabaseDeleter = DatabaseDeleter(self)
         self._loader: DatabaseLoader = DatabaseLoader(self)
+        self._streams: asyncio.Semaphore = asyncio.Semaphore(self.MAX_STREAMS)
 
 ################################################################################
     @property
     def insert(self) -> DatabaseInserter:
+        """Each `DatabaseInserter` method returns a coroutine run on the executor."""
 
         return self._inserter
 
@@ -75,6 +93,33 @@ class Database:
 
         return self._deleter
 
+################################################################################
+    @property
+    def unit_of_work(self) -> UnitOfWork:
+
+        return self._uow
+
+################################################################################
+    @property
+    def executor(self) -> DatabaseExecutor:
+
+        return self._executor
+
+################################################################################
+    async def flush(self) -> int:
+
+        return await self._uow.flush()
+
+################################################################################
+    async def close(self) -> None:
+
+        # Queued deletes first, then whatever the write-behind buffer holds,
+        # all before the worker thread goes away.
+        await self._executor.drain()
+        await self._uow.close()
+        await self._executor.drain()
+        self._executor.shutdown()
+
 ################################################################################
     @contextmanager
     def _get_db(self) -> Generator[Session | Any, Any, None]:
@@ -90,13 +135,78 @@ class Database:
             db.close()
 
 ################################################################################
-    def load_all(self) -> Optional[Dict[str, Any]]:
+    async def load_all(self) -> Optional[Dict[str, Any]]:
+        """
+        Returns the startup payload. Row collections are async streams of
+        chunks, so each manager can build its objects while the rows are
+        still arriving, and the managers can load in parallel.
+        """
+
+        top_level = await self._executor.run(self._loader.load_top_level)
+        if top_level is None:
+            return None
+
+        return {
+            "channel_manager": top_level["channel_manager"],
+            "role_manager": top_level["role_manager"],
+            "venue_manager": {"venues": self.stream("venues")},
+            "bg_check_manager": {
+                **top_level["bg_check_manager"],
+                "bg_checks": self.stream("bg_checks"),
+            },
+            "profile_manager": {"profiles": self.stream("profiles")},
+            "jobs_manager": {
+                "temporary_jobs": self.stream("temporary_jobs"),
+                "permanent_jobs": self.stream("permanent_jobs"),
+                "trainee_message": top_level["trainee_message"],
+            },
+            "dj_manager": {"profiles": self.stream("dj_profiles")},
+            "service_manager": {"service_requests": self.stream("service_requests")},
+            "fanout": {"blasts": self.stream("dm_blasts")},
+            "welcome_manager": {"pending": self.stream("pending_welcomes")},
+            "scheduler": {"tasks": self.stream("scheduled_tasks")},
+            "post_fingerprints": {"fingerprints": self.stream("post_fingerprints")},
+        }
 
-        return self._loader.load_all()
+################################################################################
+    async def stream(self, name: str) -> AsyncIterator[List[Dict[str, Any]]]:
+
+        # Each stream reads on its own thread (and so its own scoped session),
+        # handing chunks over through a small queue that bounds memory use.
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+        stop = threading.Event()
+        done = object()
+
+        def produce() -> None:
+            try:
+                for chunk in self._loader.stream(name):
+                    if stop.is_set():
+                        return
+                    asyncio.run_coroutine_threadsafe(queue.put(chunk), loop).result()
+            except Exception as ex:
+                asyncio.run_coroutine_threadsafe(queue.put(ex), loop).result()
+            finally:
+                asyncio.run_coroutine_threadsafe(queue.put(done), loop).result()
+
+        async with self._streams:
+            producer = loop.run_in_executor(None, produce)
+            try:
+                while (item := await queue.get()) is not done:
+                    if isinstance(item, Exception):
+                        raise item
+                    yield item
+            finally:
+                stop.set()
+                while not producer.done():
+                    # Unblock a producer waiting on a full queue.
+                    while not queue.empty():
+                        queue.get_nowait()
+                    await asyncio.sleep(0.01)
 
 ################################################################################
-    def fetch_guild(self, guild_id: int) -> bool:
+    async def fetch_guild(self, guild_id: int) -> bool:
 
-        return self._loader.check_guild(guild_id)
+        return await self._executor.run(self._loader.check_guild, guild_id)
 
 ################################################################################
@@ -25,6 +25,13 @@ class DatabaseDeleter:
 ################################################################################
     def _delete_record(self, model_class: Type, _id: int) -> None:
 
+        self._parent.unit_of_work.forget(model_class, id=_id)
+        # Queued behind any pending writes for the row; callers don't wait on it.
+        self._parent.executor.submit(self._delete_row, model_class, _id)
+
+################################################################################
+    def _delete_row(self, model_class: Type, _id: int) -> None:
+
         with self._parent._get_db() as db:
             try:
                 # Query and delete all matching records
@@ -94,4 +101,24 @@ class DatabaseDeleter:
 
         self._delete_record(Models.ServiceRequestModel, request_id)
 
+################################################################################
+    def dm_blast(self, blast_id: int) -> None:
+
+        self._delete_record(Models.DMBlastModel, blast_id)
+
+################################################################################
+    def pending_welcome(self, welcome_id: int) -> None:
+
+        self._delete_record(Models.PendingWelcomeModel, welcome_id)
+
+################################################################################
+    def scheduled_task(self, task_id: int) -> None:
+
+        self._delete_record(Models.ScheduledTaskModel, task_id)
+
+################################################################################
+    def post_fingerprint(self, fingerprint_id: int) -> None:
+
+        self._delete_record(Models.PostFingerprintModel, fingerprint_id)
+
 ################################################################################
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional, Set, TypeVar
+
+from logger import log
+################################################################################
+
+__all__ = ("DatabaseExecutor", "AsyncFacade")
+
+T = TypeVar("T")
+
+################################################################################
+class DatabaseExecutor:
+    """
+    Runs blocking SQLAlchemy work on a dedicated worker thread.
+
+    A single worker keeps statements in submission order (an insert is always
+    committed before a later update or delete of the same row), and a bounded
+    number of in-flight jobs applies back-pressure instead of letting the
+    queue grow without limit during bursts.
+    """
+
+    __slots__ = (
+        "_executor",
+        "_slots",
+        "_submitted",
+        "_closed",
+    )
+
+    MAX_PENDING = 256
+
+################################################################################
+    def __init__(self) -> None:
+
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="spb-db"
+        )
+        self._slots: Optional[asyncio.Semaphore] = None
+        # Fire-and-forget jobs still to finish; `drain()` waits on these.
+        self._submitted: Set[asyncio.Task] = set()
+        self._closed: bool = False
+
+################################################################################
+    @property
+    def slots(self) -> asyncio.Semaphore:
+
+        # Created lazily so it binds to the running event loop.
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.MAX_PENDING)
+
+        return self._slots
+
+################################################################################
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+
+        async with self.slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+################################################################################
+    def submit(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Optional[asyncio.Task]:
+        """
+        Schedules `func` without waiting for it. Errors are logged. Outside an
+        event loop, or once the executor is shut down, the call simply runs
+        inline.
+        """
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            func(*args, **kwargs)
+            return None
+
+        if self._closed:
+            log.warning(f"Database executor is shut down; running {getattr(func, '__name__', func)} inline.", None)
+            func(*args, **kwargs)
+            return None
+
+        task = loop.create_task(self.run(func, *args, **kwargs))
+        self._submitted.add(task)
+        task.add_done_callback(self._submitted.discard)
+        task.add_done_callback(self._log_failure)
+
+        return task
+
+################################################################################
+    @staticmethod
+    def _log_failure(task: asyncio.Task) -> None:
+
+        if not task.cancelled() and task.exception() is not None:
+            log.error(f"Queued database operation failed: {task.exception()!r}", None)
+
+################################################################################
+    async def drain(self) -> None:
+        """Waits for every job passed to `submit()`, including any they submit in turn."""
+
+        while self._submitted:
+            await asyncio.gather(*self._submitted, return_exceptions=True)
+
+################################################################################
+    def shutdown(self) -> None:
+
+        # Callers drain first, so there's nothing left to wait for and the
+        # event loop isn't held up joining the worker thread.
+        self._closed = True
+        self._executor.shutdown(wait=False)
+
+################################################################################
+class AsyncFacade:
+    """Exposes every method of `target` as a coroutine that runs on the executor."""
+
+    __slots__ = (
+        "_executor",
+        "_target",
+    )
+
+################################################################################
+    def __init__(self, executor: DatabaseExecutor, target: Any) -> None:
+
+        self._executor: DatabaseExecutor = executor
+        self._target: Any = target
+
+################################################################################
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+
+        func = getattr(self._target, name)
+
+        async def runner(*args: Any, **kwargs: Any) -> Any:
+            return await self._executor.run(func, *args, **kwargs)
+
+        return runner
+
+################################################################################
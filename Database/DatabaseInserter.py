@@ -333,4 +333,60 @@ class DatabaseInserter:
                 db.rollback()
                 raise ValueError(f"Error creating service request: {str(e)}")
 
+################################################################################
+    def dm_blast(self, kind: str, ref_id: int, user_ids: List[int]) -> Dict[str, Any]:
+
+        with self._parent._get_db() as db:
+            try:
+                new_blast = DMBlastModel(kind=kind, ref_id=ref_id, pending_ids=user_ids)
+                db.add(new_blast)
+                db.commit()
+                db.refresh(new_blast)
+                return DMBlastSchema.model_validate(new_blast).model_dump()
+            except Exception as e:
+                db.rollback()
+                raise ValueError(f"Error creating DM blast: {str(e)}")
+
+################################################################################
+    def pending_welcome(self, user_id: int, due_at: datetime) -> Dict[str, Any]:
+
+        with self._parent._get_db() as db:
+            try:
+                new_welcome = PendingWelcomeModel(user_id=user_id, due_at=due_at)
+                db.add(new_welcome)
+                db.commit()
+                db.refresh(new_welcome)
+                return PendingWelcomeSchema.model_validate(new_welcome).model_dump()
+            except Exception as e:
+                db.rollback()
+                raise ValueError(f"Error creating pending welcome: {str(e)}")
+
+################################################################################
+    def scheduled_task(self, kind: str, ref_id: int, due_at: datetime) -> Dict[str, Any]:
+
+        with self._parent._get_db() as db:
+            try:
+                new_task = ScheduledTaskModel(kind=kind, ref_id=ref_id, due_at=due_at)
+                db.add(new_task)
+                db.commit()
+                db.refresh(new_task)
+                return ScheduledTaskSchema.model_validate(new_task).model_dump()
+            except Exception as e:
+                db.rollback()
+                raise ValueError(f"Error creating scheduled task: {str(e)}")
+
+################################################################################
+    def post_fingerprint(self, message_id: int, hashes: Dict[str, str]) -> Dict[str, Any]:
+
+        with self._parent._get_db() as db:
+            try:
+                new_fingerprint = PostFingerprintModel(message_id=message_id, **hashes)
+                db.add(new_fingerprint)
+                db.commit()
+                db.refresh(new_fingerprint)
+                return PostFingerprintSchema.model_validate(new_fingerprint).model_dump()
+            except Exception as e:
+                db.rollback()
+                raise ValueError(f"Error creating post fingerprint: {str(e)}")
+
 ################################################################################
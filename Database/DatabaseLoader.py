@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, Any, Optional, List, Type, TypeVar
-from sqlalchemy.orm import selectinload
+from typing import TYPE_CHECKING, Dict, Any, Iterator, Optional, List, Type, Tuple
+
+from pydantic import BaseModel
+from sqlalchemy import Column, select
+from sqlalchemy.orm import Session
 
 from .Models import *
 from .Schemas import *
@@ -10,9 +13,34 @@ if TYPE_CHECKING:
     from Database import Database
 ################################################################################
 
-__all__ = ("DatabaseLoader",)
-
-T = TypeVar("T")
+__all__ = ("DatabaseLoader", "STREAMS")
+
+CHUNK_SIZE = 500
+
+# Stream name -> (model, schema, key column, {attribute: (child model, child schema, foreign key)})
+STREAMS: Dict[str, Tuple[Type, Type[BaseModel], str, Dict[str, Tuple[Type, Type[BaseModel], str]]]] = {
+    "venues": (VenueModel, VenueSchema, "id", {
+        "schedules": (VenueScheduleModel, VenueScheduleSchema, "venue_id"),
+        "special_events": (SpecialEventModel, SpecialEventSchema, "venue_id"),
+    }),
+    "bg_checks": (BGCheckModel, BGCheckSchema, "id", {
+        "venues": (BGCheckVenueModel, BGCheckVenueSchema, "bg_check_id"),
+    }),
+    "profiles": (StaffProfileModel, StaffProfileSchema, "user_id", {
+        "availability": (ProfileAvailabilityModel, ProfileAvailabilitySchema, "profile_id"),
+        "additional_images": (ProfileAdditionalImageModel, AdditionalImageSchema, "profile_id"),
+    }),
+    "temporary_jobs": (TemporaryJobPostingModel, TemporaryJobPostingSchema, "id", {}),
+    "permanent_jobs": (PermanentJobPostingModel, PermanentJobPostingSchema, "id", {}),
+    "dj_profiles": (DJProfileModel, DJProfileSchema, "user_id", {
+        "availability": (DJProfileAvailabilityModel, DJAvailabilitySchema, "profile_id"),
+    }),
+    "service_requests": (ServiceRequestModel, ServiceRequestSchema, "id", {}),
+    "dm_blasts": (DMBlastModel, DMBlastSchema, "id", {}),
+    "pending_welcomes": (PendingWelcomeModel, PendingWelcomeSchema, "id", {}),
+    "scheduled_tasks": (ScheduledTaskModel, ScheduledTaskSchema, "id", {}),
+    "post_fingerprints": (PostFingerprintModel, PostFingerprintSchema, "id", {}),
+}
 
 ################################################################################
 class DatabaseLoader:
@@ -39,75 +67,85 @@ class DatabaseLoader:
             return guild is not None
 
 ################################################################################
-    def load_all(self) -> Optional[Dict[str, Any]]:
+    def load_top_level(self) -> Optional[Dict[str, Any]]:
 
         with self._parent._get_db() as db:
-            top_level = db.query(TopLevelDataModel).options(
-                selectinload(TopLevelDataModel.venues).selectinload(VenueModel.schedules),
-                selectinload(TopLevelDataModel.venues).selectinload(VenueModel.special_events),
-                selectinload(TopLevelDataModel.bg_checks).selectinload(BGCheckModel.venues),
-                selectinload(TopLevelDataModel.profiles).selectinload(StaffProfileModel.additional_images),
-                selectinload(TopLevelDataModel.profiles).selectinload(StaffProfileModel.availability),
-                selectinload(TopLevelDataModel.temporary_jobs),
-                selectinload(TopLevelDataModel.permanent_jobs),
-                selectinload(TopLevelDataModel.dj_profiles),
-            ).first()
-
-            def map_schema(schema: Type[T], objects: List[Any]) -> List[T]:
-                return [schema.model_validate(obj) for obj in objects]
-
-            return MasterResponseSchema(
-                channel_manager=ChannelManagerSchema.model_validate(top_level),
-                role_manager=RoleManagerSchema.model_validate(top_level),
-                venue_manager=VenueManagerSchema(
-                    venues=[
-                        VenueSchema.model_validate(
-                            v,
-                            context={
-                                "schedules": map_schema(VenueScheduleSchema, v.schedules),
-                                "special_events": map_schema(SpecialEventSchema, v.special_events)
-                            }
-                        ) for v in top_level.venues
-                    ]
-                ),
-                bg_check_manager=BGCheckManagerSchema(
-                    bg_check_channel_id=top_level.bg_check_channel_id,
-                    staff_role_id=top_level.staff_role_id,
-                    staff_pending_role_id=top_level.staff_pending_role_id,
-                    bg_checks=[
-                        BGCheckSchema.model_validate(
-                            bg,
-                            context={"venues": map_schema(BGCheckVenueSchema, bg.venues)}
-                        ) for bg in top_level.bg_checks
-                    ]
-                ),
-                profile_manager=ProfileManagerSchema(
-                    profiles=[
-                        StaffProfileSchema.model_validate(
-                            prof,
-                            context={
-                                "availability": map_schema(ProfileAvailabilitySchema, prof.availability),
-                                "additional_images": map_schema(AdditionalImageSchema, prof.additional_images)
-                            }
-                        ) for prof in top_level.profiles
-                    ]
-                ),
-                jobs_manager=JobsManagerSchema(
-                    temporary_jobs=map_schema(TemporaryJobPostingSchema, top_level.temporary_jobs),
-                    permanent_jobs=map_schema(PermanentJobPostingSchema, top_level.permanent_jobs),
-                    trainee_message=TraineeMessageSchema(post_url=top_level.trainee_message_url),
-                ),
-                dj_manager=DJManagerSchema(
-                    profiles=[
-                        DJProfileSchema.model_validate(
-                            prof,
-                            context={"availability": map_schema(DJAvailabilitySchema, prof.availability)}
-                        ) for prof in top_level.dj_profiles
-                    ]
-                ),
-                service_manager=ServiceRequestManagerSchema(
-                    service_requests=map_schema(ServiceRequestSchema, top_level.service_requests),
-                )
-            ).model_dump()
+            top_level = db.query(TopLevelDataModel).first()
+            if top_level is None:
+                return None
+
+            return {
+                "channel_manager": ChannelManagerSchema.model_validate(top_level).model_dump(),
+                "role_manager": RoleManagerSchema.model_validate(top_level).model_dump(),
+                "bg_check_manager": {
+                    "bg_check_channel_id": top_level.bg_check_channel_id,
+                    "staff_role_id": top_level.staff_role_id,
+                    "staff_pending_role_id": top_level.staff_pending_role_id,
+                },
+                "trainee_message": TraineeMessageSchema(post_url=top_level.trainee_message_url).model_dump(),
+            }
+
+################################################################################
+    @staticmethod
+    def _columns(model: Type, schema: Type[BaseModel]) -> List[Column]:
+
+        # Only the columns the schema exposes, so constructors get the same
+        # keyword arguments they always did.
+        table = model.__table__.c
+        return [table[name] for name in schema.model_fields if name in table]
+
+################################################################################
+    def stream(self, name: str, chunk_size: int = CHUNK_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yields the rows for one of `STREAMS` in chunks of plain dicts, with
+        child rows nested under their parent. Rows are read through a
+        server-side cursor and never become ORM objects or pydantic models.
+        """
+
+        model, schema, key, children = STREAMS[name]
+
+        with self._parent._get_db() as db:
+            top_level_id = db.query(TopLevelDataModel.id).limit(1).scalar()
+            result = db.execute(
+                select(*self._columns(model, schema))
+                .where(model.top_level_id == top_level_id)
+                .order_by(getattr(model, key))
+                .execution_options(yield_per=chunk_size)
+            ).mappings()
+
+            for partition in result.partitions():
+                rows = [dict(row) for row in partition]
+                keys = [row[key] for row in rows]
+
+                for attr, (child_model, child_schema, parent_fk) in children.items():
+                    grouped = self._load_children(db, child_model, child_schema, parent_fk, keys)
+                    for row in rows:
+                        row[attr] = grouped.get(row[key], [])
+
+                yield rows
+
+################################################################################
+    def _load_children(
+        self,
+        db: Session,
+        model: Type,
+        schema: Type[BaseModel],
+        parent_fk: str,
+        keys: List[Any]
+    ) -> Dict[Any, List[Dict[str, Any]]]:
+
+        ret = {}
+
+        result = db.execute(
+            select(getattr(model, parent_fk).label("_parent_key"), *self._columns(model, schema))
+            .where(getattr(model, parent_fk).in_(keys))
+            .order_by(model.id)
+        ).mappings()
+
+        for row in result:
+            data = dict(row)
+            ret.setdefault(data.pop("_parent_key"), []).append(data)
+
+        return ret
 
 ################################################################################
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Type, List, Union
+from typing import TYPE_CHECKING, Any, Dict, Type, List, Union, Tuple, Optional
 
 from . import Models
 
@@ -24,81 +24,126 @@ class DatabaseUpdater:
         self._parent = parent
 
 ################################################################################
-    def _update_record(
-        self,
-        model_class: Type,
-        data: Dict[str, Any],
-        **identifiers: Any
-    ) -> None:
-
-        with self._parent._get_db() as db:
-            query = db.query(model_class).filter_by(**identifiers)
-            existing = query.first()
-
-            if existing is None:
-                raise ValueError(f"{model_class.__name__} not found with identifiers {identifiers}")
+    def _update_record(self, model_class: Type, obj: Any, **identifiers: Any) -> None:
 
-            try:
-                for key, value in data.items():
-                    setattr(existing, key, value)
-                db.commit()
-            except Exception as e:
-                db.rollback()
-                raise e
+        self._parent.unit_of_work.register(model_class, obj, **identifiers)
 
 ################################################################################
     def venue(self, v: Venue) -> None:
 
-        self._update_record(Models.VenueModel, v.to_dict(), id=v.id)
+        self._update_record(Models.VenueModel, v, id=v.id)
 
 ################################################################################
     def venue_hours(self, vh: VenueHours) -> None:
 
-        self._update_record(Models.VenueScheduleModel, vh.to_dict(), id=vh.id)
+        self._update_record(Models.VenueScheduleModel, vh, id=vh.id)
+
+################################################################################
+    async def venue_sync(
+        self,
+        changes: List[Tuple[int, Dict[str, Any], Optional[List[Dict[str, Any]]]]]
+    ) -> Dict[int, List[int]]:
+        """
+        Writes a batch of XIV sync results in a single transaction. Each change is
+        (venue id, changed columns, replacement schedule rows or None).
+        Returns the new schedule ids for every venue whose schedule was replaced.
+        """
+
+        ret = await self._parent.executor.run(self._write_venue_sync, changes)
+
+        for venue_id, columns, _ in changes:
+            self._parent.unit_of_work.remember(Models.VenueModel, columns, id=venue_id)
+
+        return ret
+
+################################################################################
+    def _write_venue_sync(
+        self,
+        changes: List[Tuple[int, Dict[str, Any], Optional[List[Dict[str, Any]]]]]
+    ) -> Dict[int, List[int]]:
+
+        ret = {}
+
+        with self._parent._get_db() as db:
+            for venue_id, columns, schedule in changes:
+                if columns:
+                    db.query(Models.VenueModel).filter_by(id=venue_id).update(
+                        columns, synchronize_session=False
+                    )
+                if schedule is not None:
+                    db.query(Models.VenueScheduleModel).filter_by(venue_id=venue_id).delete(
+                        synchronize_session=False
+                    )
+                    rows = [Models.VenueScheduleModel(venue_id=venue_id, **s) for s in schedule]
+                    db.add_all(rows)
+                    db.flush()
+                    ret[venue_id] = [r.id for r in rows]
+
+        return ret
 
 ################################################################################
     def top_level(self, top_level_obj: Any) -> None:
 
-        self._update_record(Models.TopLevelDataModel, top_level_obj.to_dict(), id=1)
+        self._update_record(Models.TopLevelDataModel, top_level_obj, id=1)
 
 ################################################################################
     def bg_check(self, bg: BGCheck) -> None:
 
-        self._update_record(Models.BGCheckModel, bg.to_dict(), id=bg.id)
+        self._update_record(Models.BGCheckModel, bg, id=bg.id)
 
 ################################################################################
     def profile(self, p: Union[Profile, ProfileSection]) -> None:
 
-        self._update_record(Models.StaffProfileModel, p.to_dict(), user_id=p.user_id)
+        self._update_record(Models.StaffProfileModel, p, user_id=p.user_id)
 
 ################################################################################
     def additional_image(self, ai: AdditionalImage) -> None:
 
-        self._update_record(Models.ProfileAdditionalImageModel, ai.to_dict(), id=ai.id)
+        self._update_record(Models.ProfileAdditionalImageModel, ai, id=ai.id)
 
 ################################################################################
     def permanent_job(self, job: PermanentJobPosting) -> None:
 
-        self._update_record(Models.PermanentJobPostingModel, job.to_dict(), id=job.id)
+        self._update_record(Models.PermanentJobPostingModel, job, id=job.id)
 
 ################################################################################
     def temporary_job(self, job: TemporaryJobPosting) -> None:
 
-        self._update_record(Models.TemporaryJobPostingModel, job.to_dict(), id=job.id)
+        self._update_record(Models.TemporaryJobPostingModel, job, id=job.id)
 
 ################################################################################
     def dj_profile(self, dj_profile: DJProfile) -> None:
 
-        self._update_record(Models.DJProfileModel, dj_profile.to_dict(), user_id=dj_profile.id)
+        self._update_record(Models.DJProfileModel, dj_profile, user_id=dj_profile.id)
 
 ################################################################################
     def special_event(self, se: SpecialEvent) -> None:
 
-        self._update_record(Models.SpecialEventModel, se.to_dict(), id=se.id)
+        self._update_record(Models.SpecialEventModel, se, id=se.id)
 
 ################################################################################
     def service_request(self, sr: ServiceRequest) -> None:
 
-        self._update_record(Models.ServiceRequestModel, sr.to_dict(), id=sr.id)
+        self._update_record(Models.ServiceRequestModel, sr, id=sr.id)
+
+################################################################################
+    def dm_blast(self, blast: DMBlast) -> None:
+
+        self._update_record(Models.DMBlastModel, blast, id=blast.id)
+
+################################################################################
+    def pending_welcome(self, welcome: PendingWelcome) -> None:
+
+        self._update_record(Models.PendingWelcomeModel, welcome, id=welcome.id)
+
+################################################################################
+    def scheduled_task(self, task: ScheduledTask) -> None:
+
+        self._update_record(Models.ScheduledTaskModel, task, id=task.id)
+
+################################################################################
+    def post_fingerprint(self, fp: PostFingerprint) -> None:
+
+        self._update_record(Models.PostFingerprintModel, fp, id=fp.id)
 
 ################################################################################
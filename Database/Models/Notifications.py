@@ -0,0 +1,58 @@
+from sqlalchemy import Column, Integer, BigInteger, ForeignKey, ARRAY, String, DateTime, UniqueConstraint, func
+from sqlalchemy.orm import relationship
+
+from .Base import Base
+################################################################################
+
+__all__ = ("DMBlastModel", "PendingWelcomeModel", "ScheduledTaskModel")
+
+################################################################################
+class DMBlastModel(Base):
+
+    __tablename__ = "dm_blasts"
+
+    top_level_id = Column(Integer, ForeignKey("top_level.id", name="dm_blasts_top_level_fkey", ondelete="CASCADE"), nullable=False, server_default="1")
+    id = Column(Integer, primary_key=True)
+    kind = Column(String, nullable=False)
+    ref_id = Column(Integer, nullable=False)
+    pending_ids = Column(ARRAY(BigInteger), nullable=False, server_default="{}")
+    sent = Column(Integer, nullable=False, server_default="0")
+    failed = Column(Integer, nullable=False, server_default="0")
+    skipped = Column(Integer, nullable=False, server_default="0")
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    # Relationships
+    top_level = relationship("TopLevelDataModel", back_populates="dm_blasts")
+
+################################################################################
+class PendingWelcomeModel(Base):
+
+    __tablename__ = "pending_welcomes"
+
+    top_level_id = Column(Integer, ForeignKey("top_level.id", name="pending_welcomes_top_level_fkey", ondelete="CASCADE"), nullable=False, server_default="1")
+    id = Column(Integer, primary_key=True)
+    user_id = Column(BigInteger, nullable=False, unique=True)
+    due_at = Column(DateTime(timezone=True), nullable=False)
+    attempts = Column(Integer, nullable=False, server_default="0")
+
+    # Relationships
+    top_level = relationship("TopLevelDataModel", back_populates="pending_welcomes")
+
+################################################################################
+class ScheduledTaskModel(Base):
+
+    __tablename__ = "scheduled_tasks"
+    __table_args__ = (
+        UniqueConstraint("kind", "ref_id", name="scheduled_tasks_kind_ref_id_key"),
+    )
+
+    top_level_id = Column(Integer, ForeignKey("top_level.id", name="scheduled_tasks_top_level_fkey", ondelete="CASCADE"), nullable=False, server_default="1")
+    id = Column(Integer, primary_key=True)
+    kind = Column(String, nullable=False)
+    ref_id = Column(Integer, nullable=False)
+    due_at = Column(DateTime(timezone=True), nullable=False)
+
+    # Relationships
+    top_level = relationship("TopLevelDataModel", back_populates="scheduled_tasks")
+
+################################################################################
@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Integer, BigInteger, ForeignKey, String
+from sqlalchemy.orm import relationship
+
+from .Base import Base
+################################################################################
+
+__all__ = ("PostFingerprintModel",)
+
+################################################################################
+class PostFingerprintModel(Base):
+
+    __tablename__ = "post_fingerprints"
+
+    top_level_id = Column(Integer, ForeignKey("top_level.id", name="post_fingerprints_top_level_fkey", ondelete="CASCADE"), nullable=False, server_default="1")
+    id = Column(Integer, primary_key=True)
+    message_id = Column(BigInteger, nullable=False, unique=True)
+    embeds_hash = Column(String, nullable=True)
+    view_hash = Column(String, nullable=True)
+    tags_hash = Column(String, nullable=True)
+
+    # Relationships
+    top_level = relationship("TopLevelDataModel", back_populates="post_fingerprints")
+
+################################################################################
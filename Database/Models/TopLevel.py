@@ -54,5 +54,9 @@ class TopLevelDataModel(Base):
     permanent_jobs = relationship("PermanentJobPostingModel", back_populates="top_level", passive_deletes=True)
     dj_profiles = relationship("DJProfileModel", back_populates="top_level", passive_deletes=True)
     service_requests = relationship("ServiceRequestModel", back_populates="top_level", passive_deletes=True)
+    dm_blasts = relationship("DMBlastModel", back_populates="top_level", passive_deletes=True)
+    pending_welcomes = relationship("PendingWelcomeModel", back_populates="top_level", passive_deletes=True)
+    scheduled_tasks = relationship("ScheduledTaskModel", back_populates="top_level", passive_deletes=True)
+    post_fingerprints = relationship("PostFingerprintModel", back_populates="top_level", passive_deletes=True)
 
 ################################################################################
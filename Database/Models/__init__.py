@@ -7,4 +7,6 @@ from .Venues import *
 
 from .Base import Base
 from .Services import *
+from .Notifications import *
+from .Posts import *
 ################################################################################
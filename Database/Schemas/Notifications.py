@@ -0,0 +1,46 @@
+from datetime import datetime
+from typing import List
+
+from pydantic import BaseModel
+################################################################################
+
+__all__ = ("DMBlastSchema", "PendingWelcomeSchema", "ScheduledTaskSchema")
+
+################################################################################
+class DMBlastSchema(BaseModel):
+
+    id: int
+    kind: str
+    ref_id: int
+    pending_ids: List[int]
+    sent: int
+    failed: int
+    skipped: int
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+################################################################################
+class PendingWelcomeSchema(BaseModel):
+
+    id: int
+    user_id: int
+    due_at: datetime
+    attempts: int
+
+    class Config:
+        from_attributes = True
+
+################################################################################
+class ScheduledTaskSchema(BaseModel):
+
+    id: int
+    kind: str
+    ref_id: int
+    due_at: datetime
+
+    class Config:
+        from_attributes = True
+
+################################################################################
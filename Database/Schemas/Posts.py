@@ -0,0 +1,20 @@
+from typing import Optional
+
+from pydantic import BaseModel
+################################################################################
+
+__all__ = ("PostFingerprintSchema",)
+
+################################################################################
+class PostFingerprintSchema(BaseModel):
+
+    id: int
+    message_id: int
+    embeds_hash: Optional[str]
+    view_hash: Optional[str]
+    tags_hash: Optional[str]
+
+    class Config:
+        from_attributes = True
+
+################################################################################
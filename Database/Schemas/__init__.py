@@ -5,4 +5,6 @@ from .Jobs import *
 from .Profiles import *
 from .TopLevel import *
 from .Venues import *
+from .Notifications import *
+from .Posts import *
 ################################################################################
@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import time
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Optional, Tuple, Type
+
+from logger import log
+
+if TYPE_CHECKING:
+    from Database import Database
+################################################################################
+
+__all__ = ("UnitOfWork",)
+
+RowKey = Tuple[Type, Tuple[Tuple[str, Any], ...]]
+
+################################################################################
+class UnitOfWork:
+    """
+    Write-behind buffer for record updates.
+
+    Dirty objects are collected for `WINDOW` seconds, then flushed in one
+    session on the database executor. `to_dict()` is evaluated at flush time
+    so the newest in-memory state always wins, and each row is written with a
+    single ``UPDATE ... WHERE <pk>`` containing only the columns that differ
+    from what this process last wrote. If a batch fails, its rows are retried
+    one at a time so a single bad row can't hold back the rest, and a row
+    that keeps failing is dropped after `MAX_ATTEMPTS` flushes.
+    """
+
+    __slots__ = (
+        "_parent",
+        "_dirty",
+        "_snapshots",
+        "_flush_handle",
+        "_flush_lock",
+        "_closed",
+        "_attempts",
+        "_dropped",
+        "_flushes",
+        "_rows_flushed",
+        "_last_rows",
+        "_last_latency",
+        "_max_latency",
+        "_total_latency",
+    )
+
+    WINDOW = 0.5  # seconds
+    MAX_ATTEMPTS = 5
+
+################################################################################
+    def __init__(self, parent: Database) -> None:
+
+        self._parent: Database = parent
+
+        # Row -> {id(obj): obj}. Several objects can map onto one row
+        # (eg. the sections of a staff profile).
+        self._dirty: Dict[RowKey, Dict[int, Any]] = {}
+        self._snapshots: Dict[RowKey, Dict[str, Any]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # One flush at a time: a batch has to be diffed against the snapshots
+        # the previous flush committed, not the ones from before it.
+        self._flush_lock: asyncio.Lock = asyncio.Lock()
+        self._closed: bool = False
+        # Row -> consecutive failed flushes
+        self._attempts: Dict[RowKey, int] = {}
+        self._dropped: int = 0
+
+        self._flushes: int = 0
+        self._rows_flushed: int = 0
+        self._last_rows: int = 0
+        self._last_latency: float = 0.0
+        self._max_latency: float = 0.0
+        self._total_latency: float = 0.0
+
+################################################################################
+    @property
+    def pending(self) -> int:
+
+        return len(self._dirty)
+
+################################################################################
+    @property
+    def metrics(self) -> Dict[str, float]:
+
+        return {
+            "pending_rows": len(self._dirty),
+            "dropped_rows": self._dropped,
+            "flushes": self._flushes,
+            "rows_flushed": self._rows_flushed,
+            "last_rows_per_flush": self._last_rows,
+            "avg_rows_per_flush": self._rows_flushed / self._flushes if self._flushes else 0.0,
+            "last_flush_latency": self._last_latency,
+            "avg_flush_latency": self._total_latency / self._flushes if self._flushes else 0.0,
+            "max_flush_latency": self._max_latency,
+        }
+
+################################################################################
+    @staticmethod
+    def _row_key(model_class: Type, identifiers: Dict[str, Hashable]) -> RowKey:
+
+        return model_class, tuple(sorted(identifiers.items()))
+
+################################################################################
+    def register(self, model_class: Type, obj: Any, **identifiers: Any) -> None:
+
+        key = self._row_key(model_class, identifiers)
+        self._dirty.setdefault(key, {})[id(obj)] = obj
+
+        self._schedule()
+
+################################################################################
+    def _schedule(self, write_through: bool = True) -> None:
+
+        if self._flush_handle is not None:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is None or self._closed:
+            # No event loop (eg. a maintenance script), or nothing left to
+            # flush us later; write through.
+            if write_through:
+                self._commit(*self._write(self._take_batch()))
+            return
+
+        self._flush_handle = loop.call_later(
+            self.WINDOW, lambda: loop.create_task(self.flush())
+        )
+
+################################################################################
+    def remember(self, model_class: Type, data: Dict[str, Any], **identifiers: Any) -> None:
+        """Records columns written outside the unit of work so later diffs stay correct."""
+
+        key = self._row_key(model_class, identifiers)
+        if key in self._snapshots:
+            self._snapshots[key].update(copy.deepcopy(data))
+
+################################################################################
+    def forget(self, model_class: Type, **identifiers: Any) -> None:
+
+        key = self._row_key(model_class, identifiers)
+        self._dirty.pop(key, None)
+        self._snapshots.pop(key, None)
+        self._attempts.pop(key, None)
+
+################################################################################
+    async def flush(self) -> int:
+        """
+        Collects the pending rows on the event loop, then writes them on the
+        database executor. Waits for any flush already in progress first.
+        """
+
+        async with self._flush_lock:
+            return await self._flush()
+
+################################################################################
+    async def _flush(self) -> int:
+
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        dirty = self._dirty
+        batch = self._take_batch()
+        if not batch:
+            return 0
+
+        try:
+            written, elapsed = await self._parent.executor.run(self._write, batch)
+        except Exception as ex:
+            # Nothing was committed; find the row(s) at fault by writing each
+            # in its own session.
+            log.error(f"Write-behind flush of {len(batch)} row(s) failed, retrying row by row: {ex}", None)
+            try:
+                written, failed, elapsed = await self._parent.executor.run(self._write_rows, batch)
+            except Exception as retry_ex:
+                written, failed, elapsed = {}, {key: retry_ex for key in batch}, 0.0
+            self._retry(dirty, failed)
+
+        for key in written:
+            self._attempts.pop(key, None)
+
+        return self._commit(written, elapsed)
+
+################################################################################
+    def _retry(self, dirty: Dict[RowKey, Dict[int, Any]], failed: Dict[RowKey, Exception]) -> None:
+        """Puts failed rows back for the next window, or drops them once they're out of attempts."""
+
+        for key, ex in failed.items():
+            model_class, identifiers = key
+            attempts = self._attempts.get(key, 0) + 1
+
+            if attempts >= self.MAX_ATTEMPTS:
+                self._attempts.pop(key, None)
+                self._dropped += 1
+                log.error(
+                    f"Dropping write-behind update to {model_class.__name__} {dict(identifiers)} "
+                    f"after {attempts} failed attempts: {ex}",
+                    None
+                )
+                continue
+
+            self._attempts[key] = attempts
+            self._dirty.setdefault(key, {}).update(dirty.get(key, {}))
+
+        if self._dirty:
+            self._schedule(write_through=False)
+
+################################################################################
+    async def close(self) -> None:
+        """
+        Flushes until nothing is pending, giving failed rows their remaining
+        attempts straight away, and stops any further scheduled flushes.
+        """
+
+        self._closed = True
+
+        for _ in range(self.MAX_ATTEMPTS):
+            if not self._dirty:
+                break
+            await self.flush()
+
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if self._dirty:
+            log.error(f"Closing with {len(self._dirty)} write-behind row(s) unwritten.", None)
+
+################################################################################
+    def _take_batch(self) -> Dict[RowKey, Dict[str, Any]]:
+
+        dirty, self._dirty = self._dirty, {}
+
+        # `to_dict()` reads live objects, so it has to run on the loop thread.
+        batch = {}
+        for key, objects in dirty.items():
+            model_class, _ = key
+
+            columns = model_class.__mapper__.column_attrs.keys()
+            data = {}
+            for obj in objects.values():
+                data.update({k: v for k, v in obj.to_dict().items() if k in columns})
+
+            snapshot = self._snapshots.get(key, {})
+            changed = {k: v for k, v in data.items() if k not in snapshot or snapshot[k] != v}
+            if changed:
+                # Copied so the worker never sees a list the loop is mutating.
+                batch[key] = copy.deepcopy(changed)
+
+        return batch
+
+################################################################################
+    def _write(self, batch: Dict[RowKey, Dict[str, Any]]) -> Tuple[Dict[RowKey, Dict[str, Any]], float]:
+
+        start = time.monotonic()
+        written = {}
+
+        if batch:
+            with self._parent._get_db() as db:
+                for key, changed in batch.items():
+                    model_class, identifiers = key
+
+                    count = (
+                        db.query(model_class)
+                        .filter_by(**dict(identifiers))
+                        .update(changed, synchronize_session=False)
+                    )
+                    if count == 0:
+                        log.warning(f"{model_class.__name__} not found with identifiers {dict(identifiers)}", None)
+                        continue
+
+                    written[key] = changed
+
+        return written, time.monotonic() - start
+
+################################################################################
+    def _write_rows(
+        self, batch: Dict[RowKey, Dict[str, Any]]
+    ) -> Tuple[Dict[RowKey, Dict[str, Any]], Dict[RowKey, Exception], float]:
+
+        start = time.monotonic()
+        written = {}
+        failed = {}
+
+        for key, changed in batch.items():
+            try:
+                row, _ = self._write({key: changed})
+            except Exception as ex:
+                failed[key] = ex
+                continue
+            written.update(row)
+
+        return written, failed, time.monotonic() - start
+
+################################################################################
+    def _commit(self, written: Dict[RowKey, Dict[str, Any]], elapsed: float) -> int:
+
+        if not written:
+            return 0
+
+        for key, changed in written.items():
+            self._snapshots.setdefault(key, {}).update(copy.deepcopy(changed))
+
+        self._flushes += 1
+        self._rows_flushed += len(written)
+        self._last_rows = len(written)
+        self._last_latency = elapsed
+        self._max_latency = max(self._max_latency, elapsed)
+        self._total_latency += elapsed
+
+        return len(written)
+
+################################################################################
@@ -0,0 +1,232 @@
+"""
+Compares peak RSS and wall time of the startup load paths.
+
+`legacy` eager-loads everything through `TopLevelDataModel`, validates it into
+`MasterResponseSchema` and dumps one nested dict (the previous loader).
+`stream` consumes the per-manager chunk streams of `Database.load_all()` in
+parallel. Both keep every row alive at the end, as the managers would.
+
+Build a fixture in an empty PostgreSQL database, then measure each path in a
+fresh process so peak RSS isn't shared:
+
+    python -m Database._benchmark_load --url postgresql://... --generate 20000
+    python -m Database._benchmark_load --url postgresql://...
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import selectinload
+
+from .Models import *
+from .Schemas import *
+################################################################################
+
+BATCH = 1000
+
+################################################################################
+def generate(url: str, count: int) -> None:
+
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    now = datetime.utcnow()
+    rng = random.Random(1)
+
+    def batches(rows: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        return [rows[i:i + BATCH] for i in range(0, len(rows), BATCH)]
+
+    def write(conn, model, rows: List[Dict[str, Any]]) -> None:
+        for batch in batches(rows):
+            conn.execute(insert(model), batch)
+
+    with engine.begin() as conn:
+        conn.execute(insert(TopLevelDataModel), [{"id": 1}])
+
+        write(conn, VenueModel, [
+            {
+                "id": i, "xiv_id": f"xiv{i:08d}", "name": f"Venue {i}",
+                "description": ["Lorem ipsum dolor sit amet."] * 4,
+                "tags": ["Bar", "Nightclub", "Casino"], "user_ids": [10_000 + i],
+                "position_ids": [1, 2, 3], "data_center": rng.randint(0, 10),
+                "world": rng.randint(0, 80),
+            }
+            for i in range(1, count + 1)
+        ])
+        write(conn, VenueScheduleModel, [
+            {"venue_id": i, "day": d, "start_hour": 20, "start_minute": 0, "end_hour": 23, "end_minute": 0}
+            for i in range(1, count + 1) for d in range(3)
+        ])
+        write(conn, StaffProfileModel, [
+            {
+                "user_id": 10_000 + i, "name": f"Staff {i}", "jobs": ["Bartender", "Dancer"],
+                "position_ids": [1, 2], "training_ids": [], "pronouns": [0], "data_centers": [1],
+                "likes": ["Cats"] * 3, "dislikes": ["Dogs"] * 3, "muted_venue_ids": [],
+                "venue_tags": [], "about_me": "About me. " * 20,
+            }
+            for i in range(1, count + 1)
+        ])
+        write(conn, ProfileAvailabilityModel, [
+            {"profile_id": 10_000 + i, "day": d, "start_hour": 18, "start_minute": 0, "end_hour": 22, "end_minute": 0}
+            for i in range(1, count + 1) for d in range(4)
+        ])
+        write(conn, ProfileAdditionalImageModel, [
+            {"profile_id": 10_000 + i, "url": f"https://example.com/{i}.png", "caption": None}
+            for i in range(1, count + 1)
+        ])
+        write(conn, BGCheckModel, [
+            {"id": i, "user_id": 10_000 + i, "agree": True, "names": [f"Staff {i}"], "approved": True}
+            for i in range(1, count + 1)
+        ])
+        write(conn, BGCheckVenueModel, [
+            {"bg_check_id": i, "name": "Somewhere", "data_center": 1, "world": 2, "jobs": ["Bartender"]}
+            for i in range(1, count + 1) for _ in range(2)
+        ])
+        write(conn, DJProfileModel, [
+            {"user_id": 10_000 + i, "name": f"DJ {i}", "genres": [1, 2], "regions": [0], "links": []}
+            for i in range(1, count // 4 + 1)
+        ])
+        write(conn, DJProfileAvailabilityModel, [
+            {"profile_id": 10_000 + i, "day": d, "start_hour": 20, "start_minute": 0, "end_hour": 23, "end_minute": 0}
+            for i in range(1, count // 4 + 1) for d in range(2)
+        ])
+        write(conn, TemporaryJobPostingModel, [
+            {
+                "venue_id": rng.randint(1, count), "user_id": 10_000 + i, "description": "Help!",
+                "position_id": 1, "start_dt": now, "end_dt": now + timedelta(hours=3), "genres": [],
+            }
+            for i in range(1, count // 2 + 1)
+        ])
+        write(conn, PermanentJobPostingModel, [
+            {"venue_id": rng.randint(1, count), "user_id": 10_000 + i, "description": "Hiring!", "position_id": 2}
+            for i in range(1, count // 2 + 1)
+        ])
+        write(conn, ServiceRequestModel, [
+            {"user_id": 10_000 + i, "service": 1, "message_urls": []}
+            for i in range(1, count // 4 + 1)
+        ])
+
+    print(f"Generated fixture with {count} venues/profiles.")
+
+################################################################################
+def _load_legacy(db) -> Dict[str, Any]:
+
+    with db._get_db() as session:
+        top_level = session.query(TopLevelDataModel).options(
+            selectinload(TopLevelDataModel.venues).selectinload(VenueModel.schedules),
+            selectinload(TopLevelDataModel.venues).selectinload(VenueModel.special_events),
+            selectinload(TopLevelDataModel.bg_checks).selectinload(BGCheckModel.venues),
+            selectinload(TopLevelDataModel.profiles).selectinload(StaffProfileModel.additional_images),
+            selectinload(TopLevelDataModel.profiles).selectinload(StaffProfileModel.availability),
+            selectinload(TopLevelDataModel.temporary_jobs),
+            selectinload(TopLevelDataModel.permanent_jobs),
+            selectinload(TopLevelDataModel.dj_profiles),
+        ).first()
+
+        return MasterResponseSchema(
+            channel_manager=ChannelManagerSchema.model_validate(top_level),
+            role_manager=RoleManagerSchema.model_validate(top_level),
+            venue_manager=VenueManagerSchema(venues=[VenueSchema.model_validate(v) for v in top_level.venues]),
+            bg_check_manager=BGCheckManagerSchema(
+                bg_check_channel_id=top_level.bg_check_channel_id,
+                staff_role_id=top_level.staff_role_id,
+                staff_pending_role_id=top_level.staff_pending_role_id,
+                bg_checks=[BGCheckSchema.model_validate(bg) for bg in top_level.bg_checks]
+            ),
+            profile_manager=ProfileManagerSchema(
+                profiles=[StaffProfileSchema.model_validate(p) for p in top_level.profiles]
+            ),
+            jobs_manager=JobsManagerSchema(
+                temporary_jobs=[TemporaryJobPostingSchema.model_validate(j) for j in top_level.temporary_jobs],
+                permanent_jobs=[PermanentJobPostingSchema.model_validate(j) for j in top_level.permanent_jobs],
+                trainee_message=TraineeMessageSchema(post_url=top_level.trainee_message_url),
+            ),
+            dj_manager=DJManagerSchema(
+                profiles=[DJProfileSchema.model_validate(p) for p in top_level.dj_profiles]
+            ),
+            service_manager=ServiceRequestManagerSchema(
+                service_requests=[ServiceRequestSchema.model_validate(r) for r in top_level.service_requests],
+            )
+        ).model_dump()
+
+################################################################################
+async def _load_stream(db) -> Dict[str, List[Dict[str, Any]]]:
+
+    payload = await db.load_all()
+    kept: Dict[str, List[Dict[str, Any]]] = {}
+
+    async def consume(name: str, stream) -> None:
+        rows = kept.setdefault(name, [])
+        async for chunk in stream:
+            rows.extend(chunk)
+
+    await asyncio.gather(*(
+        consume(f"{manager}.{key}", value)
+        for manager, section in payload.items()
+        for key, value in section.items()
+        if hasattr(value, "__aiter__")
+    ))
+
+    return kept
+
+################################################################################
+def measure(url: str, mode: str) -> None:
+
+    from . import Database
+
+    os.environ["DEBUG"] = "True"
+    os.environ["DEVELOPMENT_DATABASE_URL"] = url
+    db = Database(None)  # type: ignore
+
+    start = time.perf_counter()
+    if mode == "legacy":
+        result = _load_legacy(db)
+        rows = sum(len(v) for section in result.values() for v in section.values() if isinstance(v, list))
+    else:
+        result = asyncio.run(_load_stream(db))
+        rows = sum(len(v) for v in result.values())
+    elapsed = time.perf_counter() - start
+
+    # ru_maxrss is KiB on Linux.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{mode:<8}{rows:>10}{elapsed:>10.2f}s{peak:>12.1f} MiB")
+
+################################################################################
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", required=True)
+    parser.add_argument("--generate", type=int, default=0)
+    parser.add_argument("--mode", choices=("legacy", "stream"), default=None)
+    args = parser.parse_args()
+
+    if args.generate:
+        generate(args.url, args.generate)
+        return
+
+    if args.mode:
+        measure(args.url, args.mode)
+        return
+
+    print(f"{'mode':<8}{'top rows':>10}{'wall':>11}{'peak RSS':>16}")
+    for mode in ("legacy", "stream"):
+        subprocess.run(
+            [sys.executable, "-m", "Database._benchmark_load", "--url", args.url, "--mode", mode],
+            check=True
+        )
+
+################################################################################
+if __name__ == "__main__":
+
+    main()
+
+################################################################################
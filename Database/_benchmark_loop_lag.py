@@ -0,0 +1,116 @@
+"""
+Measures event-loop lag while the bot is writing to the database.
+
+A ticker task asks to wake every `TICK` seconds and records how late it
+actually woke; meanwhile `--writes` concurrent writers each commit a row. The
+run is repeated with the writes executed inline on the loop (the old
+behaviour) and through `DatabaseExecutor` (the current behaviour).
+
+    python -m Database._benchmark_loop_lag [--writes 200] [--latency 0.005]
+    python -m Database._benchmark_loop_lag --url postgresql://...
+
+Without `--url` each write is simulated as a blocking call of `--latency`
+seconds; with it, each write runs ``SELECT 1`` in its own committed session.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Callable, Dict, List
+
+from .DatabaseExecutor import DatabaseExecutor
+################################################################################
+
+TICK = 0.01
+
+################################################################################
+async def _ticker(stop: asyncio.Event, lags: List[float]) -> None:
+
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - start - TICK)
+
+################################################################################
+async def _measure(write: Callable[[], None], writes: int, offload: bool) -> Dict[str, float]:
+
+    executor = DatabaseExecutor() if offload else None
+    lags: List[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_ticker(stop, lags))
+    await asyncio.sleep(TICK * 2)
+
+    async def writer() -> None:
+        if executor is not None:
+            await executor.run(write)
+        else:
+            write()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(writer() for _ in range(writes)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await ticker
+    if executor is not None:
+        executor.shutdown()
+
+    lags.sort()
+    return {
+        "wall": elapsed,
+        "ticks": len(lags),
+        "p50": statistics.median(lags) if lags else 0.0,
+        "p99": lags[min(len(lags) - 1, int(len(lags) * 0.99))] if lags else 0.0,
+        "max": lags[-1] if lags else 0.0,
+    }
+
+################################################################################
+def _make_writer(args: argparse.Namespace) -> Callable[[], None]:
+
+    if not args.url:
+        return lambda: time.sleep(args.latency)
+
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.orm import sessionmaker, scoped_session
+
+    engine = create_engine(args.url, pool_size=10, max_overflow=0)
+    session = scoped_session(sessionmaker(autocommit=False, autoflush=False, bind=engine))
+
+    def write() -> None:
+        db = session()
+        try:
+            db.execute(text("SELECT 1"))
+            db.commit()
+        finally:
+            db.close()
+
+    return write
+
+################################################################################
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--writes", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.005)
+    parser.add_argument("--url", default=None)
+    args = parser.parse_args()
+
+    write = _make_writer(args)
+
+    print(f"{args.writes} concurrent writes, ticker interval {TICK * 1000:.0f} ms")
+    print(f"{'mode':<10}{'wall':>10}{'ticks':>8}{'p50 lag':>12}{'p99 lag':>12}{'max lag':>12}")
+    for label, offload in (("inline", False), ("executor", True)):
+        r = asyncio.run(_measure(write, args.writes, offload))
+        print(
+            f"{label:<10}{r['wall'] * 1000:>8.1f}ms{r['ticks']:>8}"
+            f"{r['p50'] * 1000:>10.2f}ms{r['p99'] * 1000:>10.2f}ms{r['max'] * 1000:>10.2f}ms"
+        )
+
+################################################################################
+if __name__ == "__main__":
+
+    main()
+
+################################################################################
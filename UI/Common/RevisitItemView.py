@@ -83,7 +83,7 @@ class MoreTimeButton(FroggeButton):
         )
 
     async def callback(self, interaction: Interaction) -> None:
-        self.view.ctx.register_revisit_timer()
+        await self.view.ctx.register_revisit_timer()
         await self.view.stop()  # type: ignore
         await interaction.respond(
             "The job posting will be revisited later. You can close it or re-open it at that time.",
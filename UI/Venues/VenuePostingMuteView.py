@@ -39,8 +39,8 @@ class VenueMuteButton(Button):
         
     async def callback(self, interaction: Interaction):
         venue: Venue = self.view.venue
-        profile = interaction.client.profile_manager.get_profile(interaction.user.id)  # type: ignore
-        profile_flag = profile.mute_venue(venue)
+        profile = await interaction.client.profile_manager.get_profile(interaction.user.id)  # type: ignore
+        profile_flag = await profile.mute_venue(venue)
 
         confirm = Embed(
             title="Venue Mute Toggle",
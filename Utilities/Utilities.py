@@ -34,7 +34,7 @@ from .Colors import CustomColor
 from .ErrorMessage import ErrorMessage
 
 if TYPE_CHECKING:
-    from Classes import GuildData, StaffPartyBot
+    from Classes import GuildData, ImageUpload, StaffPartyBot
 ################################################################################
 
 __all__ = ("Utilities", )
@@ -581,7 +581,12 @@ class Utilities:
         interaction: Interaction,
         prompt: Embed,
         _method: DumpMethod = DumpMethod.Discord
-    ) -> Optional[str]:
+    ) -> Optional[ImageUpload]:
+        """
+        Prompts for an image and hands it to the bot's image ingestor. Returns
+        as soon as the image is accepted; the upload finishes in the background
+        and its URL arrives through the returned `ImageUpload`.
+        """
 
         if not prompt.footer:
             prompt.footer = EmbedFooter(text="Type 'cancel' to stop the operation.")
@@ -615,21 +620,34 @@ class Utilities:
             await interaction.respond(embed=embed)
             return None
 
-        image_url = None
+        image = None
         if message.content.lower() != "cancel":
-            intermediate = await interaction.respond("Processing image... Please wait...")
-            if _method == Utilities.DumpMethod.Discord:
+            attachment = message.attachments[0]
+            ingestor = interaction.client.image_ingestor  # type: ignore
+            if ingestor.too_large(attachment):
+                error = Utilities.make_error(
+                    title="Image Too Large",
+                    message=(
+                        f"That image is `{attachment.size / 1048576:.1f} MB`, but the "
+                        f"limit is `{ingestor.MAX_BYTES / 1048576:.0f} MB`."
+                    ),
+                    solution="Please upload a smaller or more compressed image."
+                )
+                await interaction.respond(embed=error, ephemeral=True)
+            else:
                 try:
-                    image_url = await interaction.client.dump_image(message.attachments[0])  # type: ignore
-                except NotFound:
+                    image = await ingestor.submit(attachment, _method)
+                except (NotFound, ValueError):
                     pass
-            else:
-                image_url = await interaction.client.dump_image_cloudinary(message.attachments[0])  # type: ignore
-
-            try:
-                await intermediate.delete()
-            except NotFound:
-                pass
+                else:
+                    await interaction.respond(
+                        "Image received! It'll show up as soon as it's finished uploading.",
+                        delete_after=10
+                    )
+                    image.on_failure(lambda: interaction.followup.send(
+                        "Sorry, your image couldn't be uploaded. Please try again.",
+                        ephemeral=True
+                    ))
 
         try:
             await message.delete()
@@ -644,7 +662,7 @@ class Utilities:
             except:
                 pass
         
-        return image_url
+        return image
     
 ################################################################################
     @staticmethod
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import atexit
+import json
 import logging
+import os
+import queue
 import sys
-from logging import Formatter, FileHandler, StreamHandler
-from typing import TYPE_CHECKING, Optional
+from datetime import datetime, timezone
+from logging import Formatter, StreamHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import TYPE_CHECKING, Dict, Optional
 
 if TYPE_CHECKING:
     from Classes import GuildData
@@ -29,62 +35,171 @@ class StreamDataFormatter(Formatter):
             datefmt="%m/%d/%y %H:%M:%S"
         )
 
+################################################################################
+class JSONFormatter(Formatter):
+    """One JSON object per line, for log shippers and `jq`."""
+
+    def format(self, record: logging.LogRecord) -> str:
+
+        data = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "line": record.lineno,
+        }
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            data["exception"] = record.exc_text
+
+        return json.dumps(data, ensure_ascii=False)
+
+################################################################################
+class _RecordQueueHandler(QueueHandler):
+    """
+    Queues records without pre-formatting them, so each handler on the
+    listener applies its own formatter. The exception is rendered to text
+    up front since traceback objects shouldn't outlive the calling frame.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+
+        if record.exc_info and record.exc_info[0] is not None:
+            record.exc_text = Formatter().formatException(record.exc_info)
+        record.exc_info = None
+
+        # Resolve %-style args here; they may not be safe to touch later.
+        record.msg = record.getMessage()
+        record.args = None
+
+        return record
+
 ################################################################################
 class _FroggeLog:
+    """
+    Log records are handed to a queue on the calling thread and written to
+    stdout, the text log and the JSON log by a background listener, so the
+    event loop never waits on I/O. Handlers are attached once per logger.
+    """
 
-    _FDF = FullDataFormatter()
-    _SDF = StreamDataFormatter()
+    LOG_FILE = "log.log"
+    JSON_FILE = "log.jsonl"
+    MAX_BYTES = 5 * 1024 * 1024
+    BACKUP_COUNT = 5
 
-    _FH = FileHandler("log.log", "w", encoding='utf-8')
-    _SH = StreamHandler(open(sys.stdout.fileno(), mode='w', encoding='utf-8', buffering=1))  # type: ignore
+    CORE_LOGGER = "StaffPartyBot-Core"
 
 ################################################################################
     def __init__(self):
-        
-        self._FH.setLevel(logging.DEBUG)
-        self._FH.setFormatter(self._FDF)
-        # self._SH.setLevel(logging.WARNING)
-        self._SH.setLevel(logging.DEBUG)
-        self._SH.setFormatter(self._SDF)
-    
-################################################################################    
+
+        log_dir = os.getenv("LOG_DIR", ".")
+
+        file_handler = self._rotating_handler(os.path.join(log_dir, self.LOG_FILE))
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(FullDataFormatter())
+
+        json_handler = self._rotating_handler(os.path.join(log_dir, self.JSON_FILE))
+        json_handler.setLevel(logging.DEBUG)
+        json_handler.setFormatter(JSONFormatter())
+
+        stream_handler = StreamHandler(sys.stdout)
+        # stream_handler.setLevel(logging.WARNING)
+        stream_handler.setLevel(logging.DEBUG)
+        stream_handler.setFormatter(StreamDataFormatter())
+
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._queue_handler: QueueHandler = _RecordQueueHandler(self._queue)
+        self._listener: QueueListener = QueueListener(
+            self._queue,
+            file_handler,
+            json_handler,
+            stream_handler,
+            respect_handler_level=True
+        )
+        self._listener.start()
+        self._running: bool = True
+        atexit.register(self.close)
+
+        self._loggers: Dict[str, logging.Logger] = {}
+
+################################################################################
+    def _rotating_handler(self, path: str) -> RotatingFileHandler:
+
+        handler = RotatingFileHandler(
+            path,
+            maxBytes=self.MAX_BYTES,
+            backupCount=self.BACKUP_COUNT,
+            encoding="utf-8",
+            delay=True
+        )
+        # Each run starts a fresh file; previous runs are kept as backups.
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            handler.doRollover()
+
+        return handler
+
+################################################################################
+    def close(self) -> None:
+        """Stops the listener after it has written everything still queued."""
+
+        if self._running:
+            self._running = False
+            self._listener.stop()
+            for handler in self._listener.handlers:
+                handler.close()
+
+################################################################################
+    def get_logger(self, guild: Optional[GuildData]) -> logging.Logger:
+
+        name = guild.parent.name if guild else self.CORE_LOGGER
+
+        logger = self._loggers.get(name)
+        if logger is None:
+            logger = logging.getLogger(name)
+            logger.setLevel(logging.DEBUG)
+            logger.addHandler(self._queue_handler)
+            # Our handlers are the only ones that should see these records.
+            logger.propagate = False
+            self._loggers[name] = logger
+
+        return logger
+
+################################################################################
     def _log(self, guild: Optional[GuildData], level: int, message: str) -> None:
 
-        logger = logging.getLogger(guild.parent.name if guild else "StaffPartyBot-Core")
-        logger.setLevel(level)
-        logger.addHandler(self._FH)
-        logger.addHandler(self._SH)
-        
         try:
-            logger.log(level, message, exc_info=level >= logging.CRITICAL)
+            # stacklevel points module/line at whoever called debug()/info()/etc.
+            self.get_logger(guild).log(level, message, exc_info=level >= logging.CRITICAL, stacklevel=3)
         except Exception as e:
             print(e)
-    
+
 ################################################################################
     def debug(self, message: str, guild: Optional[GuildData]) -> None:
-        
+
         self._log(guild, logging.DEBUG, message)
-        
+
 ################################################################################
     def info(self, message: str, guild: Optional[GuildData]) -> None:
-        
+
         self._log(guild, logging.INFO, message)
-        
+
 ################################################################################
     def warning(self, message: str, guild: Optional[GuildData]) -> None:
-        
+
         self._log(guild, logging.WARNING, message)
-        
+
 ################################################################################
     def error(self, message: str, guild: Optional[GuildData]) -> None:
-        
+
         self._log(guild, logging.ERROR, message)
-        
+
 ################################################################################
     def critical(self, message: str, guild: Optional[GuildData]) -> None:
-        
+
         self._log(guild, logging.CRITICAL, message)
-        
+
 ################################################################################
 
 log = _FroggeLog()